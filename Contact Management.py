@@ -7,23 +7,439 @@ Author: Professional Software Developer
 Date: January 30, 2026
 """
 
+import argparse
+import asyncio
+import errno
 import json
+import mmap
 import os
+import random
 import re
+import signal
+import socket
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Mapping, MutableMapping
 
 
 # Global constant for the contacts file
 CONTACTS_FILE = "contacts.json"
 
+# Binary snapshot format (see ContactSnapshot): header with the record
+# count, the offsets of the two index tables and the largest numeric ID
+SNAPSHOT_MAGIC = b'CSNP1\0'
+SNAPSHOT_HEADER = struct.Struct('<6s2xQQQQ')
+SNAPSHOT_FIELDS = ('name', 'phone', 'email')
+_UINT32 = struct.Struct('<I')
+_UINT64 = struct.Struct('<Q')
+
+
+def snapshot_path():
+    """Return the path of the binary snapshot kept next to CONTACTS_FILE."""
+    return os.path.splitext(CONTACTS_FILE)[0] + ".snap"
+
+
+def journal_path():
+    """Return the path of the contacts service's change journal."""
+    return os.path.splitext(CONTACTS_FILE)[0] + ".journal"
+
+
+def replay_journal(contacts, path):
+    """
+    Apply the changes the contacts service journaled since it last
+    rewrote the snapshot.
+    
+    Each line holds the new state of one contact ({"id": ..., "contact":
+    {...}}, or null for a deleted contact), so replaying a line twice is
+    harmless.
+    
+    Args:
+        contacts (dict): Contacts loaded from the snapshot
+        path (str): Journal file
+    
+    Returns:
+        int: Number of changes applied
+    """
+    applied = 0
+    with open(path, 'rb') as file:
+        for line in file:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break  # last line cut short by a crash
+            if entry['contact'] is None:
+                contacts.pop(entry['id'], None)
+            else:
+                contacts[entry['id']] = entry['contact']
+            applied += 1
+    return applied
+
+
+def encode_contact_record(contact_id, contact):
+    """
+    Encode one contact as a snapshot record.
+    
+    A record is its total length followed by the ID and the fields in
+    SNAPSHOT_FIELDS, each as a length-prefixed UTF-8 string.
+    
+    Args:
+        contact_id (str): Contact ID
+        contact (dict): Contact with 'name', 'phone' and 'email'
+    
+    Returns:
+        bytes: The encoded record
+    """
+    parts = []
+    for value in (contact_id,) + tuple(contact.get(field, "") for field in SNAPSHOT_FIELDS):
+        # Text that cannot be stored as UTF-8 (lone surrogates from an old
+        # contacts.json) is replaced rather than making the snapshot unwritable
+        data = value.encode('utf-8', 'replace')
+        parts.append(_UINT32.pack(len(data)))
+        parts.append(data)
+    body = b"".join(parts)
+    return _UINT32.pack(len(body)) + body
+
+
+class ContactSnapshot(MutableMapping):
+    """
+    Contacts dictionary backed by a memory-mapped snapshot file.
+    
+    Layout: header, records in insertion order, a table with the offset
+    of every record, and a table of record numbers sorted by ID. Opening
+    the file only reads the header, so startup does not depend on the
+    number of contacts. Looking up an ID is a binary search over the
+    sorted table that touches about log2(n) records, and iterating
+    decodes one record at a time.
+    
+    Changes are kept in memory until write_snapshot() rewrites the file.
+    Contacts read by ID are cached so they can be edited in place, like
+    the values of a normal dictionary.
+    """
+    
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Snapshot file written by write_snapshot()
+        
+        Raises:
+            ValueError: If the file is not a contacts snapshot
+        """
+        self.path = path
+        self._map = None
+        self._open()
+    
+    def _open(self):
+        """Map the file and forget all in-memory changes."""
+        with open(self.path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if len(self._map) < SNAPSHOT_HEADER.size:
+            self.close()
+            raise ValueError(f"{self.path} is not a contacts snapshot")
+        magic, count, order_offset, lookup_offset, largest_id = SNAPSHOT_HEADER.unpack_from(self._map, 0)
+        if magic != SNAPSHOT_MAGIC or lookup_offset + 4 * count > len(self._map):
+            self.close()
+            raise ValueError(f"{self.path} is not a contacts snapshot")
+        
+        self._count = count
+        self._order_offset = order_offset
+        self._lookup_offset = lookup_offset
+        self._largest_id = largest_id
+        self._length = count
+        self._loaded = {}    # ID -> contact read by ID, edited or added
+        self._added = {}     # IDs not in the file, in insertion order
+        self._deleted = set()
+        self._search_text = None  # built by find() on first use
+    
+    def close(self):
+        """Unmap the snapshot file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+    
+    def _record_offset(self, number):
+        return _UINT64.unpack_from(self._map, self._order_offset + 8 * number)[0]
+    
+    def _record_id(self, number):
+        """Return the raw ID bytes of a record without decoding the rest."""
+        offset = self._record_offset(number) + 4
+        length = _UINT32.unpack_from(self._map, offset)[0]
+        return self._map[offset + 4:offset + 4 + length]
+    
+    def _decode(self, number):
+        """Decode a record into (contact_id, contact)."""
+        offset = self._record_offset(number) + 4
+        values = []
+        for _ in range(len(SNAPSHOT_FIELDS) + 1):
+            length = _UINT32.unpack_from(self._map, offset)[0]
+            values.append(self._map[offset + 4:offset + 4 + length].decode('utf-8'))
+            offset += 4 + length
+        return values[0], dict(zip(SNAPSHOT_FIELDS, values[1:]))
+    
+    def _find(self, contact_id):
+        """Binary search the sorted table; return the record number or None."""
+        key = contact_id.encode('utf-8')
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            number = _UINT32.unpack_from(self._map, self._lookup_offset + 4 * middle)[0]
+            if self._record_id(number) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count:
+            number = _UINT32.unpack_from(self._map, self._lookup_offset + 4 * low)[0]
+            if self._record_id(number) == key:
+                return number
+        return None
+    
+    def __contains__(self, contact_id):
+        if contact_id in self._loaded:
+            return True
+        if contact_id in self._deleted or not isinstance(contact_id, str):
+            return False
+        return self._find(contact_id) is not None
+    
+    def __getitem__(self, contact_id):
+        contact = self._loaded.get(contact_id)
+        if contact is not None:
+            return contact
+        if contact_id in self._deleted or not isinstance(contact_id, str):
+            raise KeyError(contact_id)
+        number = self._find(contact_id)
+        if number is None:
+            raise KeyError(contact_id)
+        contact = self._loaded[contact_id] = self._decode(number)[1]
+        return contact
+    
+    def __setitem__(self, contact_id, contact):
+        if contact_id not in self:
+            self._length += 1
+            if contact_id in self._deleted:
+                self._deleted.discard(contact_id)
+            else:
+                self._added[contact_id] = None
+        self._loaded[contact_id] = contact
+    
+    def __delitem__(self, contact_id):
+        if contact_id not in self:
+            raise KeyError(contact_id)
+        self._loaded.pop(contact_id, None)
+        if contact_id in self._added:
+            del self._added[contact_id]
+        else:
+            self._deleted.add(contact_id)
+        self._length -= 1
+    
+    def __len__(self):
+        return self._length
+    
+    def __iter__(self):
+        for number in range(self._count):
+            contact_id = self._record_id(number).decode('utf-8')
+            if contact_id not in self._deleted:
+                yield contact_id
+        yield from list(self._added)
+    
+    def items(self):
+        """Iterate (contact_id, contact) pairs, decoding one record at a time."""
+        for number in range(self._count):
+            contact_id, contact = self._decode(number)
+            if contact_id in self._deleted:
+                continue
+            yield contact_id, self._loaded.get(contact_id, contact)
+        for contact_id in list(self._added):
+            yield contact_id, self._loaded[contact_id]
+    
+    def values(self):
+        """Iterate the contacts, decoding one record at a time."""
+        for _, contact in self.items():
+            yield contact
+    
+    def find(self, query):
+        """
+        Return the contacts whose name, phone or email contains `query`
+        (lowercase), like find_contacts() does for a dictionary.
+        
+        The first search decodes the file once into a search text: the
+        lowercased name, the phone and the lowercased email of every
+        record, one record after another. Each search is then a str.find()
+        pass over that text, and only the records it hits are decoded and
+        checked. Contacts changed or added since the file was written are
+        checked as they are in memory.
+        
+        Args:
+            query (str): Lowercase search text
+        
+        Returns:
+            dict: Matching contacts by ID, in iteration order
+        """
+        if self._search_text is None:
+            parts = []
+            starts = array('Q')
+            position = 0
+            for number in range(self._count):
+                contact = self._decode(number)[1]
+                part = f"{contact['name'].lower()}\0{contact['phone']}\0{contact['email'].lower()}\n"
+                starts.append(position)
+                parts.append(part)
+                position += len(part)
+            self._search_text = ("".join(parts), starts)
+        text, starts = self._search_text
+        
+        # Record numbers with a hit; a hit may span two fields, so each one
+        # is checked again on the decoded record
+        numbers = []
+        position = text.find(query)
+        while position != -1:
+            number = bisect_right(starts, position) - 1
+            numbers.append(number)
+            if number + 1 >= self._count:
+                break
+            position = text.find(query, starts[number + 1])
+        
+        # Contacts edited in memory are checked as they are now
+        edited = [self._find(contact_id) for contact_id, contact in self._loaded.items()
+                  if contact_id not in self._added and contact_matches(contact, query)]
+        if edited:
+            numbers = sorted(set(numbers).union(edited))
+        
+        found_contacts = {}
+        for number in numbers:
+            contact_id, contact = self._decode(number)
+            if contact_id in self._deleted:
+                continue
+            contact = self._loaded.get(contact_id, contact)
+            if contact_matches(contact, query):
+                found_contacts[contact_id] = contact
+        for contact_id in self._added:
+            if contact_matches(self._loaded[contact_id], query):
+                found_contacts[contact_id] = self._loaded[contact_id]
+        return found_contacts
+    
+    def largest_id(self):
+        """Return the largest numeric contact ID ever stored (0 if none)."""
+        largest = self._largest_id
+        for contact_id in self._added:
+            if contact_id.isdigit():
+                largest = max(largest, int(contact_id))
+        return largest
+    
+    def encoded_records(self):
+        """
+        Iterate (contact_id, record) pairs for write_snapshot().
+        
+        Records that were not changed are copied from the file as they
+        are, without decoding them.
+        """
+        for number in range(self._count):
+            contact_id = self._record_id(number).decode('utf-8')
+            if contact_id in self._deleted:
+                continue
+            if contact_id in self._loaded:
+                yield contact_id, encode_contact_record(contact_id, self._loaded[contact_id])
+            else:
+                offset = self._record_offset(number)
+                length = _UINT32.unpack_from(self._map, offset)[0]
+                yield contact_id, self._map[offset:offset + 4 + length]
+        for contact_id in list(self._added):
+            yield contact_id, encode_contact_record(contact_id, self._loaded[contact_id])
+
+
+def write_snapshot(contacts, path):
+    """
+    Write contacts to a binary snapshot file (see ContactSnapshot).
+    
+    The file is written next to the target and renamed over it, so a
+    crash never leaves a half-written snapshot. When `contacts` is the
+    ContactSnapshot of the same file it is re-opened on the new file.
+    
+    Args:
+        contacts (dict or ContactSnapshot): Contacts to write
+        path (str): Snapshot file path
+    """
+    if isinstance(contacts, ContactSnapshot):
+        records = contacts.encoded_records()
+    else:
+        records = ((contact_id, encode_contact_record(contact_id, contact))
+                   for contact_id, contact in contacts.items())
+    
+    offsets = array('Q')
+    ids = []
+    largest_id = contacts.largest_id() if isinstance(contacts, ContactSnapshot) else 0
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(bytes(SNAPSHOT_HEADER.size))
+        position = SNAPSHOT_HEADER.size
+        for contact_id, record in records:
+            offsets.append(position)
+            ids.append(contact_id.encode('utf-8'))
+            if contact_id.isdigit():
+                largest_id = max(largest_id, int(contact_id))
+            file.write(record)
+            position += len(record)
+        
+        # Index tables: record offsets, then record numbers sorted by ID
+        padding = -position % 8
+        file.write(bytes(padding))
+        order_offset = position + padding
+        lookup = array('I', sorted(range(len(ids)), key=ids.__getitem__))
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+            lookup.byteswap()
+        file.write(offsets.tobytes())
+        lookup_offset = order_offset + 8 * len(offsets)
+        file.write(lookup.tobytes())
+        
+        file.seek(0)
+        file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, len(ids), order_offset,
+                                        lookup_offset, largest_id))
+    
+    reopen = isinstance(contacts, ContactSnapshot) and os.path.abspath(contacts.path) == os.path.abspath(path)
+    if reopen:
+        contacts.close()
+    os.replace(temp_path, path)
+    if reopen:
+        contacts._open()
+
 
 def load_contacts():
     """
-    Load contacts from the JSON file.
-    If the file doesn't exist, return an empty dictionary.
+    Load contacts from the binary snapshot, or from the JSON file when
+    there is no snapshot yet (or the JSON file was changed after it),
+    then apply the changes journaled by the contacts service.
+    If neither file exists, return an empty dictionary.
     
     Returns:
-        dict: Dictionary containing all contacts with ID as key
+        dict: Dictionary containing all contacts with ID as key (a
+            ContactSnapshot when loaded from the snapshot)
     """
+    contacts = _load_contacts_file()
+    
+    # Changes saved by the contacts service since its last snapshot
+    if os.path.exists(journal_path()):
+        try:
+            replay_journal(contacts, journal_path())
+        except (OSError, KeyError, TypeError) as e:
+            print(f"⚠️  Warning: Could not apply the contacts journal ({e}).")
+    
+    return contacts
+
+
+def _load_contacts_file():
+    # The snapshot is opened without reading the records
+    snapshot = snapshot_path()
+    if os.path.exists(snapshot) and (not os.path.exists(CONTACTS_FILE) or
+                                     os.path.getmtime(snapshot) >= os.path.getmtime(CONTACTS_FILE)):
+        try:
+            return ContactSnapshot(snapshot)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Warning: Could not open contacts snapshot ({e}). Trying {CONTACTS_FILE}.")
+    
     # Check if the contacts file exists
     if os.path.exists(CONTACTS_FILE):
         try:
@@ -44,9 +460,53 @@ def load_contacts():
         return {}
 
 
+def retire_json_file():
+    """
+    Move a contacts.json that the snapshot has replaced out of the way.
+    
+    Contacts are stored in the snapshot from the first save on. The JSON
+    file is renamed to a .bak copy (with a notice) rather than left behind
+    looking current; export_contacts_json() writes JSON on request.
+    """
+    if not os.path.exists(CONTACTS_FILE):
+        return
+    backup = CONTACTS_FILE + ".bak"
+    try:
+        os.replace(CONTACTS_FILE, backup)
+        print(f"📦 Contacts are now stored in '{snapshot_path()}'. The old "
+              f"'{CONTACTS_FILE}' was kept as '{backup}' (use --export-json to write JSON).")
+    except OSError as e:
+        print(f"⚠️  Warning: Could not rename {CONTACTS_FILE}: {e}")
+
+
+def export_contacts_json(contacts, path):
+    """
+    Write contacts to a JSON file in the original contacts.json format.
+    
+    Args:
+        contacts (dict): Contacts (a dictionary, snapshot or service client)
+        path (str): Output file
+    
+    Returns:
+        bool: True if the export was successful, False otherwise
+    """
+    try:
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w') as file:
+            json.dump(dict(contacts.items()), file, indent=4)
+        os.replace(temp_path, path)
+        return True
+    except Exception as e:
+        print(f"❌ Error exporting contacts: {e}")
+        return False
+
+
 def save_contacts(contacts):
     """
-    Save contacts to the JSON file for persistent storage.
+    Save contacts to the binary snapshot for persistent storage.
+    
+    The first save migrates from contacts.json: the JSON file is renamed
+    to contacts.json.bak (see retire_json_file).
     
     Args:
         contacts (dict): Dictionary containing all contacts
@@ -54,10 +514,16 @@ def save_contacts(contacts):
     Returns:
         bool: True if save was successful, False otherwise
     """
+    # The contacts service saves every change itself
+    if isinstance(contacts, ContactsClient):
+        return True
+    
     try:
-        # Write contacts to file with proper formatting
-        with open(CONTACTS_FILE, 'w') as file:
-            json.dump(contacts, file, indent=4)
+        write_snapshot(contacts, snapshot_path())
+        # The snapshot now includes everything the journal held
+        if os.path.exists(journal_path()):
+            os.remove(journal_path())
+        retire_json_file()
         return True
     except Exception as e:
         # Handle file writing errors
@@ -119,11 +585,511 @@ def generate_contact_id(contacts):
     if not contacts:
         return "1"
     
+    # A snapshot knows its largest ID without reading every record
+    if isinstance(contacts, ContactSnapshot):
+        return str(contacts.largest_id() + 1)
+    
     # Find the maximum ID and increment it
     max_id = max([int(id) for id in contacts.keys()])
     return str(max_id + 1)
 
 
+def edit_distance(first, second):
+    """
+    Calculate the edit distance between two strings.
+    
+    Insertions, deletions, substitutions and swaps of two neighbouring
+    letters each count as one edit, so "jonh" is one edit away from "john"
+    (the optimal string alignment variant of Damerau-Levenshtein distance).
+    
+    Args:
+        first (str): First string
+        second (str): Second string
+    
+    Returns:
+        int: Number of single-character edits
+    """
+    if first == second:
+        return 0
+    if not first or not second:
+        return len(first) + len(second)
+    
+    # Dynamic programme keeping only the last two rows
+    before_previous = None
+    previous = list(range(len(second) + 1))
+    for i in range(1, len(first) + 1):
+        current = [i] + [0] * len(second)
+        first_char = first[i - 1]
+        for j in range(1, len(second) + 1):
+            second_char = second[j - 1]
+            cost = 0 if first_char == second_char else 1
+            best = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (i > 1 and j > 1 and first_char == second[j - 2]
+                    and first[i - 2] == second_char):
+                best = min(best, before_previous[j - 2] + 1)
+            current[j] = best
+        before_previous, previous = previous, current
+    
+    return previous[-1]
+
+
+class DeletionIndex:
+    """
+    SymSpell-style index for finding words within a small edit distance.
+    
+    Every indexed word is stored under all the strings that can be made by
+    deleting up to max_distance of its letters. Two words within that edit
+    distance always share such a deletion, so a search only has to look up
+    the deletions of the query (a few dozen dictionary lookups) and check
+    the candidates it finds, instead of comparing against every word.
+    """
+    
+    def __init__(self, max_distance=2):
+        """
+        Args:
+            max_distance (int): Largest edit distance searches may ask for
+        """
+        self.max_distance = max_distance
+        self.words = {}
+        self.deletions = {}
+    
+    def _deletions(self, word, max_distance):
+        """Return the word and every string reachable by deleting letters."""
+        variants = {word}
+        current = {word}
+        for _ in range(max_distance):
+            current = {variant[:i] + variant[i + 1:]
+                       for variant in current for i in range(len(variant))}
+            variants |= current
+        return variants
+    
+    def add(self, word, contact_id):
+        """
+        Add a word for a contact (the word is indexed once for all contacts).
+        
+        Args:
+            word (str): Normalized token
+            contact_id (str): ID of the contact containing the token
+        """
+        contact_ids = self.words.get(word)
+        if contact_ids is None:
+            contact_ids = self.words[word] = set()
+            for variant in self._deletions(word, self.max_distance):
+                self.deletions.setdefault(variant, set()).add(word)
+        contact_ids.add(contact_id)
+    
+    def remove(self, word, contact_id):
+        """Remove a contact from a word, dropping words no contact uses."""
+        contact_ids = self.words.get(word)
+        if contact_ids is None:
+            return
+        contact_ids.discard(contact_id)
+        if contact_ids:
+            return
+        
+        del self.words[word]
+        for variant in self._deletions(word, self.max_distance):
+            words = self.deletions.get(variant)
+            if words is not None:
+                words.discard(word)
+                if not words:
+                    del self.deletions[variant]
+    
+    def search(self, word, max_distance):
+        """
+        Find all indexed words within max_distance of the given word.
+        
+        Args:
+            word (str): Normalized query token
+            max_distance (int): Largest edit distance to accept (capped at
+                the index's own max_distance)
+        
+        Returns:
+            list: (distance, word, contact_ids) tuples, closest first
+        """
+        max_distance = min(max_distance, self.max_distance)
+        
+        candidates = set()
+        for variant in self._deletions(word, max_distance):
+            candidates.update(self.deletions.get(variant, ()))
+        
+        matches = []
+        for candidate in candidates:
+            if abs(len(candidate) - len(word)) > max_distance:
+                continue
+            distance = edit_distance(word, candidate)
+            if distance <= max_distance:
+                matches.append((distance, candidate, self.words[candidate]))
+        
+        matches.sort(key=lambda match: (match[0], match[1]))
+        return matches
+
+
+def search_tokens(text):
+    """
+    Split text into the lowercase words used for fuzzy search.
+    
+    Only runs of letters are kept: numbers (phone digits, the "42" in
+    "john42@...") are better served by the exact substring search.
+    
+    Args:
+        text (str): Name, email address or search query
+    
+    Returns:
+        list: Lowercase words
+    """
+    return re.findall(r'[^\W\d_]+', text.lower())
+
+
+def contact_tokens(contact):
+    """
+    Collect the words of a contact's name and email address.
+    
+    Args:
+        contact (dict): Contact with 'name' and 'email'
+    
+    Returns:
+        set: Lowercase words to index for fuzzy search
+    """
+    local_part = contact['email'].split('@')[0]
+    return set(search_tokens(contact['name'])) | set(search_tokens(local_part))
+
+
+def completion_keys(contact):
+    """
+    Collect the strings a contact can be completed from.
+    
+    The full name, the name from each later word on (so "smi" finds
+    "John Smith") and the email address, all lowercase with runs of
+    whitespace collapsed.
+    
+    Args:
+        contact (dict): Contact with 'name' and 'email'
+    
+    Returns:
+        set: Lowercase completion keys
+    """
+    words = contact['name'].lower().split()
+    keys = {" ".join(words[start:]) for start in range(len(words))}
+    keys.add(contact['email'].strip().lower())
+    keys.discard("")
+    return keys
+
+
+class PrefixIndex:
+    """
+    Sorted array of completion keys answering prefix lookups with bisect.
+    
+    All keys starting with a prefix sit next to each other in sorted order,
+    so one binary search finds the first of them and the top K completions
+    are the K entries that follow: O(len(prefix) * log n + K) per lookup.
+    Two parallel lists are used instead of a list of tuples so each entry
+    costs one key string plus two list slots; the contact IDs are the
+    strings already held by the contacts dictionary, and repeated name keys
+    are interned so contacts sharing a name share one string.
+    """
+    
+    def __init__(self):
+        self.keys = []
+        self.contact_ids = []
+    
+    def build(self, entries):
+        """
+        Replace the index with the given (key, contact_id) pairs.
+        
+        Sorting once is much faster than inserting entries one by one.
+        """
+        entries = sorted((sys.intern(key), contact_id) for key, contact_id in entries)
+        self.keys = [key for key, _ in entries]
+        self.contact_ids = [contact_id for _, contact_id in entries]
+    
+    def add(self, key, contact_id):
+        """Insert a key for a contact, keeping the arrays sorted."""
+        position = bisect_right(self.keys, key)
+        self.keys.insert(position, sys.intern(key))
+        self.contact_ids.insert(position, contact_id)
+    
+    def remove(self, key, contact_id):
+        """Remove a key of a contact (other contacts with the key stay)."""
+        position = bisect_left(self.keys, key)
+        end = bisect_right(self.keys, key, position)
+        for index in range(position, end):
+            if self.contact_ids[index] == contact_id:
+                del self.keys[index]
+                del self.contact_ids[index]
+                return
+    
+    def complete(self, prefix, limit=10):
+        """
+        Find the contacts with a key starting with the prefix.
+        
+        Args:
+            prefix (str): Normalized prefix
+            limit (int): Maximum number of contacts to return
+        
+        Returns:
+            list: (key, contact_id) pairs in key order, one per contact
+        """
+        keys = self.keys
+        position = bisect_left(keys, prefix)
+        seen = set()
+        completions = []
+        while position < len(keys) and len(completions) < limit:
+            key = keys[position]
+            if not key.startswith(prefix):
+                break
+            contact_id = self.contact_ids[position]
+            # A contact has a few keys, so skipping repeats keeps this O(K)
+            if contact_id not in seen:
+                seen.add(contact_id)
+                completions.append((key, contact_id))
+            position += 1
+        return completions
+
+
+class ContactSearchIndex:
+    """
+    Fuzzy search and autocomplete index over contact names and emails.
+    
+    Each part is built from the contacts dictionary the first time it is
+    used (so startup is not slowed down) and from then on kept current by
+    add_contact, edit_contact and delete_contact, so it never has to be
+    rebuilt while the program runs.
+    """
+    
+    def __init__(self, contacts=None):
+        """
+        Args:
+            contacts (dict): The live contacts dictionary to index
+        """
+        self.contacts = contacts if contacts is not None else {}
+        self.words = None
+        self.prefixes = None
+    
+    def _ensure_built(self):
+        """Index every contact the first time the index is needed."""
+        if self.words is None:
+            self.words = DeletionIndex(max_distance=2)
+            for contact_id, contact_info in self.contacts.items():
+                for token in contact_tokens(contact_info):
+                    self.words.add(token, contact_id)
+    
+    def _ensure_prefixes_built(self):
+        """Build the autocomplete index the first time it is needed."""
+        if self.prefixes is None:
+            self.prefixes = PrefixIndex()
+            self.prefixes.build((key, contact_id)
+                                for contact_id, contact_info in self.contacts.items()
+                                for key in completion_keys(contact_info))
+    
+    def add(self, contact_id, contact_info):
+        """Index a new contact."""
+        # Parts that are not built yet pick the contact up when they are
+        if self.words is not None:
+            for token in contact_tokens(contact_info):
+                self.words.add(token, contact_id)
+        if self.prefixes is not None:
+            for key in completion_keys(contact_info):
+                self.prefixes.add(key, contact_id)
+    
+    def remove(self, contact_id, contact_info):
+        """Stop returning a contact (call with its indexed values)."""
+        if self.words is not None:
+            for token in contact_tokens(contact_info):
+                self.words.remove(token, contact_id)
+        if self.prefixes is not None:
+            for key in completion_keys(contact_info):
+                self.prefixes.remove(key, contact_id)
+    
+    def update(self, contact_id, old_info, new_info):
+        """Re-index a contact after it was edited."""
+        self.remove(contact_id, old_info)
+        self.add(contact_id, new_info)
+    
+    def search(self, query, max_distance=None):
+        """
+        Find contacts whose tokens are close to every word of the query.
+        
+        Args:
+            query (str): Search text, e.g. "Jonh Smtih" (digits are ignored)
+            max_distance (int): Allowed typos per word (default: 1 for
+                words of up to 4 letters, 2 for longer ones)
+        
+        Returns:
+            list: (total_distance, contact_id) tuples, best match first
+        """
+        words = search_tokens(query)
+        if not words:
+            return []
+        
+        self._ensure_built()
+        
+        scores = None
+        for word in words:
+            allowed = max_distance
+            if allowed is None:
+                allowed = 1 if len(word) <= 4 else 2
+            
+            # Best distance of this word for every contact that matches it
+            word_scores = {}
+            for distance, _, contact_ids in self.words.search(word, allowed):
+                for contact_id in contact_ids:
+                    if contact_id not in word_scores:
+                        word_scores[contact_id] = distance
+            
+            if scores is None:
+                scores = word_scores
+            else:
+                # Every query word has to match
+                scores = {contact_id: score + word_scores[contact_id]
+                          for contact_id, score in scores.items()
+                          if contact_id in word_scores}
+            if not scores:
+                return []
+        
+        return sorted((score, contact_id) for contact_id, score in scores.items())
+    
+    def complete(self, prefix, limit=10):
+        """
+        Autocomplete a name or email address.
+        
+        Args:
+            prefix (str): The first letters typed, e.g. "jo" or "mary.j"
+            limit (int): Maximum number of suggestions
+        
+        Returns:
+            list: IDs of up to `limit` matching contacts, in alphabetical
+                order of the name or email that matched
+        """
+        prefix = " ".join(prefix.lower().split())
+        if not prefix:
+            return []
+        
+        self._ensure_prefixes_built()
+        return [contact_id for _, contact_id in self.prefixes.complete(prefix, limit)]
+
+
+def create_contact(contacts, contact, search_index=None):
+    """
+    Store a new contact under a fresh ID.
+    
+    Args:
+        contacts (dict): Contacts dictionary (or a ContactsClient)
+        contact (dict): Contact with 'name', 'phone' and 'email'
+        search_index (ContactSearchIndex): Search index to update
+    
+    Returns:
+        str: ID of the new contact
+    """
+    if isinstance(contacts, ContactsClient):
+        return contacts.add(contact)
+    
+    contact_id = generate_contact_id(contacts)
+    contacts[contact_id] = contact
+    if search_index is not None:
+        search_index.add(contact_id, contact)
+    return contact_id
+
+
+def update_contact(contacts, contact_id, changes, search_index=None):
+    """
+    Change some fields of a contact, leaving the others as they are.
+    
+    Args:
+        contacts (dict): Contacts dictionary (or a ContactsClient)
+        contact_id (str): ID of the contact to change
+        changes (dict): New values by field name
+        search_index (ContactSearchIndex): Search index to update
+    
+    Returns:
+        dict: The updated contact
+    
+    Raises:
+        KeyError: If there is no contact with that ID
+    """
+    if isinstance(contacts, ContactsClient):
+        return contacts.edit(contact_id, changes)
+    
+    contact = contacts[contact_id]
+    original_info = dict(contact)
+    contact.update(changes)
+    contacts[contact_id] = contact
+    if search_index is not None:
+        search_index.update(contact_id, original_info, contact)
+    return contact
+
+
+def remove_contact(contacts, contact_id, search_index=None):
+    """
+    Delete a contact.
+    
+    Args:
+        contacts (dict): Contacts dictionary (or a ContactsClient)
+        contact_id (str): ID of the contact to delete
+        search_index (ContactSearchIndex): Search index to update
+    
+    Returns:
+        dict: The deleted contact
+    
+    Raises:
+        KeyError: If there is no contact with that ID
+    """
+    if isinstance(contacts, ContactsClient):
+        return contacts.delete(contact_id)
+    
+    contact = contacts[contact_id]
+    if search_index is not None:
+        search_index.remove(contact_id, contact)
+    del contacts[contact_id]
+    return contact
+
+
+def contact_matches(contact_info, query):
+    """Return True if the contact's name, phone or email contains the lowercase query."""
+    return (query in contact_info['name'].lower() or
+            query in contact_info['phone'] or
+            query in contact_info['email'].lower())
+
+
+def find_contacts(contacts, query, search_index=None):
+    """
+    Find contacts whose name, phone or email contains the query.
+    
+    When nothing contains the query exactly and a search index is given,
+    close matches (typos such as "Jonh" for "John") are returned instead,
+    ranked by edit distance.
+    
+    Args:
+        contacts (dict): Contacts dictionary (or a ContactSnapshot or ContactsClient)
+        query (str): Lowercase search text
+        search_index (ContactSearchIndex): Fuzzy search index
+    
+    Returns:
+        tuple: (found_contacts, fuzzy) - matching contacts by ID and
+            whether they are typo-tolerant matches
+    """
+    if isinstance(contacts, ContactsClient):
+        return contacts.find(query)
+    
+    if isinstance(contacts, ContactSnapshot):
+        found_contacts = contacts.find(query)
+    else:
+        found_contacts = {}
+        for contact_id, contact_info in contacts.items():
+            if contact_matches(contact_info, query):
+                found_contacts[contact_id] = contact_info
+    
+    # Fall back to typo-tolerant matching
+    fuzzy = False
+    if not found_contacts and search_index is not None:
+        for distance, contact_id in search_index.search(query):
+            if contact_id in contacts:
+                found_contacts[contact_id] = contacts[contact_id]
+        fuzzy = bool(found_contacts)
+    
+    return found_contacts, fuzzy
+
+
 def display_header(title):
     """
     Display a formatted header for different sections.
@@ -147,16 +1113,18 @@ def display_menu():
     print("  3. Search Contact")
     print("  4. Edit Contact")
     print("  5. Delete Contact")
-    print("  6. Exit")
+    print("  6. Quick Lookup (autocomplete)")
+    print("  7. Exit")
     print("\n" + "-"*60)
 
 
-def add_contact(contacts):
+def add_contact(contacts, search_index=None):
     """
     Add a new contact to the contact list.
     
     Args:
         contacts (dict): Current contacts dictionary
+        search_index (ContactSearchIndex): Fuzzy search index to update
     
     Returns:
         dict: Updated contacts dictionary
@@ -184,15 +1152,12 @@ def add_contact(contacts):
             break
         print("❌ Invalid email format. Please enter a valid email (e.g., user@example.com).")
     
-    # Generate unique ID for the contact
-    contact_id = generate_contact_id(contacts)
-    
-    # Create contact dictionary
-    contacts[contact_id] = {
+    # Store the contact under a new unique ID
+    contact_id = create_contact(contacts, {
         "name": name,
         "phone": phone,
         "email": email
-    }
+    }, search_index)
     
     # Save to file
     if save_contacts(contacts):
@@ -203,12 +1168,16 @@ def add_contact(contacts):
     return contacts
 
 
-def view_all_contacts(contacts):
+def view_all_contacts(contacts, page_size=50):
     """
-    Display all contacts in a formatted table.
+    Display all contacts in a formatted table, one page at a time.
+    
+    Contacts are only read as their page is shown, so stopping early
+    never loads the rest of a large snapshot.
     
     Args:
         contacts (dict): Dictionary containing all contacts
+        page_size (int): Contacts shown before asking to continue
     """
     display_header("ALL CONTACTS")
     
@@ -222,18 +1191,29 @@ def view_all_contacts(contacts):
     print("-"*70)
     
     # Display each contact
+    shown = 0
     for contact_id, contact_info in contacts.items():
+        if shown and shown % page_size == 0:
+            answer = input(f"\n-- {shown} of {len(contacts)} shown. Press Enter for more, or 'q' to stop: ")
+            if answer.strip().lower() == 'q':
+                break
         print(f"{contact_id:<5} {contact_info['name']:<20} {contact_info['phone']:<18} {contact_info['email']:<25}")
+        shown += 1
     
     print(f"\n📊 Total contacts: {len(contacts)}")
 
 
-def search_contact(contacts):
+def search_contact(contacts, search_index=None):
     """
     Search for a contact by name, phone, or email.
     
+    When nothing contains the query exactly and a search index is given,
+    close matches (typos such as "Jonh" for "John") are shown instead,
+    ranked by edit distance.
+    
     Args:
         contacts (dict): Dictionary containing all contacts
+        search_index (ContactSearchIndex): Fuzzy search index
     """
     display_header("SEARCH CONTACT")
     
@@ -249,16 +1229,14 @@ def search_contact(contacts):
         return
     
     # Search for matching contacts
-    found_contacts = {}
-    for contact_id, contact_info in contacts.items():
-        if (query in contact_info['name'].lower() or 
-            query in contact_info['phone'] or 
-            query in contact_info['email'].lower()):
-            found_contacts[contact_id] = contact_info
+    found_contacts, fuzzy = find_contacts(contacts, query, search_index)
     
     # Display results
     if found_contacts:
-        print(f"\n🔍 Found {len(found_contacts)} matching contact(s):")
+        if fuzzy:
+            print(f"\n🔍 No exact matches. Found {len(found_contacts)} similar contact(s):")
+        else:
+            print(f"\n🔍 Found {len(found_contacts)} matching contact(s):")
         print(f"\n{'ID':<5} {'Name':<20} {'Phone':<18} {'Email':<25}")
         print("-"*70)
         
@@ -268,12 +1246,50 @@ def search_contact(contacts):
         print(f"\n❌ No contacts found matching '{query}'.")
 
 
-def edit_contact(contacts):
+def quick_lookup(contacts, search_index, limit=10):
+    """
+    Suggest contacts whose name or email starts with the typed letters.
+    
+    The user can keep refining the prefix; an empty entry goes back to
+    the menu.
+    
+    Args:
+        contacts (dict): Dictionary containing all contacts
+        search_index (ContactSearchIndex): Index providing completions
+        limit (int): Maximum number of suggestions shown
+    """
+    display_header("QUICK LOOKUP")
+    
+    if not contacts:
+        print("\n📭 No contacts available to search.")
+        return
+    
+    while True:
+        prefix = input("\nStart typing a name or email (Enter to finish): ").strip()
+        if not prefix:
+            return
+        
+        suggestions = [contact_id for contact_id in search_index.complete(prefix, limit)
+                       if contact_id in contacts]
+        if not suggestions:
+            print(f"❌ No name or email starts with '{prefix}'.")
+            continue
+        
+        print(f"\n💡 Suggestions for '{prefix}':")
+        print(f"\n{'ID':<5} {'Name':<20} {'Phone':<18} {'Email':<25}")
+        print("-"*70)
+        for contact_id in suggestions:
+            contact_info = contacts[contact_id]
+            print(f"{contact_id:<5} {contact_info['name']:<20} {contact_info['phone']:<18} {contact_info['email']:<25}")
+
+
+def edit_contact(contacts, search_index=None):
     """
     Edit an existing contact's information.
     
     Args:
         contacts (dict): Dictionary containing all contacts
+        search_index (ContactSearchIndex): Fuzzy search index to update
     
     Returns:
         dict: Updated contacts dictionary
@@ -299,38 +1315,49 @@ def edit_contact(contacts):
         return contacts
     
     # Display current contact information
-    print(f"\nCurrent information for '{contacts[contact_id]['name']}':")
-    print(f"  Name: {contacts[contact_id]['name']}")
-    print(f"  Phone: {contacts[contact_id]['phone']}")
-    print(f"  Email: {contacts[contact_id]['email']}")
+    current = contacts[contact_id]
+    print(f"\nCurrent information for '{current['name']}':")
+    print(f"  Name: {current['name']}")
+    print(f"  Phone: {current['phone']}")
+    print(f"  Email: {current['email']}")
     
     print("\n💡 Press Enter to keep current value, or enter new value to update.")
     
+    # Collect only the fields that change, so edits made meanwhile by
+    # someone else to the other fields are kept
+    changes = {}
+    
     # Get new name (or keep current)
-    new_name = input(f"\nNew name [{contacts[contact_id]['name']}]: ").strip()
+    new_name = input(f"\nNew name [{current['name']}]: ").strip()
     if new_name:
-        contacts[contact_id]['name'] = new_name
+        changes['name'] = new_name
     
     # Get and validate new phone number (or keep current)
     while True:
-        new_phone = input(f"New phone [{contacts[contact_id]['phone']}]: ").strip()
+        new_phone = input(f"New phone [{current['phone']}]: ").strip()
         if not new_phone:
             break  # Keep current phone
         if validate_phone(new_phone):
-            contacts[contact_id]['phone'] = new_phone
+            changes['phone'] = new_phone
             break
         print("❌ Invalid phone number. Please try again.")
     
     # Get and validate new email (or keep current)
     while True:
-        new_email = input(f"New email [{contacts[contact_id]['email']}]: ").strip()
+        new_email = input(f"New email [{current['email']}]: ").strip()
         if not new_email:
             break  # Keep current email
         if validate_email(new_email):
-            contacts[contact_id]['email'] = new_email
+            changes['email'] = new_email
             break
         print("❌ Invalid email format. Please try again.")
     
+    try:
+        update_contact(contacts, contact_id, changes, search_index)
+    except KeyError:
+        print(f"❌ Contact with ID '{contact_id}' was deleted meanwhile.")
+        return contacts
+    
     # Save changes
     if save_contacts(contacts):
         print(f"\n✅ Contact updated successfully!")
@@ -340,12 +1367,13 @@ def edit_contact(contacts):
     return contacts
 
 
-def delete_contact(contacts):
+def delete_contact(contacts, search_index=None):
     """
     Delete a contact from the contact list.
     
     Args:
         contacts (dict): Dictionary containing all contacts
+        search_index (ContactSearchIndex): Fuzzy search index to update
     
     Returns:
         dict: Updated contacts dictionary
@@ -376,7 +1404,11 @@ def delete_contact(contacts):
     
     if confirmation in ['yes', 'y']:
         # Delete the contact
-        del contacts[contact_id]
+        try:
+            remove_contact(contacts, contact_id, search_index)
+        except KeyError:
+            print(f"❌ Contact with ID '{contact_id}' was deleted meanwhile.")
+            return contacts
         
         # Save changes
         if save_contacts(contacts):
@@ -394,21 +1426,635 @@ def get_menu_choice():
     Get and validate the user's menu choice.
     
     Returns:
-        str: Valid menu choice (1-6)
+        str: Valid menu choice (1-7)
     """
     while True:
-        choice = input("Enter your choice (1-6): ").strip()
+        choice = input("Enter your choice (1-7): ").strip()
         
-        if choice in ['1', '2', '3', '4', '5', '6']:
+        if choice in ['1', '2', '3', '4', '5', '6', '7']:
             return choice
         
-        print("❌ Invalid choice. Please enter a number between 1 and 6.\n")
+        print("❌ Invalid choice. Please enter a number between 1 and 7.\n")
+
+
+# Default Unix socket of the contacts service
+SOCKET_FILE = "contacts.sock"
+
+
+def validate_contact_fields(fields, partial=False):
+    """
+    Check contact fields sent to the contacts service.
+    
+    Args:
+        fields (dict): Field values by name
+        partial (bool): Allow fields to be missing (for edits)
+    
+    Raises:
+        ValueError: If a field is unknown, missing or invalid
+    """
+    if not isinstance(fields, dict):
+        raise ValueError("Contact fields must be an object")
+    for field in fields:
+        if field not in SNAPSHOT_FIELDS:
+            raise ValueError(f"Unknown field '{field}'")
+    if not partial:
+        for field in SNAPSHOT_FIELDS:
+            if field not in fields:
+                raise ValueError(f"Missing field '{field}'")
+    for field, value in fields.items():
+        if not isinstance(value, str):
+            raise ValueError(f"Field '{field}' must be a string")
+        try:
+            value.encode('utf-8')
+        except UnicodeEncodeError:
+            raise ValueError(f"Field '{field}' is not valid text")
+    
+    if 'name' in fields and not fields['name'].strip():
+        raise ValueError("Name cannot be empty")
+    if 'phone' in fields and not validate_phone(fields['phone']):
+        raise ValueError("Invalid phone number")
+    if 'email' in fields and not validate_email(fields['email']):
+        raise ValueError("Invalid email format")
+
+
+class ContactService:
+    """
+    Contacts service shared by every CLI connected to its Unix socket.
+    
+    The contacts and their search index are kept in memory once. Reads
+    are answered right away; asyncio runs them one at a time, so a read
+    never sees a half-applied write. Writes go through a queue drained by
+    a single writer task, which appends every write waiting in it to the
+    journal with one fsync and only then applies them and answers, so a
+    write is visible and acknowledged only once it is on disk and no
+    client can overwrite another client's changes with a stale copy.
+    The journal is folded into the snapshot every `compact_after` writes.
+    
+    Protocol: one JSON object per line in each direction. Requests have
+    an "op" and its parameters; responses are {"ok": true, "result": ...}
+    or {"ok": false, "error": message, "kind": "not_found" or "invalid"}.
+    """
+    
+    READ_OPERATIONS = {'count', 'get', 'list', 'find', 'complete'}
+    WRITE_OPERATIONS = {'add', 'edit', 'delete'}
+    
+    def __init__(self, contacts, path=None, journal=None, compact_after=10000):
+        """
+        Args:
+            contacts (dict): Contacts to serve (decoded into memory)
+            path (str): Snapshot file (default: snapshot_path())
+            journal (str): Journal file (default: journal_path())
+            compact_after (int): Journaled writes before the snapshot
+                is rewritten
+        """
+        self.contacts = dict(contacts.items())
+        self.search_index = ContactSearchIndex(self.contacts)
+        # Contact IDs in listing order, so 'list' pages resume after the
+        # last ID a client saw instead of walking from the start
+        self.order = sorted(self._order_key(contact_id) for contact_id in self.contacts)
+        self.path = path if path is not None else snapshot_path()
+        self.journal_path = journal if journal is not None else journal_path()
+        self.compact_after = compact_after
+        self.journal = None
+        self.journaled = 0
+        self.queue = None
+        self.batches = 0
+        self.writes = 0
+    
+    @staticmethod
+    def _order_key(contact_id):
+        # Numeric IDs of different lengths list in numeric order
+        return (len(contact_id), contact_id)
+    
+    @staticmethod
+    def _parameter(request, name):
+        """Return a request parameter (raises ValueError if it is missing)."""
+        if name not in request:
+            raise ValueError(f"Missing parameter '{name}'")
+        return request[name]
+    
+    def compact(self):
+        """Write all contacts to the snapshot and empty the journal."""
+        write_snapshot(self.contacts, self.path)
+        if self.journal is not None:
+            self.journal.seek(0)
+            self.journal.truncate()
+        elif os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.journaled = 0
+    
+    def read(self, request):
+        """Answer a read request (raises KeyError or ValueError)."""
+        op = request['op']
+        if op == 'count':
+            return len(self.contacts)
+        if op == 'get':
+            return self.contacts[str(self._parameter(request, 'id'))]
+        if op == 'list':
+            limit = min(max(int(request.get('limit', 500)), 0), 10000)
+            after = request.get('after')
+            start = 0 if after is None else bisect_right(self.order, self._order_key(str(after)))
+            return [(contact_id, self.contacts[contact_id])
+                    for _, contact_id in self.order[start:start + limit]]
+        if op == 'find':
+            found_contacts, fuzzy = find_contacts(self.contacts, str(self._parameter(request, 'query')).lower(),
+                                                  self.search_index)
+            return {'contacts': list(found_contacts.items()), 'fuzzy': fuzzy}
+        # complete
+        return [contact_id for contact_id in
+                self.search_index.complete(str(self._parameter(request, 'prefix')),
+                                           int(request.get('limit', 10)))
+                if contact_id in self.contacts]
+    
+    def prepare(self, request, changes):
+        """
+        Check a write request and work out the contact's new state without
+        changing the contacts (raises KeyError or ValueError).
+        
+        Args:
+            request (dict): Write request
+            changes (dict): New state of the contacts written earlier in
+                the same batch (None when deleted); this write is added
+        
+        Returns:
+            tuple: (result, contact_id, contact) - the response result and
+                the contact's new state to journal (None when deleted)
+        """
+        def current(contact_id):
+            contact = changes[contact_id] if contact_id in changes else self.contacts.get(contact_id)
+            if contact is None:
+                raise KeyError(contact_id)
+            return contact
+        
+        op = request['op']
+        if op == 'add':
+            fields = self._parameter(request, 'contact')
+            validate_contact_fields(fields)
+            contact = {field: fields[field].strip() for field in SNAPSHOT_FIELDS}
+            contact_id = generate_contact_id(self.contacts)
+            while contact_id in changes:
+                contact_id = str(int(contact_id) + 1)
+            changes[contact_id] = contact
+            return contact_id, contact_id, contact
+        if op == 'edit':
+            contact_id = str(self._parameter(request, 'id'))
+            fields = self._parameter(request, 'changes')
+            validate_contact_fields(fields, partial=True)
+            contact = dict(current(contact_id))
+            contact.update((field, value.strip()) for field, value in fields.items())
+            changes[contact_id] = contact
+            return contact, contact_id, contact
+        # delete
+        contact_id = str(self._parameter(request, 'id'))
+        contact = current(contact_id)
+        changes[contact_id] = None
+        return contact, contact_id, None
+    
+    def _store(self, contact_id, contact):
+        """Apply a saved change to the contacts, the search index and the listing order."""
+        if contact_id in self.contacts:
+            if contact is not None:
+                update_contact(self.contacts, contact_id, contact, self.search_index)
+                return
+            remove_contact(self.contacts, contact_id, self.search_index)
+            del self.order[bisect_left(self.order, self._order_key(contact_id))]
+        elif contact is not None:
+            self.contacts[contact_id] = contact
+            self.search_index.add(contact_id, contact)
+            insort(self.order, self._order_key(contact_id))
+    
+    async def write(self, request):
+        """Queue a write and wait until its batch has been saved."""
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((request, future))
+        return await future
+    
+    def _append_journal(self, text):
+        """Append journal lines and wait until they are on disk."""
+        self.journal.write(text)
+        self.journal.flush()
+        os.fsync(self.journal.fileno())
+    
+    async def _write_batch(self, batch):
+        """
+        Journal a batch of queued writes with one fsync, then apply them.
+        
+        Each write is checked against the contacts as the writes before it
+        in the batch leave them, but the contacts only change once the
+        batch is on disk: if the journal cannot be written, every write in
+        the batch fails and none of them is applied.
+        
+        The fsync runs in a worker thread, so reads are answered meanwhile;
+        they see the contacts as the last saved batch left them.
+        
+        Returns:
+            list: (future, result, error) for every write in the batch
+        """
+        outcomes = []
+        entries = []
+        changes = {}
+        for request, future in batch:
+            try:
+                result, contact_id, contact = self.prepare(request, changes)
+                outcomes.append((future, result, None))
+                entries.append(json.dumps({'id': contact_id, 'contact': contact}) + "\n")
+            except KeyError as e:
+                outcomes.append((future, None, ('not_found', f"No contact with ID {e}")))
+            except (TypeError, ValueError) as e:
+                outcomes.append((future, None, ('invalid', str(e))))
+        
+        loop = asyncio.get_running_loop()
+        if entries:
+            try:
+                await loop.run_in_executor(None, self._append_journal, "".join(entries))
+            except OSError as e:
+                print(f"❌ Error saving contacts: {e}")
+                failed = ('invalid', f"Could not save contacts: {e}")
+                return [(future, None, failed if error is None else error)
+                        for future, _, error in outcomes]
+            self.journaled += len(entries)
+            for contact_id, contact in changes.items():
+                self._store(contact_id, contact)
+        return outcomes
+    
+    async def run_writer(self):
+        """
+        Apply queued writes in batches, with one journal fsync per batch,
+        until stop() queues None.
+        """
+        stopping = False
+        while not stopping:
+            batch = [await self.queue.get()]
+            while not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            stopping = None in batch
+            batch = [item for item in batch if item is not None]
+            if not batch:
+                break
+            
+            try:
+                outcomes = await self._write_batch(batch)
+            except Exception as e:
+                # Never let one bad batch stop the writer: fail its requests
+                print(f"❌ Error saving contacts: {e}")
+                outcomes = [(future, None, ('invalid', f"Could not save contacts: {e}"))
+                            for _, future in batch]
+            
+            self.batches += 1
+            self.writes += len(batch)
+            for future, result, error in outcomes:
+                if not future.done():
+                    future.set_result((result, error))
+            
+            # The batch is safe in the journal, so it is answered first. The
+            # snapshot is written in a worker thread while reads go on; only
+            # this task changes the contacts, so it never sees a change
+            # midway. A failed compaction is retried after the next batch.
+            if self.journaled >= self.compact_after:
+                try:
+                    await asyncio.get_running_loop().run_in_executor(None, self.compact)
+                except Exception as e:
+                    print(f"❌ Error compacting contacts: {e}")
+    
+    async def handle_client(self, reader, writer):
+        """Answer one connection's requests until it disconnects."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # Longer than the stream limit (64 KiB): the rest of the
+                    # line cannot be resynchronised, so give up on the client
+                    response = {'ok': False, 'kind': 'invalid', 'error': "Request line too long"}
+                    writer.write(json.dumps(response).encode('utf-8') + b"\n")
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                
+                result, error = None, None
+                try:
+                    request = json.loads(line)
+                    op = request.get('op') if isinstance(request, dict) else None
+                    if op in self.READ_OPERATIONS:
+                        result = self.read(request)
+                    elif op in self.WRITE_OPERATIONS:
+                        result, error = await self.write(request)
+                    else:
+                        error = ('invalid', f"Unknown operation {op!r}")
+                except KeyError as e:
+                    error = ('not_found', f"No contact with ID {e}")
+                except (TypeError, ValueError) as e:
+                    error = ('invalid', str(e))
+                
+                if error is None:
+                    response = {'ok': True, 'result': result}
+                else:
+                    response = {'ok': False, 'kind': error[0], 'error': error[1]}
+                writer.write(json.dumps(response).encode('utf-8') + b"\n")
+                
+                # Only wait for the socket when its buffer is actually filling up
+                if writer.transport.get_write_buffer_size() > 65536:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    async def start(self, socket_path=SOCKET_FILE):
+        """
+        Start listening on a Unix socket and start the writer task.
+        
+        Returns:
+            asyncio.Server: The running server
+        """
+        claim_socket(socket_path)
+        self.journal = open(self.journal_path, 'a', encoding='utf-8')
+        self.queue = asyncio.Queue()
+        self.writer_task = asyncio.create_task(self.run_writer())
+        return await asyncio.start_unix_server(self.handle_client, socket_path, backlog=4096)
+    
+    async def stop(self):
+        """
+        Save the writes already queued, stop the writer task and fold the
+        journal into the snapshot.
+        """
+        self.queue.put_nowait(None)
+        await asyncio.wait([self.writer_task])
+        try:
+            if self.journaled:
+                self.compact()
+        except Exception as e:
+            # The journal stays on disk and is replayed on the next start
+            print(f"❌ Error compacting contacts: {e}")
+        finally:
+            self.journal.close()
+            self.journal = None
+
+
+def claim_socket(socket_path=SOCKET_FILE):
+    """
+    Make sure no contacts service is listening on a socket path.
+    
+    A socket file nobody accepts connections on is left over from a
+    service that was killed and is removed.
+    
+    Raises:
+        OSError: EADDRINUSE if a service is running on the socket
+    """
+    if not os.path.exists(socket_path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        return
+    finally:
+        probe.close()
+    raise OSError(errno.EADDRINUSE,
+                  f"A contacts service is already running on {socket_path}")
+
+
+async def serve_contacts(socket_path=SOCKET_FILE):
+    """Run the contacts service on the contacts file until interrupted."""
+    # Check before touching the files: a running service owns them
+    try:
+        claim_socket(socket_path)
+    except OSError as e:
+        print(f"❌ {e.strerror}")
+        return
+    
+    contacts = load_contacts()
+    service = ContactService(contacts)
+    if isinstance(contacts, ContactSnapshot):
+        contacts.close()
+    
+    # Start from a snapshot holding everything, with an empty journal
+    service.compact()
+    retire_json_file()
+    server = await service.start(socket_path)
+    print(f"📇 Contacts service listening on {socket_path} ({len(service.contacts)} contact(s))")
+    
+    # Ctrl+C and SIGTERM shut down cleanly, folding the journal in
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, stopping.set)
+    
+    try:
+        async with server:
+            await stopping.wait()
+    finally:
+        await service.stop()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+    print("\n👋 Contacts service stopped.")
 
 
-def main():
+class ContactsClient(Mapping):
+    """
+    Read-only view of the contacts held by a running contacts service.
+    
+    Passed to the menu functions in place of the contacts dictionary:
+    reads become requests to the service, and create_contact,
+    update_contact, remove_contact and find_contacts send the change or
+    search to the service instead of running it locally.
+    """
+    
+    page_size = 500
+    
+    def __init__(self, socket_path=SOCKET_FILE):
+        """
+        Args:
+            socket_path (str): Unix socket of the contacts service
+        
+        Raises:
+            OSError: If no service is listening on the socket
+        """
+        self.socket_path = socket_path
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.connect(socket_path)
+        except OSError:
+            self._socket.close()
+            raise
+        self._file = self._socket.makefile('rwb')
+    
+    def close(self):
+        """Disconnect from the service."""
+        self._file.close()
+        self._socket.close()
+    
+    def request(self, op, **params):
+        """
+        Send one request and return its result.
+        
+        Raises:
+            KeyError: If the contact does not exist
+            ValueError: If the service rejected the request
+            ConnectionError: If the service went away
+        """
+        params['op'] = op
+        self._file.write(json.dumps(params).encode('utf-8') + b"\n")
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("The contacts service closed the connection")
+        
+        response = json.loads(line)
+        if response['ok']:
+            return response['result']
+        if response['kind'] == 'not_found':
+            raise KeyError(params.get('id'))
+        raise ValueError(response['error'])
+    
+    def __getitem__(self, contact_id):
+        return self.request('get', id=contact_id)
+    
+    def __len__(self):
+        return self.request('count')
+    
+    def __iter__(self):
+        for contact_id, _ in self.items():
+            yield contact_id
+    
+    def items(self):
+        """Iterate (contact_id, contact) pairs, one page per request."""
+        after = None
+        while True:
+            page = self.request('list', after=after, limit=self.page_size)
+            for contact_id, contact in page:
+                yield contact_id, contact
+            if len(page) < self.page_size:
+                return
+            after = page[-1][0]
+    
+    def values(self):
+        for _, contact in self.items():
+            yield contact
+    
+    def add(self, contact):
+        return self.request('add', contact=contact)
+    
+    def edit(self, contact_id, changes):
+        return self.request('edit', id=contact_id, changes=changes)
+    
+    def delete(self, contact_id):
+        return self.request('delete', id=contact_id)
+    
+    def find(self, query):
+        result = self.request('find', query=query)
+        return dict(result['contacts']), result['fuzzy']
+    
+    def complete(self, prefix, limit=10):
+        return self.request('complete', prefix=prefix, limit=limit)
+
+
+async def _load_test_client(socket_path, requests, write_ratio, count, seed):
+    # Mixed traffic: lookups by ID, autocomplete, searches and edits/adds
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    reads = writes = 0
+    
+    try:
+        for _ in range(requests):
+            index = rng.randrange(1, count + 1)
+            choice = rng.random()
+            if choice < write_ratio / 2:
+                request = {'op': 'edit', 'id': str(index), 'changes': {'phone': f"555-010-{index % 10000:04d}"}}
+            elif choice < write_ratio:
+                request = {'op': 'add', 'contact': {'name': f"Load Client {seed}",
+                                                    'phone': "555-010-0000",
+                                                    'email': f"client{seed}@example.com"}}
+            elif choice < 0.5:
+                request = {'op': 'get', 'id': str(index)}
+            elif choice < 0.9:
+                request = {'op': 'complete', 'prefix': f"user {index}"[:rng.randrange(6, 10)]}
+            else:
+                request = {'op': 'find', 'query': f"user{index}@"}
+            
+            writer.write(json.dumps(request).encode('utf-8') + b"\n")
+            response = json.loads(await reader.readline())
+            if not response['ok']:
+                raise RuntimeError(response['error'])
+            if request['op'] in ContactService.WRITE_OPERATIONS:
+                writes += 1
+            else:
+                reads += 1
+    finally:
+        writer.close()
+    
+    return reads, writes
+
+
+async def run_load_test(clients=100, requests_per_client=100, contacts=10000, write_ratio=0.1):
+    """
+    Measure the contacts service with many concurrent clients.
+    
+    An in-process service is started on a temporary socket and snapshot
+    holding `contacts` generated contacts; each client then sends
+    `requests_per_client` mixed requests, waiting for every answer.
+    
+    Args:
+        clients (int): Number of concurrent connections
+        requests_per_client (int): Requests sent by each client
+        contacts (int): Number of contacts in the temporary snapshot
+        write_ratio (float): Share of requests that are adds or edits
+    
+    Returns:
+        dict: Request counts, batches and elapsed time
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "contacts.snap")
+        write_snapshot({str(index): {"name": f"User {index}", "phone": "555-010-0000",
+                                     "email": f"user{index}@example.com"}
+                        for index in range(1, contacts + 1)}, path)
+        snapshot = ContactSnapshot(path)
+        service = ContactService(snapshot, path, os.path.join(directory, "contacts.journal"))
+        snapshot.close()
+        socket_path = os.path.join(directory, "contacts.sock")
+        server = await service.start(socket_path)
+        
+        try:
+            start = time.perf_counter()
+            counts = await asyncio.gather(*(
+                _load_test_client(socket_path, requests_per_client, write_ratio, contacts, seed)
+                for seed in range(clients)
+            ))
+            elapsed = time.perf_counter() - start
+        finally:
+            server.close()
+            await server.wait_closed()
+            await service.stop()
+    
+    reads = sum(count[0] for count in counts)
+    writes = sum(count[1] for count in counts)
+    print("="*60)
+    print("               LOAD TEST RESULTS")
+    print("="*60)
+    print(f"Concurrent clients: {clients:,}")
+    print(f"Contacts: {contacts:,}")
+    print(f"Reads: {reads:,}   Writes: {writes:,}")
+    print(f"Write batches: {service.batches:,} "
+          f"(average {writes / max(service.batches, 1):.1f} writes per fsync)")
+    print(f"Elapsed: {elapsed:.2f} s")
+    print(f"Requests per second: {(reads + writes) / elapsed:,.0f}")
+    print("="*60 + "\n")
+    
+    return {'clients': clients, 'reads': reads, 'writes': writes,
+            'batches': service.batches, 'elapsed': elapsed}
+
+
+def main(socket_path=None):
     """
     Main function to run the Contact Management System.
     Displays menu and handles user choices.
+    
+    Args:
+        socket_path (str): Unix socket of a contacts service to use; when
+            no service is running there the contacts file is used directly
     """
     # Display welcome message
     print("\n" + "="*60)
@@ -417,8 +2063,25 @@ def main():
     print("\n📱 Manage your contacts efficiently!")
     print("💾 All changes are automatically saved to file.")
     
-    # Load existing contacts from file
-    contacts = load_contacts()
+    # Use the contacts service when one is running, so changes made by
+    # other users are never overwritten
+    contacts = None
+    if socket_path and os.path.exists(socket_path):
+        try:
+            contacts = ContactsClient(socket_path)
+            print(f"🔌 Connected to the contacts service at {socket_path}.")
+        except OSError as e:
+            print(f"⚠️  Contacts service not reachable ({e}). Using the contacts file.")
+    
+    if contacts is not None:
+        # The service searches its own index
+        search_index = contacts
+    else:
+        # Load existing contacts from file
+        contacts = load_contacts()
+        
+        # Build the search index once; the menu actions keep it current
+        search_index = ContactSearchIndex(contacts)
     
     if contacts:
         print(f"\n✅ Loaded {len(contacts)} existing contact(s).")
@@ -434,7 +2097,7 @@ def main():
         # Execute appropriate function based on choice
         if choice == '1':
             # Add new contact
-            contacts = add_contact(contacts)
+            contacts = add_contact(contacts, search_index)
         
         elif choice == '2':
             # View all contacts
@@ -442,17 +2105,21 @@ def main():
         
         elif choice == '3':
             # Search contact
-            search_contact(contacts)
+            search_contact(contacts, search_index)
         
         elif choice == '4':
             # Edit contact
-            contacts = edit_contact(contacts)
+            contacts = edit_contact(contacts, search_index)
         
         elif choice == '5':
             # Delete contact
-            contacts = delete_contact(contacts)
+            contacts = delete_contact(contacts, search_index)
         
         elif choice == '6':
+            # Autocomplete names and emails
+            quick_lookup(contacts, search_index)
+        
+        elif choice == '7':
             # Exit the program
             display_header("THANK YOU!")
             print("\n👋 Thanks for using the Contact Management System!")
@@ -464,6 +2131,36 @@ def main():
         input("\nPress Enter to continue...")
 
 
+def parse_command_line(argv=None):
+    parser = argparse.ArgumentParser(description="Simple contact management system.")
+    parser.add_argument('--serve', action='store_true',
+                        help="run the contacts service that CLIs connect to")
+    parser.add_argument('--socket', default=SOCKET_FILE,
+                        help=f"Unix socket of the contacts service (default: {SOCKET_FILE})")
+    parser.add_argument('--export-json', metavar='FILE',
+                        help="write all contacts to FILE in JSON and exit")
+    parser.add_argument('--local', action='store_true',
+                        help="use the contacts file directly even if a service is running")
+    parser.add_argument('--load-test', type=int, metavar='CLIENTS',
+                        help="measure an in-process service with CLIENTS concurrent clients")
+    parser.add_argument('--requests', type=int, default=100,
+                        help="requests per client for --load-test (default: 100)")
+    parser.add_argument('--contacts', type=int, default=10000,
+                        help="contacts in the --load-test snapshot (default: 10000)")
+    return parser.parse_args(argv)
+
+
 # Entry point of the program
 if __name__ == "__main__":
-    main()
+    args = parse_command_line()
+    
+    if args.export_json:
+        contacts = load_contacts()
+        if export_contacts_json(contacts, args.export_json):
+            print(f"✅ {len(contacts)} contact(s) exported to {os.path.abspath(args.export_json)}")
+    elif args.serve:
+        asyncio.run(serve_contacts(args.socket))
+    elif args.load_test:
+        asyncio.run(run_load_test(args.load_test, args.requests, args.contacts))
+    else:
+        main(None if args.local else args.socket)
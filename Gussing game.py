@@ -1,16 +1,67 @@
+import argparse
+import asyncio
+import os
 import random
-def display_welcome_message():
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# NumPy is optional; it only speeds up bulk target generation for simulations
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+VERY_CLOSE_DISTANCE = 5
+WARM_DISTANCE = 10
+
+
+# Ranges may use any 64-bit value, signed or unsigned
+RANGE_LOWEST = -2**63
+RANGE_HIGHEST = 2**64 - 1
+
+
+def validate_range(min_range, max_range):
+    if not (RANGE_LOWEST <= min_range < max_range <= RANGE_HIGHEST):
+        raise ValueError(f"Invalid range {min_range}-{max_range}: the minimum must be "
+                         f"below the maximum and both must fit in 64 bits")
+    return min_range, max_range
+
+
+def display_welcome_message(min_range=1, max_range=100):
     print("\n" + "="*60)
     print("        WELCOME TO THE NUMBER GUESSING GAME!")
     print("="*60)
-    print("I'm thinking of a number between 1 and 100.")
+    print(f"I'm thinking of a number between {min_range} and {max_range}.")
     print("Can you guess what it is?")
     print("I'll give you hints along the way!")
     print("="*60 + "\n")
 
 
-def generate_random_number(min_range=1, max_range=100):
-    return random.randint(min_range, max_range)
+def generate_random_number(min_range=1, max_range=100, rng=None):
+    return (rng or random).randint(min_range, max_range)
+
+
+def new_seed():
+    return random.SystemRandom().getrandbits(64)
+
+
+def generate_targets(count, min_range=1, max_range=100, seed=None):
+    # Bulk targets for simulations. A seeded call always uses random.Random,
+    # so a seed gives the same targets whether or not NumPy is installed;
+    # unseeded calls use one NumPy Generator call when NumPy is installed
+    # and the bounds fit its int64 integers
+    if np is not None and seed is None and max_range < 2**63:
+        generator = np.random.default_rng()
+        return generator.integers(min_range, max_range, size=count, endpoint=True).tolist()
+    rng = random.Random(seed)
+    if max_range - min_range < 2**62:
+        return rng.choices(range(min_range, max_range + 1), k=count)
+    # random.choices needs a population whose length fits in a C ssize_t
+    return [rng.randint(min_range, max_range) for _ in range(count)]
 
 
 def get_user_guess():
@@ -26,33 +77,55 @@ def get_user_guess():
             print("❌ Invalid input! Please enter a whole number.\n")
 
 
-def provide_feedback(guess, target_number, min_range, max_range):
+def classify_guess(guess, target_number, min_range, max_range):
+    # Pure form of provide_feedback: returns 'out_of_range', 'correct' or a
+    # (direction, band) pair such as ('low', 'very_close')
     if guess < min_range or guess > max_range:
+        return 'out_of_range'
+    
+    if guess == target_number:
+        return 'correct'
+    
+    difference = abs(guess - target_number)
+    direction = 'low' if guess < target_number else 'high'
+    
+    if difference <= VERY_CLOSE_DISTANCE:
+        return (direction, 'very_close')
+    elif difference <= WARM_DISTANCE:
+        return (direction, 'warm')
+    else:
+        return (direction, 'far')
+
+
+def provide_feedback(guess, target_number, min_range, max_range):
+    feedback = classify_guess(guess, target_number, min_range, max_range)
+    
+    if feedback == 'out_of_range':
         print(f"⚠️  Your guess is outside the valid range ({min_range}-{max_range})!")
         print("Try again with a number within the range.\n")
         return False
     
-    if guess == target_number:
+    if feedback == 'correct':
         print("🎉 Congratulations! You guessed the correct number!\n")
         return True
     
-    difference = abs(guess - target_number)
+    direction, band = feedback
     
-    if guess < target_number:
+    if direction == 'low':
         print("📉 Too Low!", end=" ")
         
-        if difference <= 5:
+        if band == 'very_close':
             print("You're very close! 🔥")
-        elif difference <= 10:
+        elif band == 'warm':
             print("Getting warm! 🌡️")
         else:
             print("Try a higher number! ⬆️")
     else:
         print("📈 Too High!", end=" ")
         
-        if difference <= 5:
+        if band == 'very_close':
             print("You're very close! 🔥")
-        elif difference <= 10:
+        elif band == 'warm':
             print("Getting warm! 🌡️")
         else:
             print("Try a lower number! ⬇️")
@@ -61,49 +134,264 @@ def provide_feedback(guess, target_number, min_range, max_range):
     return False
 
 
+def performance_rating(attempts):
+    if attempts == 1:
+        return "LEGENDARY! 🏆 First try!"
+    elif attempts <= 5:
+        return "EXCELLENT! ⭐⭐⭐"
+    elif attempts <= 10:
+        return "GOOD! ⭐⭐"
+    elif attempts <= 15:
+        return "FAIR! ⭐"
+    else:
+        return "Keep practicing! 💪"
+
+
 def display_game_statistics(attempts, target_number):
     print("="*60)
     print("               GAME STATISTICS")
     print("="*60)
     print(f"The number was: {target_number}")
     print(f"Total attempts: {attempts}")
+    print(f"Performance: {performance_rating(attempts)}")
+    print("="*60 + "\n")
+
+
+class Player(ABC):
+    # Interface for headless players: reset() starts a game, next_guess()
+    # picks a guess and observe() receives classify_guess's feedback.
+    # Deterministic players always take the same attempts for a given target,
+    # which lets the simulator precompute them.
+    deterministic = True
     
-    if attempts == 1:
-        print("Performance: LEGENDARY! 🏆 First try!")
-    elif attempts <= 5:
-        print("Performance: EXCELLENT! ⭐⭐⭐")
-    elif attempts <= 10:
-        print("Performance: GOOD! ⭐⭐")
-    elif attempts <= 15:
-        print("Performance: FAIR! ⭐")
-    else:
-        print("Performance: Keep practicing! 💪")
+    def reset(self, min_range, max_range):
+        self.low = min_range
+        self.high = max_range
     
-    print("="*60 + "\n")
+    @abstractmethod
+    def next_guess(self):
+        pass
+    
+    def observe(self, guess, feedback):
+        pass
+
+
+class BinarySearchPlayer(Player):
+    # Uses only the higher/lower part of the hint
+    def next_guess(self):
+        return (self.low + self.high) // 2
+    
+    def observe(self, guess, feedback):
+        direction = feedback[0]
+        if direction == 'low':
+            self.low = guess + 1
+        else:
+            self.high = guess - 1
+
+
+# Largest interval for which BandPlayer computes the optimal guess exactly
+BAND_PLAN_LIMIT = 2048
 
+_band_plan_costs = [0.0]
+_band_plan_offsets = [0]
 
-def play_game():
-    MIN_RANGE = 1
-    MAX_RANGE = 100
+
+def _band_parts(length):
+    # Lengths of the very close / warm / far sub-intervals on one side
+    very_close = min(length, VERY_CLOSE_DISTANCE)
+    warm = min(max(length - VERY_CLOSE_DISTANCE, 0), WARM_DISTANCE - VERY_CLOSE_DISTANCE)
+    far = max(length - WARM_DISTANCE, 0)
+    return very_close, warm, far
+
+
+def _extend_band_plan(size):
+    # Dynamic programme over interval length: the banded feedback is the same
+    # wherever an interval lies, so the expected number of guesses (for a
+    # uniformly random target) only depends on its length
+    costs = _band_plan_costs
+    offsets = _band_plan_offsets
+    for length in range(len(costs), size + 1):
+        best_total = None
+        best_offset = 0
+        for offset in range(length):
+            total = 0.0
+            for part in _band_parts(offset) + _band_parts(length - 1 - offset):
+                if part:
+                    total += part * costs[part]
+            if best_total is None or total < best_total:
+                best_total = total
+                best_offset = offset
+        costs.append(1 + best_total / length)
+        offsets.append(best_offset)
+
+
+class BandPlayer(Player):
+    # Also uses the "very close" / "warm" distance bands to narrow the range
+    def next_guess(self):
+        length = self.high - self.low + 1
+        if length > BAND_PLAN_LIMIT:
+            return (self.low + self.high) // 2
+        if length >= len(_band_plan_offsets):
+            _extend_band_plan(length)
+        return self.low + _band_plan_offsets[length]
     
-    display_welcome_message()
+    def observe(self, guess, feedback):
+        direction, band = feedback
+        if band == 'very_close':
+            near, far = 1, VERY_CLOSE_DISTANCE
+        elif band == 'warm':
+            near, far = VERY_CLOSE_DISTANCE + 1, WARM_DISTANCE
+        else:
+            near, far = WARM_DISTANCE + 1, None
+        
+        if direction == 'low':
+            self.low = max(self.low, guess + near)
+            if far is not None:
+                self.high = min(self.high, guess + far)
+        else:
+            self.high = min(self.high, guess - near)
+            if far is not None:
+                self.low = max(self.low, guess - far)
+
+
+class RandomPlayer(Player):
+    # Guesses uniformly inside the remaining range (a naive baseline)
+    deterministic = False
     
-    target_number = generate_random_number(MIN_RANGE, MAX_RANGE)
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
     
-    attempts = 0
+    def next_guess(self):
+        return self.rng.randint(self.low, self.high)
+    
+    def observe(self, guess, feedback):
+        if feedback[0] == 'low':
+            self.low = guess + 1
+        else:
+            self.high = guess - 1
+
+
+PLAYERS = {
+    'binary': BinarySearchPlayer,
+    'bands': BandPlayer,
+    'random': RandomPlayer,
+}
+
+
+def play_headless(player, target_number, min_range, max_range, max_attempts=10_000):
+    player.reset(min_range, max_range)
+    
+    for attempts in range(1, max_attempts + 1):
+        guess = player.next_guess()
+        feedback = classify_guess(guess, target_number, min_range, max_range)
+        if feedback == 'correct':
+            return attempts
+        player.observe(guess, feedback)
+    
+    raise RuntimeError(f"{type(player).__name__} did not find {target_number} "
+                       f"in {max_attempts} attempts")
+
+
+# Largest range for which deterministic players get an attempts-per-target table
+ATTEMPT_TABLE_LIMIT = 1_000_000
+
+
+def _simulate_shard(player_name, games, min_range, max_range, seed):
+    player = PLAYERS[player_name]()
+    if not player.deterministic:
+        player = PLAYERS[player_name](seed)
+    targets = generate_targets(games, min_range, max_range, seed)
+    
+    span = max_range - min_range + 1
+    if player.deterministic and games > span and span <= ATTEMPT_TABLE_LIMIT:
+        # The attempts only depend on the target, so when there are more
+        # games than targets play every target once and turn each simulated
+        # game into a table lookup
+        table = [play_headless(player, target, min_range, max_range)
+                 for target in range(min_range, max_range + 1)]
+        return Counter(table[target - min_range] for target in targets)
+    
+    return Counter(play_headless(player, target, min_range, max_range)
+                   for target in targets)
+
+
+def simulate_games(player_name='bands', games=1_000_000, min_range=1, max_range=100,
+                   workers=None, seed=None):
+    # Plays games across a process pool and returns a Counter of attempts
+    # Shards only get seeds when the caller asked for a reproducible run
+    workers = workers or os.cpu_count() or 1
+    base_seed = None if seed is None else random.Random(seed).getrandbits(64)
+    shares = [games // workers + (1 if shard < games % workers else 0)
+              for shard in range(workers)]
+    
+    if workers == 1:
+        return _simulate_shard(player_name, games, min_range, max_range, base_seed)
+    
+    attempts = Counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_simulate_shard, player_name, share, min_range,
+                               max_range, None if seed is None else base_seed + shard)
+                   for shard, share in enumerate(shares) if share]
+        for future in futures:
+            attempts.update(future.result())
+    return attempts
+
+
+def display_simulation_results(player_name, attempts, elapsed):
+    games = sum(attempts.values())
+    average = sum(count * value for value, count in attempts.items()) / games
+    
+    # Same buckets as display_game_statistics
+    buckets = Counter()
+    for value, count in attempts.items():
+        buckets[performance_rating(value)] += count
+    
+    print("="*60)
+    print(f"        SIMULATION RESULTS ({player_name.upper()} PLAYER)")
+    print("="*60)
+    print(f"Games played: {games:,}")
+    print(f"Games per second: {games / elapsed:,.0f}")
+    print(f"Average attempts: {average:.3f}")
+    print(f"Worst game: {max(attempts)} attempts")
+    print("\nAttempts distribution:")
+    for value in sorted(attempts):
+        print(f"  {value:>3}: {attempts[value]:>10,}")
+    print("\nPerformance distribution:")
+    for label in ("LEGENDARY! 🏆 First try!", "EXCELLENT! ⭐⭐⭐", "GOOD! ⭐⭐",
+                  "FAIR! ⭐", "Keep practicing! 💪"):
+        print(f"  {label:<26} {buckets[label] / games:>7.2%}")
+    print("="*60 + "\n")
+
+
+def play_game(seed=None, log_path=None, min_range=1, max_range=100, leaderboard=None):
+    validate_range(min_range, max_range)
+    
+    display_welcome_message(min_range, max_range)
+    
+    session = GameSession(min_range, max_range, seed=seed)
     
     game_won = False
     
     while not game_won:
-        attempts += 1
-        
-        print(f"Attempt #{attempts}")
+        print(f"Attempt #{session.attempts + 1}")
         
         user_guess = get_user_guess()
         
-        game_won = provide_feedback(user_guess, target_number, MIN_RANGE, MAX_RANGE)
+        session.guess(user_guess)
+        game_won = provide_feedback(user_guess, session.target_number, min_range, max_range)
+    
+    display_game_statistics(session.attempts, session.target_number)
+    
+    if log_path:
+        append_session_log(log_path, session)
     
-    display_game_statistics(attempts, target_number)
+    if leaderboard is not None:
+        name = input("Enter your name for the leaderboard (leave blank to skip): ").strip()
+        if name:
+            leaderboard.record(name, session)
+            percentile = leaderboard.percentile(session.attempts, min_range, max_range)
+            print(f"🏅 That game beat {percentile:.1f}% of recorded games on this range.\n")
+            display_leaderboard(leaderboard, 5, min_range, max_range)
 
 
 def ask_play_again():
@@ -119,9 +407,10 @@ def ask_play_again():
             print("Please enter 'yes' or 'no'.\n")
 
 
-def main():
+def main(seed=None, log_path=None, min_range=1, max_range=100, leaderboard=None):
     while True:
-        play_game()
+        play_game(seed, log_path, min_range, max_range, leaderboard)
+        seed = None
         
         if not ask_play_again():
             print("\n" + "="*60)
@@ -131,5 +420,375 @@ def main():
             break
 
 
+class GameSession:
+    # State of one game, independent of how guesses arrive (console or network).
+    # The target comes from a per-session RNG seeded with `seed`, so the seed
+    # plus the list of guesses is enough to replay the session exactly.
+    def __init__(self, min_range=1, max_range=100, target_number=None, seed=None):
+        self.min_range = min_range
+        self.max_range = max_range
+        self.seed = seed if seed is not None else new_seed()
+        self.rng = random.Random(self.seed)
+        self.target_number = (target_number if target_number is not None
+                              else generate_random_number(min_range, max_range, self.rng))
+        self.guesses = []
+        self.won = False
+    
+    @property
+    def attempts(self):
+        return len(self.guesses)
+    
+    def guess(self, value):
+        self.guesses.append(value)
+        feedback = classify_guess(value, self.target_number, self.min_range, self.max_range)
+        if feedback == 'correct':
+            self.won = True
+        return feedback
+    
+    def to_log_line(self):
+        # Compact replay record: "<seed hex> <min> <max> <guess,guess,...>"
+        guesses = ','.join(map(str, self.guesses))
+        return f"{self.seed:x} {self.min_range} {self.max_range} {guesses}"
+
+
+def replay_session(log_line):
+    # Rebuild a session from its log line; returns it with every guess re-applied
+    # and the feedback each guess produced
+    seed, min_range, max_range, *rest = log_line.split()
+    session = GameSession(int(min_range), int(max_range), seed=int(seed, 16))
+    guesses = [int(value) for value in rest[0].split(',')] if rest else []
+    feedback = [session.guess(value) for value in guesses]
+    return session, feedback
+
+
+def append_session_log(path, session):
+    with open(path, 'a', encoding='utf-8') as log_file:
+        log_file.write(session.to_log_line() + "\n")
+
+
+def display_replay(log_line):
+    session, feedback = replay_session(log_line)
+    print("="*60)
+    print("               SESSION REPLAY")
+    print("="*60)
+    print(f"Seed: {session.seed:x}")
+    print(f"Range: {session.min_range}-{session.max_range}")
+    print(f"The number was: {session.target_number}")
+    for attempt, (guess, result) in enumerate(zip(session.guesses, feedback), 1):
+        if isinstance(result, tuple):
+            result = ' '.join(result)
+        print(f"  Attempt #{attempt}: {guess:<6} -> {result.replace('_', ' ')}")
+    print(f"Won: {'yes' if session.won else 'no'} after {session.attempts} attempts")
+    print("="*60 + "\n")
+
+
+class Leaderboard:
+    # Persistent game results in SQLite. Top-K queries walk the B-tree index on
+    # (range, attempts), and a per-range histogram of attempts turns percentile
+    # queries into a sum over a handful of rows, however many games are stored.
+    def __init__(self, path='leaderboard.db'):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS games (
+                id INTEGER PRIMARY KEY,
+                player TEXT NOT NULL,
+                min_range TEXT NOT NULL,
+                max_range TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                seed TEXT NOT NULL,
+                played_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS games_by_range
+                ON games (min_range, max_range, attempts, played_at);
+            CREATE INDEX IF NOT EXISTS games_by_player
+                ON games (player, min_range, max_range, attempts);
+            CREATE TABLE IF NOT EXISTS attempts_histogram (
+                min_range TEXT NOT NULL,
+                max_range TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                games INTEGER NOT NULL,
+                PRIMARY KEY (min_range, max_range, attempts)
+            ) WITHOUT ROWID;
+        """)
+    
+    # 64-bit range ends do not all fit in SQLite's signed INTEGER, so they are
+    # stored as text; equality lookups are all the queries need
+    def record(self, player, session):
+        self.record_many([(player, session.min_range, session.max_range,
+                           session.attempts, session.seed)])
+    
+    def record_many(self, results):
+        # results: iterable of (player, min_range, max_range, attempts, seed)
+        now = time.time()
+        rows = [(player, str(low), str(high), attempts, f"{seed:x}", now)
+                for player, low, high, attempts, seed in results]
+        histogram = Counter((low, high, attempts) for _, low, high, attempts, _, _ in rows)
+        
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO games (player, min_range, max_range, attempts, seed, played_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self.connection.executemany(
+                "INSERT INTO attempts_histogram VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (min_range, max_range, attempts) "
+                "DO UPDATE SET games = games + excluded.games",
+                [key + (count,) for key, count in histogram.items()])
+    
+    def top(self, k=10, min_range=1, max_range=100):
+        return self.connection.execute(
+            "SELECT player, attempts, played_at FROM games "
+            "WHERE min_range = ? AND max_range = ? "
+            "ORDER BY attempts, played_at LIMIT ?",
+            (str(min_range), str(max_range), k)).fetchall()
+    
+    def percentile(self, attempts, min_range=1, max_range=100):
+        # Share of recorded games on this range that took more attempts
+        worse, total = self.connection.execute(
+            "SELECT COALESCE(SUM(CASE WHEN attempts > ? THEN games END), 0), "
+            "COALESCE(SUM(games), 0) FROM attempts_histogram "
+            "WHERE min_range = ? AND max_range = ?",
+            (attempts, str(min_range), str(max_range))).fetchone()
+        return 100.0 * worse / total if total else 100.0
+    
+    def player_percentile(self, player, min_range=1, max_range=100):
+        # Percentile of the player's best game, or None if they have none
+        row = self.connection.execute(
+            "SELECT MIN(attempts) FROM games "
+            "WHERE player = ? AND min_range = ? AND max_range = ?",
+            (player, str(min_range), str(max_range))).fetchone()
+        if row[0] is None:
+            return None
+        return self.percentile(row[0], min_range, max_range)
+    
+    def close(self):
+        self.connection.close()
+
+
+def display_leaderboard(leaderboard, k=10, min_range=1, max_range=100):
+    print("="*60)
+    print(f"          LEADERBOARD ({min_range}-{max_range})")
+    print("="*60)
+    rows = leaderboard.top(k, min_range, max_range)
+    if not rows:
+        print("No games recorded yet.")
+    for rank, (player, attempts, played_at) in enumerate(rows, 1):
+        played = time.strftime('%Y-%m-%d', time.localtime(played_at))
+        print(f"{rank:>3}. {player:<25} {attempts:>4} attempts   {played}")
+    print("="*60 + "\n")
+
+
+def format_feedback(feedback, session):
+    # Line protocol encoding of classify_guess's result
+    if feedback == 'correct':
+        return f"CORRECT {session.attempts}"
+    if feedback == 'out_of_range':
+        return f"OUT_OF_RANGE {session.min_range} {session.max_range}"
+    direction, band = feedback
+    return f"{direction.upper()} {band.upper()}"
+
+
+def parse_feedback(line):
+    # Inverse of format_feedback, used by clients
+    words = line.split()
+    if words[0] == 'CORRECT':
+        return 'correct'
+    if words[0] == 'OUT_OF_RANGE':
+        return 'out_of_range'
+    return (words[0].lower(), words[1].lower())
+
+
+async def handle_game_client(reader, writer, min_range=1, max_range=100):
+    # One coroutine per connection; the session is the only per-player state.
+    # Protocol: the server sends "RANGE <min> <max>", the client sends one
+    # guess per line and gets feedback, "NEW" starts over, "QUIT" disconnects.
+    session = GameSession(min_range, max_range)
+    writer.write(f"RANGE {min_range} {max_range}\n".encode())
+    
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except (ValueError, asyncio.LimitOverrunError):
+                # Longer than the stream limit (64 KiB): the rest of the
+                # line cannot be resynchronised, so give up on the client
+                writer.write(b"ERROR line too long\n")
+                await writer.drain()
+                break
+            if not line:
+                break
+            
+            command = line.strip().upper()
+            if command == b'QUIT':
+                break
+            if command == b'NEW':
+                session = GameSession(min_range, max_range)
+                writer.write(f"RANGE {min_range} {max_range}\n".encode())
+                continue
+            
+            try:
+                value = int(command)
+            except ValueError:
+                writer.write(b"ERROR expected a whole number\n")
+                continue
+            
+            feedback = session.guess(value)
+            writer.write((format_feedback(feedback, session) + "\n").encode())
+            
+            if session.won:
+                session = GameSession(min_range, max_range)
+                writer.write(f"RANGE {min_range} {max_range}\n".encode())
+            
+            # Only wait for the socket when its buffer is actually filling up
+            if writer.transport.get_write_buffer_size() > 65536:
+                await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def start_game_server(host='127.0.0.1', port=8765, min_range=1, max_range=100):
+    async def handler(reader, writer):
+        await handle_game_client(reader, writer, min_range, max_range)
+    return await asyncio.start_server(handler, host, port, backlog=4096)
+
+
+async def serve_forever(host='127.0.0.1', port=8765, min_range=1, max_range=100):
+    server = await start_game_server(host, port, min_range, max_range)
+    address = server.sockets[0].getsockname()
+    print(f"🎮 Guessing game server listening on {address[0]}:{address[1]}")
+    async with server:
+        await server.serve_forever()
+
+
+async def _simulated_client(host, port, games, player_name):
+    # Plays complete games against the server with one of the PLAYERS
+    reader, writer = await asyncio.open_connection(host, port)
+    player = PLAYERS[player_name]()
+    requests = 0
+    
+    try:
+        for _ in range(games):
+            words = (await reader.readline()).split()
+            player.reset(int(words[1]), int(words[2]))
+            while True:
+                guess = player.next_guess()
+                writer.write(f"{guess}\n".encode())
+                requests += 1
+                feedback = parse_feedback((await reader.readline()).decode())
+                if feedback == 'correct':
+                    break
+                player.observe(guess, feedback)
+        writer.write(b"QUIT\n")
+        await writer.drain()
+    finally:
+        writer.close()
+    
+    return requests
+
+
+async def run_load_test(clients=1000, games_per_client=10, player_name='binary',
+                        host=None, port=8765):
+    # Without a host an in-process server on an ephemeral port is started
+    server = None
+    if host is None:
+        server = await start_game_server('127.0.0.1', 0)
+        host, port = server.sockets[0].getsockname()[:2]
+    
+    try:
+        start = time.perf_counter()
+        requests = await asyncio.gather(*(
+            _simulated_client(host, port, games_per_client, player_name)
+            for _ in range(clients)
+        ))
+        elapsed = time.perf_counter() - start
+    finally:
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+    
+    games = clients * games_per_client
+    print("="*60)
+    print("               LOAD TEST RESULTS")
+    print("="*60)
+    print(f"Concurrent clients: {clients:,}")
+    print(f"Games played: {games:,}")
+    print(f"Guesses handled: {sum(requests):,}")
+    print(f"Elapsed: {elapsed:.2f} s")
+    print(f"Guesses per second: {sum(requests) / elapsed:,.0f}")
+    print(f"Games per second: {games / elapsed:,.0f}")
+    print("="*60 + "\n")
+    
+    return {'clients': clients, 'games': games, 'requests': sum(requests), 'elapsed': elapsed}
+
+
+def parse_command_line(argv=None):
+    parser = argparse.ArgumentParser(description="Number guessing game.")
+    parser.add_argument('--min', dest='min_range', type=int, default=1,
+                        help="lowest possible number (default: 1)")
+    parser.add_argument('--max', dest='max_range', type=int, default=100,
+                        help="highest possible number (default: 100, up to 64-bit)")
+    parser.add_argument('--leaderboard', metavar='FILE',
+                        help="record results in the SQLite leaderboard FILE")
+    parser.add_argument('--top', type=int, metavar='K',
+                        help="show the top K games from --leaderboard and exit")
+    parser.add_argument('--simulate', type=int, metavar='GAMES',
+                        help="play GAMES headless games and report the results")
+    parser.add_argument('--player', choices=sorted(PLAYERS), default='bands',
+                        help="strategy used by --simulate (default: bands)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="processes used by --simulate (default: all cores)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="seed for reproducible games and simulations")
+    parser.add_argument('--log', metavar='FILE',
+                        help="append a replay record of every game to FILE")
+    parser.add_argument('--replay', metavar='FILE',
+                        help="replay every session recorded in FILE")
+    parser.add_argument('--serve', action='store_true',
+                        help="run the game as a line-protocol TCP server")
+    parser.add_argument('--host', default='127.0.0.1',
+                        help="address for --serve (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8765,
+                        help="port for --serve (default: 8765)")
+    parser.add_argument('--load-test', type=int, metavar='CLIENTS',
+                        help="play against an in-process server with CLIENTS simulated players")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_command_line()
+    
+    try:
+        validate_range(args.min_range, args.max_range)
+    except ValueError as e:
+        raise SystemExit(f"❌ {e}")
+    
+    leaderboard = Leaderboard(args.leaderboard) if args.leaderboard else None
+    
+    if args.top:
+        if leaderboard is None:
+            raise SystemExit("❌ --top needs --leaderboard FILE")
+        display_leaderboard(leaderboard, args.top, args.min_range, args.max_range)
+    elif args.simulate:
+        start = time.perf_counter()
+        results = simulate_games(args.player, args.simulate, args.min_range, args.max_range,
+                                 workers=args.workers, seed=args.seed)
+        display_simulation_results(args.player, results, time.perf_counter() - start)
+    elif args.serve:
+        try:
+            asyncio.run(serve_forever(args.host, args.port, args.min_range, args.max_range))
+        except KeyboardInterrupt:
+            print("\n👋 Server stopped.")
+    elif args.load_test:
+        asyncio.run(run_load_test(args.load_test, player_name=args.player))
+    elif args.replay:
+        with open(args.replay, encoding='utf-8') as log_file:
+            for line in log_file:
+                if line.strip():
+                    display_replay(line)
+    else:
+        main(args.seed, args.log, args.min_range, args.max_range, leaderboard)
+    
+    if leaderboard is not None:
+        leaderboard.close()
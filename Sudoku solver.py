@@ -1,3 +1,13 @@
+import itertools
+import os
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:  # the batch solver falls back to pure Python
+    np = None
+
+
 def print_grid(grid):
     print("\n" + "=" * 37)
     for i in range(9):
@@ -104,6 +114,435 @@ def solve_sudoku(grid):
     return False
 
 
+# Canonical forms: puzzles that are the same up to relabeling the digits,
+# swapping rows within a band, swapping bands, the same for columns and
+# stacks, and transposing all map to one 81-character key, so a solution
+# cache can answer every one of them after solving the first.
+
+PERMUTATIONS_OF_3 = list(itertools.permutations(range(3)))
+
+# Give up on puzzles whose clue pattern is so symmetric (e.g. almost empty)
+# that too many transformations tie for the canonical form
+CANONICAL_CANDIDATE_LIMIT = 20000
+
+
+def _tie_orders(items, key):
+    # Every ordering of items sorted by key (items with equal keys in any order)
+    groups = []
+    for item in sorted(items, key=key):
+        if groups and key(groups[-1][0]) == key(item):
+            groups[-1].append(item)
+        else:
+            groups.append([item])
+    return [list(itertools.chain.from_iterable(choice)) for choice in
+            itertools.product(*(list(itertools.permutations(group)) for group in groups))]
+
+
+def canonical_form(grid):
+    # Returns (key, transform) where key is the canonical puzzle as a string
+    # ('0' = empty) and transform maps grid onto it, or None if there are too
+    # many equally good transformations.
+    #
+    # The canonical puzzle is the smallest over all transformations when
+    # compared first by its pattern of clues and then by its digits. The
+    # pattern is minimized with bitmasks: for each of the 2 x 6 x 216 column
+    # arrangements the best row arrangement is found by sorting, since rows
+    # only move within bands and bands only move as a whole. Only the
+    # arrangements with the smallest pattern are then relabeled and compared.
+    best_pattern = None
+    arrangements = []
+    
+    for transposed in (False, True):
+        cells = [[grid[j][i] for j in range(9)] for i in range(9)] if transposed else grid
+        
+        # stack_bits[stack][perm][row]: the row's 3 clue bits in that stack
+        stack_bits = []
+        for stack in range(3):
+            per_perm = []
+            for perm in PERMUTATIONS_OF_3:
+                columns = [stack * 3 + k for k in perm]
+                per_perm.append([(cells[row][columns[0]] != 0) << 2 |
+                                 (cells[row][columns[1]] != 0) << 1 |
+                                 (cells[row][columns[2]] != 0) for row in range(9)])
+            stack_bits.append(per_perm)
+        
+        for stack_order in PERMUTATIONS_OF_3:
+            first, second, third = (stack_bits[stack] for stack in stack_order)
+            for perm_a in range(6):
+                bits_a = first[perm_a]
+                for perm_b in range(6):
+                    bits_ab = [a << 6 | b << 3 for a, b in zip(bits_a, second[perm_b])]
+                    for perm_c in range(6):
+                        masks = [ab | c for ab, c in zip(bits_ab, third[perm_c])]
+                        pattern = sorted([sorted(masks[0:3]), sorted(masks[3:6]), sorted(masks[6:9])])
+                        if best_pattern is None or pattern < best_pattern:
+                            best_pattern = pattern
+                            arrangements = []
+                        if pattern == best_pattern:
+                            arrangements.append((transposed, stack_order, (perm_a, perm_b, perm_c), masks))
+    
+    # Expand the best arrangements into full row and column orders
+    candidates = []
+    for transposed, stack_order, perms, masks in arrangements:
+        columns = [stack * 3 + k for stack, perm in zip(stack_order, perms)
+                   for k in PERMUTATIONS_OF_3[perm]]
+        band_key = lambda band: sorted(masks[band * 3:band * 3 + 3])
+        for band_order in _tie_orders(range(3), band_key):
+            row_choices = [_tie_orders(range(band * 3, band * 3 + 3), masks.__getitem__)
+                           for band in band_order]
+            for rows in itertools.product(*row_choices):
+                candidates.append((transposed, [row for band in rows for row in band], columns))
+                if len(candidates) > CANONICAL_CANDIDATE_LIMIT:
+                    return None
+    
+    # Relabel digits in order of first appearance and keep the smallest
+    best = None
+    for transposed, rows, columns in candidates:
+        labels = {0: 0}
+        digits = []
+        for row in rows:
+            for column in columns:
+                value = grid[column][row] if transposed else grid[row][column]
+                if value not in labels:
+                    labels[value] = len(labels)
+                digits.append(labels[value])
+        if best is None or digits < best[0]:
+            best = (digits, transposed, rows, columns, labels)
+    
+    digits, transposed, rows, columns, labels = best
+    # Digits that are not in the puzzle get the remaining labels
+    for value in range(1, 10):
+        if value not in labels:
+            labels[value] = len(labels)
+    
+    key = "".join(map(str, digits))
+    return key, (transposed, rows, columns, labels)
+
+
+def apply_transform(grid, transform):
+    transposed, rows, columns, labels = transform
+    if transposed:
+        return [[labels[grid[column][row]] for column in columns] for row in rows]
+    return [[labels[grid[row][column]] for column in columns] for row in rows]
+
+
+def undo_transform(grid, transform):
+    transposed, rows, columns, labels = transform
+    originals = {label: value for value, label in labels.items()}
+    result = [[0] * 9 for _ in range(9)]
+    for i, row in enumerate(rows):
+        for j, column in enumerate(columns):
+            if transposed:
+                result[column][row] = originals[grid[i][j]]
+            else:
+                result[row][column] = originals[grid[i][j]]
+    return result
+
+
+def grid_to_string(grid):
+    return "".join(str(value) for row in grid for value in row)
+
+
+def string_to_grid(text):
+    return [[int(char) for char in text[row * 9:row * 9 + 9]] for row in range(9)]
+
+
+class SolutionCache:
+    # Solutions keyed by canonical form, least recently used evicted first.
+    # Saved as one "<puzzle> <solution>" line per entry ('-' = no solution),
+    # oldest first, so loading restores the LRU order.
+    
+    def __init__(self, path=None, capacity=10000):
+        self.path = path
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if path is not None and os.path.exists(path):
+            self.load()
+    
+    def load(self):
+        with open(self.path, encoding='ascii') as cache_file:
+            for line in cache_file:
+                parts = line.split()
+                if len(parts) == 2 and len(parts[0]) == 81:
+                    self.store(parts[0], None if parts[1] == '-' else parts[1])
+    
+    def save(self):
+        if self.path is None:
+            return
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='ascii') as cache_file:
+            for key, solution in self.entries.items():
+                cache_file.write(f"{key} {solution or '-'}\n")
+        os.replace(temp_path, self.path)
+    
+    def lookup(self, key):
+        # Returns (found, solution string or None if unsolvable)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, self.entries[key]
+        self.misses += 1
+        return False, None
+    
+    def store(self, key, solution):
+        self.entries[key] = solution
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+    
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def solve_sudoku_cached(grid, cache):
+    # Same contract as solve_sudoku (solves grid in place), but equivalent
+    # puzzles are only solved once and later ones are mapped from the cache
+    form = canonical_form(grid)
+    if form is None:
+        return solve_sudoku(grid)
+    key, transform = form
+    
+    found, solution = cache.lookup(key)
+    if found:
+        if solution is None:
+            return False
+        solved = undo_transform(string_to_grid(solution), transform)
+        for i in range(9):
+            grid[i][:] = solved[i]
+        return True
+    
+    if solve_sudoku(grid):
+        cache.store(key, grid_to_string(apply_transform(grid, transform)))
+        return True
+    cache.store(key, None)
+    return False
+
+
+# Batch solving: candidates are 9-bit sets (bit d-1 = digit d is possible).
+# Constraint propagation (naked and hidden singles) runs on whole batches
+# at once; only grids it cannot finish go to the backtracking solver.
+
+ALL_CANDIDATES = 0x1FF
+
+UNITS = ([[row * 9 + col for col in range(9)] for row in range(9)] +
+         [[row * 9 + col for row in range(9)] for col in range(9)] +
+         [[(box // 3 * 3 + i // 3) * 9 + box % 3 * 3 + i % 3 for i in range(9)] for box in range(9)])
+
+# The row, column and box unit of every cell
+CELL_UNITS = [[cell // 9, 9 + cell % 9, 18 + cell // 27 * 3 + cell % 9 // 3] for cell in range(81)]
+
+# Digit of a single-candidate bitset (0 if the set has several or no bits)
+BIT_DIGITS = [0] * 512
+for digit in range(1, 10):
+    BIT_DIGITS[1 << (digit - 1)] = digit
+
+BIT_COUNTS = [bin(bits).count("1") for bits in range(512)]
+
+
+def _propagate_grid(candidates):
+    # Pure Python propagation of one grid's 81 candidate sets, in place.
+    # Returns False on a contradiction.
+    changed = True
+    while changed:
+        changed = False
+        
+        # Naked singles: a solved cell's digit is removed from its peers
+        for unit in UNITS:
+            seen = 0
+            for cell in unit:
+                bits = candidates[cell]
+                if BIT_COUNTS[bits] == 1:
+                    if seen & bits:
+                        return False
+                    seen |= bits
+            for cell in unit:
+                bits = candidates[cell]
+                if BIT_COUNTS[bits] > 1 and bits & seen:
+                    bits &= ~seen
+                    if not bits:
+                        return False
+                    candidates[cell] = bits
+                    changed = True
+        
+        # Hidden singles: a digit with only one place left in a unit goes there
+        for unit in UNITS:
+            once = twice = 0
+            for cell in unit:
+                twice |= once & candidates[cell]
+                once |= candidates[cell]
+            if once != ALL_CANDIDATES:
+                return False
+            exactly_once = once & ~twice
+            if exactly_once:
+                for cell in unit:
+                    hidden = candidates[cell] & exactly_once
+                    if hidden and hidden != candidates[cell]:
+                        if BIT_COUNTS[hidden] > 1:
+                            return False
+                        candidates[cell] = hidden
+                        changed = True
+    return True
+
+
+def _search_grid(candidates):
+    # Backtracking over candidate sets for grids propagation could not
+    # finish: guess a digit for the cell with the fewest candidates and
+    # propagate again. Returns the solved candidates or None.
+    if not _propagate_grid(candidates):
+        return None
+    
+    best_cell, best_count = None, 10
+    for cell, bits in enumerate(candidates):
+        count = BIT_COUNTS[bits]
+        if 1 < count < best_count:
+            best_cell, best_count = cell, count
+            if count == 2:
+                break
+    if best_cell is None:
+        return candidates
+    
+    bits = candidates[best_cell]
+    while bits:
+        bit = bits & -bits
+        bits ^= bit
+        guess = candidates[:]
+        guess[best_cell] = bit
+        solved = _search_grid(guess)
+        if solved is not None:
+            return solved
+    return None
+
+
+def _propagate_batch(candidates):
+    # NumPy propagation of an (N, 81) uint16 candidate array, all grids in
+    # lockstep until none changes. Returns a boolean array of failed grids.
+    units = np.array(UNITS)
+    cell_units = np.array(CELL_UNITS)
+    bit_counts = np.array(BIT_COUNTS, dtype=np.uint8)
+    failed = np.zeros(len(candidates), dtype=bool)
+    active = np.arange(len(candidates))
+    
+    while active.size:
+        before = candidates[active]
+        
+        # Naked singles
+        single = bit_counts[before] == 1
+        solved_bits = np.where(single, before, 0).astype(np.uint16)
+        unit_solved = np.bitwise_or.reduce(solved_bits[:, units], axis=2)
+        duplicate = (single[:, units].sum(axis=2) != bit_counts[unit_solved]).any(axis=1)
+        peers_solved = np.bitwise_or.reduce(unit_solved[:, cell_units], axis=2)
+        after = np.where(single, before, before & ~peers_solved).astype(np.uint16)
+        
+        # Hidden singles
+        unit_candidates = after[:, units]
+        once = np.zeros(unit_candidates.shape[:2], dtype=np.uint16)
+        twice = np.zeros_like(once)
+        for k in range(9):
+            twice |= once & unit_candidates[:, :, k]
+            once |= unit_candidates[:, :, k]
+        missing_digit = (once != ALL_CANDIDATES).any(axis=1)
+        exactly_once = once & ~twice
+        hidden = np.bitwise_or.reduce(after[:, :, None] & exactly_once[:, cell_units], axis=2)
+        two_places = (bit_counts[hidden] > 1).any(axis=1)
+        after = np.where(hidden != 0, hidden, after).astype(np.uint16)
+        
+        broken = duplicate | missing_digit | two_places | (after == 0).any(axis=1)
+        changed = (after != before).any(axis=1)
+        candidates[active] = after
+        failed[active[broken]] = True
+        active = active[changed & ~broken]
+    
+    return failed
+
+
+def _search_batch(candidates, failed):
+    # Lockstep backtracking for the grids propagation left open: every open
+    # grid guesses the lowest digit of its cell with the fewest candidates,
+    # keeping the other digits on its own stack, then all guesses are
+    # propagated together. A grid that fails resumes from its stack.
+    # Solutions are written into candidates; failed is updated in place.
+    bit_counts = np.array(BIT_COUNTS, dtype=np.uint8)
+    owners = np.flatnonzero(~failed & (bit_counts[candidates] > 1).any(axis=1))
+    work = candidates[owners]
+    stacks = [[] for _ in owners]
+    
+    while len(work):
+        broken = _propagate_batch(work)
+        counts = bit_counts[work]
+        solved = ~broken & (counts == 1).all(axis=1)
+        candidates[owners[solved]] = work[solved]
+        
+        keep = []
+        for row in np.flatnonzero(broken).tolist():
+            if stacks[row]:
+                work[row] = stacks[row].pop()
+                keep.append(row)
+            else:
+                failed[owners[row]] = True
+        
+        guessing = np.flatnonzero(~broken & ~solved)
+        if guessing.size:
+            open_counts = np.where(counts[guessing] > 1, counts[guessing], 10)
+            cells = open_counts.argmin(axis=1)
+            bits = work[guessing, cells]
+            lowest = bits & ~(bits - 1)
+            alternatives = work[guessing]
+            alternatives[np.arange(len(guessing)), cells] = bits & ~lowest
+            for row, alternative in zip(guessing.tolist(), alternatives):
+                stacks[row].append(alternative)
+            work[guessing, cells] = lowest
+            keep.extend(guessing.tolist())
+        
+        keep.sort()
+        work = work[keep]
+        owners = owners[keep]
+        stacks = [stacks[row] for row in keep]
+
+
+def solve_sudoku_batch(grids, chunk_size=8192):
+    # Solves every grid in place like solve_sudoku and returns a list of
+    # True/False. Uses NumPy when it is installed, pure Python otherwise.
+    results = []
+    for start in range(0, len(grids), chunk_size):
+        chunk = grids[start:start + chunk_size]
+        
+        if np is not None:
+            values = np.array(chunk, dtype=np.int64).reshape(len(chunk), 81)
+            candidates = np.where(values > 0, np.left_shift(1, np.maximum(values - 1, 0)),
+                                  ALL_CANDIDATES).astype(np.uint16)
+            failed = _propagate_batch(candidates)
+            _search_batch(candidates, failed)
+            failed = failed.tolist()
+            candidates = candidates.tolist()
+        else:
+            failed = []
+            candidates = []
+            for grid in chunk:
+                grid_candidates = [1 << (value - 1) if value else ALL_CANDIDATES
+                                   for row in grid for value in row]
+                failed.append(not _propagate_grid(grid_candidates))
+                candidates.append(grid_candidates)
+        
+        for grid, grid_failed, grid_candidates in zip(chunk, failed, candidates):
+            # Without NumPy, grids that still have open cells are searched here
+            if not grid_failed and any(BIT_COUNTS[bits] > 1 for bits in grid_candidates):
+                grid_candidates = _search_grid(grid_candidates)
+                grid_failed = grid_candidates is None
+            
+            # The grid is left untouched when there is no solution
+            if grid_failed:
+                results.append(False)
+                continue
+            for i in range(9):
+                grid[i][:] = [BIT_DIGITS[bits] for bits in grid_candidates[i * 9:i * 9 + 9]]
+            results.append(True)
+    
+    return results
+
+
 def main():
     print("=" * 50)
     print("SUDOKU SOLVER - BACKTRACKING ALGORITHM")
@@ -1,5 +1,29 @@
 import csv
+import contextlib
+import gzip
+import hashlib
+import heapq
+import io
+import json
+import math
+import mmap
 import os
+import re
+import sqlite3
+import struct
+import sys
+import time
+from array import array
+from collections import namedtuple
+from functools import partial
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+# pyarrow is optional; it is only needed for Parquet output
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
 
 
 # Simulated HTML content representing an e-commerce product page
@@ -81,94 +105,1338 @@ def extract_text_between_tags(html, start_tag, end_tag):
         return ""
 
 
-def parse_products(html):
+def _find_in_view(view, sub, start=0):
+    # bytes.find() for a memoryview, which has no find() of its own; re
+    # searches the buffer in place instead of copying it
+    match = re.compile(re.escape(sub)).search(view, start)
+    return -1 if match is None else match.start()
+
+
+def extract_bytes_between_tags(data, start_tag, end_tag):
     """
-    Parse all product information from the HTML string.
+    Extract text content between HTML tags of a raw UTF-8 page.
+    
+    Same result as extract_text_between_tags on the decoded page, but the
+    page is searched in place (bytes, bytearray, mmap or memoryview) and
+    only the extracted value is decoded.
     
     Args:
-        html (str): The complete HTML document as a string
+        data: The UTF-8 page
+        start_tag (str): The opening HTML tag (e.g., '<span class="price">')
+        end_tag (str): The closing HTML tag (e.g., '</span>')
     
     Returns:
-        list: A list of dictionaries, each containing product information
+        str: The extracted text, or empty string if not found
+    """
+    find = data.find if not isinstance(data, memoryview) else partial(_find_in_view, data)
+    
+    # Find the position where the start tag ends
+    start_pos = find(start_tag.encode('utf-8'))
+    if start_pos == -1:
+        return ""
+    
+    # Move position to after the '>' that ends the start tag
+    start_pos = find(b'>', start_pos) + 1
+    
+    end_pos = find(end_tag.encode('utf-8'), start_pos)
+    if end_pos == -1:
+        return ""
+    
+    # Decode just the value, then strip it exactly as the str path does
+    with memoryview(data) as view, view.cast('B') as raw:
+        return str(raw[start_pos:end_pos], 'utf-8', 'replace').strip()
+
+
+# One field of an extraction schema: the text between ``start_tag`` and
+# ``end_tag`` is stripped and passed through ``converter`` (if any); when the
+# tag is absent or empty the field gets ``default`` instead.
+ExtractionField = namedtuple(
+    'ExtractionField',
+    ['name', 'start_tag', 'end_tag', 'converter', 'default'],
+    defaults=[None, "N/A"]
+)
+
+
+class ExtractionSchema:
     """
-    products = []
+    Declarative description of the fields to pull out of each product block.
     
-    # Split HTML by product divs to process each product separately
-    # We look for '<div class="product">' as the delimiter
-    product_sections = html.split('<div class="product">')
+    All field selectors are compiled once into a single regular expression
+    (one named alternative per field), so every field of a block is found
+    in one left-to-right scan instead of one scan per field. As with
+    extract_text_between_tags, the first occurrence of each field wins.
+    """
     
-    # Skip the first element (it's the content before the first product)
-    for section in product_sections[1:]:
-        product_data = {}
+    def __init__(self, fields, block_tag='<div class="product">',
+                 required=('name',)):
+        """
+        Args:
+            fields (list): ExtractionField entries describing each field
+            block_tag (str): Tag that starts every product block
+            required (tuple): Fields that must be present to keep a product
+        """
+        self.fields = list(fields)
+        self.block_tag = block_tag
+        self.required = tuple(required)
         
-        # Extract product name from <h2 class="product-name"> tag
-        product_name = extract_text_between_tags(
-            section, 
-            '<h2 class="product-name">', 
-            '</h2>'
+        # Factor the prefix shared by all start tags (usually '<') out of the
+        # alternation so the regex engine only tries the alternatives at
+        # candidate positions. Group names must be identifiers, so fields
+        # are referred to by index.
+        prefix = os.path.commonprefix([field.start_tag for field in self.fields])
+        alternatives = []
+        for index, field in enumerate(self.fields):
+            alternatives.append(
+                f"{re.escape(field.start_tag[len(prefix):])}"
+                f"(?P<f{index}>.*?){re.escape(field.end_tag)}"
+            )
+        self.pattern = re.compile(
+            f"{re.escape(prefix)}(?:{'|'.join(alternatives)})", re.DOTALL
         )
         
-        # Extract price from <span class="price"> tag
-        price = extract_text_between_tags(
-            section, 
-            '<span class="price">', 
-            '</span>'
+        # The same selectors for raw UTF-8 pages (see iter_records_bytes)
+        byte_alternatives = []
+        for index, field in enumerate(self.fields):
+            byte_alternatives.append(
+                re.escape(field.start_tag[len(prefix):].encode('utf-8'))
+                + b"(.*?)" + re.escape(field.end_tag.encode('utf-8'))
+            )
+        self.byte_pattern = re.compile(
+            re.escape(prefix.encode('utf-8'))
+            + b"(?:" + b"|".join(byte_alternatives) + b")", re.DOTALL
         )
+        self.byte_block_pattern = re.compile(re.escape(block_tag.encode('utf-8')))
+        # Map regex group numbers (1-based) back to their fields
+        self._group_fields = {index + 1: field
+                              for index, field in enumerate(self.fields)}
+        self._required_defaults = {field.name: field.default
+                                   for field in self.fields
+                                   if field.name in self.required}
+    
+    def _has_required(self, record):
+        """Return True if no required field fell back to its default."""
+        return all(record[name] != default
+                   for name, default in self._required_defaults.items())
+    
+    def extract(self, block):
+        """
+        Extract every schema field from a single product block.
         
-        # Extract rating from <span class="rating"> tag
-        rating = extract_text_between_tags(
-            section, 
-            '<span class="rating">', 
-            '</span>'
-        )
+        Args:
+            block (str): HTML of one product
+        
+        Returns:
+            dict: Field name to converted value (or the field's default)
+        """
+        found = {}
+        group_fields = self._group_fields
+        
+        for match in self.pattern.finditer(block):
+            index = match.lastindex
+            name = group_fields[index].name
+            if name not in found:
+                found[name] = match.group(index)
+                if len(found) == len(group_fields):
+                    break
         
-        # Store extracted data with proper handling of missing values
-        product_data['name'] = product_name if product_name else "N/A"
-        product_data['price'] = price if price else "N/A"
-        product_data['rating'] = rating if rating else "N/A"
+        record = {}
+        for field in self.fields:
+            text = found.get(field.name)
+            if text:
+                text = text.strip()
+            if not text:
+                record[field.name] = field.default
+            elif field.converter is not None:
+                record[field.name] = field.converter(text)
+            else:
+                record[field.name] = text
+        return record
+    
+    def iter_records(self, html):
+        """
+        Yield one record per product block that has all required fields.
+        
+        Args:
+            html (str): The complete HTML document as a string
+        """
+        # Skip the first element (it's the content before the first product)
+        for block in html.split(self.block_tag)[1:]:
+            record = self.extract(block)
+            if self._has_required(record):
+                yield record
+    
+    def extract_span(self, data, start, end, view=None):
+        """
+        Extract every schema field from one product block of a raw page.
+        
+        Only offsets are tracked while scanning; each field value is
+        then decoded straight from its span of the buffer.
+        
+        Args:
+            data: UTF-8 page as bytes, bytearray, mmap or memoryview
+            start (int): Offset where the block starts
+            end (int): Offset where the block ends
+            view (memoryview): Byte view of data, when the caller has one
+        
+        Returns:
+            dict: Field name to converted value (or the field's default)
+        """
+        if view is None:
+            with memoryview(data) as view:
+                return self.extract_span(data, start, end, view.cast('B'))
+        
+        spans = {}
+        group_fields = self._group_fields
         
-        # Only add product if at least the name was found
-        if product_data['name'] != "N/A":
-            products.append(product_data)
+        for match in self.byte_pattern.finditer(data, start, end):
+            index = match.lastindex
+            if index not in spans:
+                spans[index] = match.span(index)
+                if len(spans) == len(group_fields):
+                    break
+        
+        record = {}
+        for index, field in group_fields.items():
+            span = spans.get(index)
+            text = str(view[span[0]:span[1]], 'utf-8', 'replace').strip() if span else ""
+            if not text:
+                record[field.name] = field.default
+            elif field.converter is not None:
+                record[field.name] = field.converter(text)
+            else:
+                record[field.name] = text
+        return record
+    
+    def iter_records_bytes(self, data):
+        """
+        Yield one record per product block of a raw UTF-8 page.
+        
+        Works on bytes, an mmap or a memoryview without decoding or
+        splitting the page: blocks and fields are located as offsets and
+        only the emitted values become str objects. Produces the same
+        records as iter_records on the decoded page.
+        
+        Args:
+            data: UTF-8 page as bytes, bytearray, mmap or memoryview
+        """
+        with memoryview(data) as view:
+            view = view.cast('B')
+            start = None
+            for match in self.byte_block_pattern.finditer(data):
+                if start is not None:
+                    record = self.extract_span(data, start, match.start(), view)
+                    if self._has_required(record):
+                        yield record
+                start = match.end()
+            
+            if start is not None:
+                record = self.extract_span(data, start, len(view), view)
+                if self._has_required(record):
+                    yield record
+
+
+# Schema for the product cards on the TechStore page
+PRODUCT_SCHEMA = ExtractionSchema([
+    ExtractionField('name', '<h2 class="product-name">', '</h2>'),
+    ExtractionField('price', '<span class="price">', '</span>'),
+    ExtractionField('rating', '<span class="rating">', '</span>'),
+])
+
+
+def parse_products(html, schema=PRODUCT_SCHEMA):
+    """
+    Parse all product information from the HTML string.
+    
+    Args:
+        html (str or bytes-like): The complete HTML document, either as a
+            string or as raw UTF-8 (bytes, mmap or memoryview), which is
+            parsed without decoding the whole page
+        schema (ExtractionSchema): Fields to extract from each product
     
-    return products
+    Returns:
+        list: A list of dictionaries, each containing product information
+    """
+    if isinstance(html, str):
+        return list(schema.iter_records(html))
+    return list(schema.iter_records_bytes(html))
 
 
-def save_to_csv(products, filename='products.csv'):
+def parse_products_file(filename, schema=PRODUCT_SCHEMA):
+    """
+    Parse the products of a saved UTF-8 page through a memory map.
+    
+    The page is never read into memory as a whole; the operating system
+    pages it in as the scan proceeds.
+    
+    Args:
+        filename (str): Path of the HTML file
+        schema (ExtractionSchema): Fields to extract from each product
+    
+    Returns:
+        list: A list of dictionaries, each containing product information
+    """
+    with open(filename, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return list(schema.iter_records_bytes(data))
+
+
+# Column order used for every CSV file written by this program
+CSV_FIELDNAMES = ['name', 'price', 'rating']
+
+
+class StreamingCSVWriter:
+    """
+    Write products to CSV in buffered batches without holding them in memory.
+    
+    Rows are collected into a small buffer and written out once the buffer
+    reaches ``batch_size``. When ``max_rows`` or ``max_bytes`` is set the
+    output is rotated into numbered parts (products.csv, products.1.csv,
+    products.2.csv, ...); without ``append``, parts left by an earlier run
+    are removed first. Byte-based rotation is checked after every batch,
+    so a part may overshoot ``max_bytes`` by at most one batch.
+    
+    Usage:
+        with StreamingCSVWriter('products.csv', append=True) as writer:
+            writer.write_many(product_iterator)
+    """
+    
+    def __init__(self, filename, fieldnames=None, append=False,
+                 batch_size=1000, max_rows=None, max_bytes=None,
+                 compress=False):
+        """
+        Args:
+            filename (str): Base name of the CSV file to write
+            fieldnames (list): Column names (defaults to CSV_FIELDNAMES)
+            append (bool): Append to existing output instead of overwriting
+            batch_size (int): Number of rows buffered before each write
+            max_rows (int): Rotate to a new part after this many rows
+            max_bytes (int): Rotate to a new part after this many bytes
+            compress (bool): Write gzip-compressed output ('.gz' is added)
+        """
+        if compress and not filename.endswith('.gz'):
+            filename += '.gz'
+        
+        self.filename = filename
+        self.fieldnames = list(fieldnames or CSV_FIELDNAMES)
+        self.append = append
+        self.batch_size = max(1, batch_size)
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.compress = compress
+        
+        self.total_rows = 0
+        self.paths = []
+        
+        self._buffer = []
+        self._file = None
+        self._part = 0
+        self._rows_in_part = 0
+        self._bytes_in_part = 0
+        
+        # In append mode continue writing into the newest existing part;
+        # otherwise remove the numbered parts of an earlier run, so they
+        # are not mistaken for part of this output
+        if append and (max_rows or max_bytes):
+            while os.path.exists(self._part_path(self._part + 1)):
+                self._part += 1
+        elif not append:
+            part = 1
+            while os.path.exists(self._part_path(part)):
+                os.remove(self._part_path(part))
+                part += 1
+    
+    def _part_path(self, part):
+        """Return the file path for the given rotation part number."""
+        if part == 0:
+            return self.filename
+        
+        # Insert the part number before the extension(s): products.1.csv.gz
+        base, ext = self.filename, ''
+        if base.endswith('.gz'):
+            base, ext = base[:-3], '.gz'
+        base, csv_ext = os.path.splitext(base)
+        return f"{base}.{part}{csv_ext}{ext}"
+    
+    def _open_part(self):
+        """Open the current part file, writing a header if it is new."""
+        path = self._part_path(self._part)
+        existing_size = 0
+        if self.append and os.path.exists(path):
+            existing_size = os.path.getsize(path)
+        
+        mode = 'ab' if self.append else 'wb'
+        self._file = gzip.open(path, mode) if self.compress else open(path, mode)
+        self.paths.append(path)
+        
+        self._rows_in_part = 0
+        self._bytes_in_part = 0
+        
+        if existing_size:
+            # Count what is already on disk towards the rotation limits
+            # (for gzip output this is the compressed size, which is close
+            # enough to decide when to rotate)
+            self._bytes_in_part = existing_size
+            if self.max_rows:
+                self._rows_in_part = self._count_rows(path)
+        else:
+            self._write_rows([], header=True)
+    
+    def _count_rows(self, path):
+        """Count the data rows (excluding the header) in an existing part."""
+        opener = gzip.open if self.compress else open
+        with opener(path, 'rt', newline='', encoding='utf-8') as existing:
+            return max(0, sum(1 for _ in csv.reader(existing)) - 1)
+    
+    def _rotate(self):
+        """Close the current part and start the next one."""
+        self._file.close()
+        self._file = None
+        self._part += 1
+        self._rows_in_part = 0
+        self._bytes_in_part = 0
+        # A freshly rotated part never has previous content to append to
+        self.append = False
+    
+    def _write_rows(self, rows, header=False):
+        """Render rows to CSV text once and write the encoded bytes."""
+        text = io.StringIO()
+        writer = csv.DictWriter(text, fieldnames=self.fieldnames,
+                                extrasaction='ignore')
+        if header:
+            writer.writeheader()
+        writer.writerows(rows)
+        
+        data = text.getvalue().encode('utf-8')
+        self._file.write(data)
+        self._bytes_in_part += len(data)
+    
+    def _flush_buffer(self):
+        """Write out all buffered rows into the current part."""
+        if not self._buffer:
+            return
+        
+        self._write_rows(self._buffer)
+        self._rows_in_part += len(self._buffer)
+        self._buffer = []
+        
+        if self.max_bytes and self._bytes_in_part >= self.max_bytes:
+            self._rotate()
+    
+    def write(self, product):
+        """
+        Buffer a single product row, flushing and rotating when needed.
+        
+        Args:
+            product (dict): Product dictionary with the CSV fields
+        """
+        # Open the part before counting so appended rows are accounted for
+        if self._file is None:
+            self._open_part()
+        
+        self._buffer.append(product)
+        self.total_rows += 1
+        
+        if self.max_rows:
+            rows_in_part = self._rows_in_part + len(self._buffer)
+            if rows_in_part >= self.max_rows:
+                self._flush_buffer()
+                if self._file is not None:
+                    self._rotate()
+                return
+        
+        if len(self._buffer) >= self.batch_size:
+            self._flush_buffer()
+    
+    def write_many(self, products):
+        """
+        Stream every product from an iterable or generator to disk.
+        
+        Args:
+            products (iterable): Product dictionaries, consumed lazily
+        """
+        for product in products:
+            self.write(product)
+    
+    def close(self):
+        """Flush any buffered rows and close the open file."""
+        self._flush_buffer()
+        
+        # Make sure an empty run still produces a file with a header
+        if not self.paths:
+            self._open_part()
+        
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def save_to_csv(products, filename='products.csv', append=False,
+                batch_size=1000, max_rows=None, max_bytes=None,
+                compress=False):
     """
     Save the extracted product data to a CSV file.
     
+    Products are streamed through StreamingCSVWriter, so ``products`` may be
+    any iterable (including a generator) and never has to fit in memory.
+    
     Args:
-        products (list): List of product dictionaries
+        products (iterable): Product dictionaries to write
         filename (str): Name of the CSV file to create
+        append (bool): Append to an existing file instead of overwriting it
+        batch_size (int): Number of rows buffered before each write
+        max_rows (int): Rotate to a new numbered file after this many rows
+        max_bytes (int): Rotate to a new numbered file after this many bytes
+        compress (bool): Write gzip-compressed output
     
     Returns:
         bool: True if successful, False otherwise
     """
     try:
-        # Open file in write mode with proper encoding
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        with StreamingCSVWriter(filename, append=append,
+                                batch_size=batch_size, max_rows=max_rows,
+                                max_bytes=max_bytes,
+                                compress=compress) as writer:
+            writer.write_many(products)
+        
+        return True
+    
+    except Exception as e:
+        print(f"Error saving to CSV: {e}")
+        return False
+
+
+def parse_price(price):
+    """
+    Convert a scraped price string such as "$89.99" into a float.
+    
+    Args:
+        price (str): Price text as extracted from the HTML
+    
+    Returns:
+        float: The numeric price, or None if it is missing or malformed
+            (including "inf" and "nan")
+    """
+    if not price or price == "N/A":
+        return None
+    try:
+        value = float(price.replace('$', '').replace(',', ''))
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+def parse_rating(rating):
+    """
+    Convert a scraped rating string such as "4.5" into a float.
+    
+    Args:
+        rating (str): Rating text as extracted from the HTML
+    
+    Returns:
+        float: The numeric rating, or None if it is missing or malformed
+            (including "inf" and "nan")
+    """
+    if not rating or rating == "N/A":
+        return None
+    try:
+        value = float(rating)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+# Columnar file layout (all integers little-endian):
+#   header:  magic (6 bytes), row count (uint32)
+#   name:    dictionary size (uint32), dictionary entries as
+#            (uint32 length + UTF-8 bytes), then one uint32 code per row
+#   price:   one validity byte per row (1 = present), then one float64 per row
+#   rating:  one validity byte per row (1 = present), then one float64 per row
+COLUMNAR_MAGIC = b'PCOL1\0'
+
+
+def _write_float_column(file, values, mask):
+    """Write a validity mask followed by the raw float64 values."""
+    file.write(mask.tobytes())
+    if sys.byteorder == 'big':
+        values = array('d', values)
+        values.byteswap()
+    file.write(values.tobytes())
+
+
+def _read_float_column(data, offset, rows):
+    """Read a validity mask and float64 values starting at offset."""
+    mask = array('B', data[offset:offset + rows])
+    offset += rows
+    values = array('d')
+    values.frombytes(data[offset:offset + rows * 8])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values, mask, offset + rows * 8
+
+
+def save_to_columnar(products, filename='products.pcol'):
+    """
+    Save products in a compact, typed, column-oriented binary format.
+    
+    Prices and ratings are stored as float64 with a null mask instead of
+    strings like "$89.99" / "N/A", and names are dictionary-encoded so
+    repeated names are stored once. If the filename ends with '.parquet'
+    and pyarrow is installed, a Parquet file is written instead.
+    
+    Args:
+        products (iterable): Product dictionaries to write
+        filename (str): Name of the output file
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        # Build the typed columns in one pass over the products
+        name_codes = array('I')
+        dictionary = {}
+        prices, price_mask = array('d'), array('B')
+        ratings, rating_mask = array('d'), array('B')
+        
+        for product in products:
+            name = product.get('name', "N/A")
+            code = dictionary.get(name)
+            if code is None:
+                code = dictionary[name] = len(dictionary)
+            name_codes.append(code)
             
-            # Define CSV column headers
-            fieldnames = ['name', 'price', 'rating']
+            price = parse_price(product.get('price'))
+            prices.append(price if price is not None else 0.0)
+            price_mask.append(price is not None)
             
-            # Create a CSV writer object
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            rating = parse_rating(product.get('rating'))
+            ratings.append(rating if rating is not None else 0.0)
+            rating_mask.append(rating is not None)
+        
+        if filename.endswith('.parquet'):
+            if pyarrow is None:
+                print("Error saving columnar data: pyarrow is not installed")
+                return False
+            names = list(dictionary)
+            table = pyarrow.table({
+                'name': pyarrow.DictionaryArray.from_arrays(
+                    pyarrow.array(name_codes, type=pyarrow.uint32()),
+                    pyarrow.array(names, type=pyarrow.string())),
+                'price': pyarrow.array(
+                    prices, mask=[not valid for valid in price_mask]),
+                'rating': pyarrow.array(
+                    ratings, mask=[not valid for valid in rating_mask]),
+            })
+            pyarrow.parquet.write_table(table, filename)
+            return True
+        
+        with open(filename, 'wb') as file:
+            file.write(COLUMNAR_MAGIC)
+            file.write(struct.pack('<I', len(name_codes)))
             
-            # Write the header row
-            writer.writeheader()
+            # Dictionary-encoded name column
+            file.write(struct.pack('<I', len(dictionary)))
+            for name in dictionary:
+                encoded = name.encode('utf-8')
+                file.write(struct.pack('<I', len(encoded)))
+                file.write(encoded)
+            if sys.byteorder == 'big':
+                name_codes.byteswap()
+            file.write(name_codes.tobytes())
             
-            # Write each product as a row in the CSV
-            for product in products:
-                writer.writerow(product)
+            _write_float_column(file, prices, price_mask)
+            _write_float_column(file, ratings, rating_mask)
         
         return True
     
     except Exception as e:
-        print(f"Error saving to CSV: {e}")
+        print(f"Error saving columnar data: {e}")
         return False
 
 
+def load_columnar(filename='products.pcol'):
+    """
+    Load a file written by save_to_columnar back into typed columns.
+    
+    Numeric columns are read straight into arrays without any per-row
+    string parsing, which is what makes this much faster than re-reading
+    the CSV output for analytics.
+    
+    Args:
+        filename (str): Name of the columnar file to read
+    
+    Returns:
+        dict: Columns 'name_dictionary' (list of str), 'name_codes',
+              'price', 'price_valid', 'rating' and 'rating_valid' (arrays),
+              and 'rows' (int); or None if the file could not be read
+    """
+    try:
+        if filename.endswith('.parquet'):
+            if pyarrow is None:
+                print("Error loading columnar data: pyarrow is not installed")
+                return None
+            table = pyarrow.parquet.read_table(filename)
+            names = table.column('name').combine_chunks()
+            price = table.column('price')
+            rating = table.column('rating')
+            return {
+                'rows': table.num_rows,
+                'name_dictionary': names.dictionary.to_pylist(),
+                'name_codes': array('I', names.indices.to_pylist()),
+                'price': array('d', price.fill_null(0.0).to_pylist()),
+                'price_valid': array('B', price.is_valid().to_pylist()),
+                'rating': array('d', rating.fill_null(0.0).to_pylist()),
+                'rating_valid': array('B', rating.is_valid().to_pylist()),
+            }
+        
+        with open(filename, 'rb') as file:
+            data = file.read()
+        
+        if data[:len(COLUMNAR_MAGIC)] != COLUMNAR_MAGIC:
+            print(f"Error loading columnar data: '{filename}' is not a columnar file")
+            return None
+        
+        offset = len(COLUMNAR_MAGIC)
+        rows, dictionary_size = struct.unpack_from('<II', data, offset)
+        offset += 8
+        
+        # Decode the name dictionary (one entry per distinct name)
+        dictionary = []
+        for _ in range(dictionary_size):
+            (length,) = struct.unpack_from('<I', data, offset)
+            offset += 4
+            dictionary.append(data[offset:offset + length].decode('utf-8'))
+            offset += length
+        
+        name_codes = array('I')
+        name_codes.frombytes(data[offset:offset + rows * 4])
+        if sys.byteorder == 'big':
+            name_codes.byteswap()
+        offset += rows * 4
+        
+        prices, price_mask, offset = _read_float_column(data, offset, rows)
+        ratings, rating_mask, offset = _read_float_column(data, offset, rows)
+        
+        return {
+            'rows': rows,
+            'name_dictionary': dictionary,
+            'name_codes': name_codes,
+            'price': prices,
+            'price_valid': price_mask,
+            'rating': ratings,
+            'rating_valid': rating_mask,
+        }
+    
+    except Exception as e:
+        print(f"Error loading columnar data: {e}")
+        return None
+
+
+# Record layout of the change index: an operation byte ('U' = upsert,
+# 'D' = delete), the 64-bit identity hash and the 64-bit content hash
+CHANGE_INDEX_MAGIC = b'PIDX1\0'
+CHANGE_RECORD = struct.Struct('<cQQ')
+
+# Columns of the CSV written in incremental mode
+CHANGE_FIELDNAMES = ['change', 'id'] + CSV_FIELDNAMES
+
+
+def _hash64(text):
+    """Return a stable 64-bit hash of a string."""
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def product_identity(product, occurrence=0):
+    """
+    Return the identity hash of a product (its URL if known, else its name).
+    
+    Products of one crawl that share a URL or name are told apart by their
+    order: the second one is occurrence 1, the third occurrence 2, etc.
+    
+    Args:
+        product (dict): Product dictionary
+        occurrence (int): Earlier products of the crawl with the same key
+    
+    Returns:
+        int: 64-bit identity hash
+    """
+    key = product.get('url') or product.get('name', '')
+    return _hash64(f"{key}\x1f{occurrence}" if occurrence else key)
+
+
+def product_content_hash(product, fields=CSV_FIELDNAMES):
+    """
+    Return a hash of the product fields whose changes should be reported.
+    
+    Args:
+        product (dict): Product dictionary
+        fields (list): Fields that make up the product's content
+    
+    Returns:
+        int: 64-bit content hash
+    """
+    return _hash64('\x1f'.join(str(product.get(field, '')) for field in fields))
+
+
+class ProductChangeIndex:
+    """
+    Compact on-disk index used to emit only new, changed and removed products.
+    
+    The index maps each product's identity hash to its content hash, 16
+    bytes per product. It is stored as an append-only journal: every run
+    appends one fixed-size record per change, so the bytes written stay
+    proportional to the number of changes rather than the catalog size.
+    When the journal holds many more records than live products it is
+    compacted by rewriting just the live entries.
+    """
+    
+    def __init__(self, path='products.idx'):
+        """
+        Args:
+            path (str): Location of the index file
+        """
+        self.path = path
+        self.entries = {}
+        self.journal_records = 0
+        self.duplicates = 0
+        self.load()
+    
+    def load(self):
+        """Replay the journal on disk into the in-memory index."""
+        self.entries = {}
+        self.journal_records = 0
+        if not os.path.exists(self.path):
+            return
+        
+        with open(self.path, 'rb') as file:
+            data = file.read()
+        
+        if data[:len(CHANGE_INDEX_MAGIC)] != CHANGE_INDEX_MAGIC:
+            print(f"⚠️  Warning: '{self.path}' is not a change index. Starting fresh.")
+            # Replace it, so later appends do not land after foreign bytes
+            self.compact()
+            return
+        
+        body = memoryview(data)[len(CHANGE_INDEX_MAGIC):]
+        # Ignore a partially written trailing record
+        usable = len(body) - len(body) % CHANGE_RECORD.size
+        for op, identity, content in CHANGE_RECORD.iter_unpack(body[:usable]):
+            if op == b'D':
+                self.entries.pop(identity, None)
+            else:
+                self.entries[identity] = content
+            self.journal_records += 1
+        body.release()
+        
+        # Cut the partial record off, or every later append would be misaligned
+        if usable < len(data) - len(CHANGE_INDEX_MAGIC):
+            with open(self.path, 'r+b') as file:
+                file.truncate(len(CHANGE_INDEX_MAGIC) + usable)
+    
+    def diff(self, products):
+        """
+        Compare a crawl against the index and yield only what changed.
+        
+        Yields change dictionaries with a 'change' key ('new', 'changed' or
+        'removed') and the product's identity hash as 'id'. Products that
+        were in the index but not in this crawl are yielded as 'removed'
+        once the input is exhausted. The index on disk is only updated after
+        the generator has been fully consumed.
+        
+        Products that share a URL or name (two products without a URL and
+        with the same name on one page) are told apart by their order in
+        the crawl; their number is left in self.duplicates.
+        
+        Args:
+            products (iterable): Product dictionaries from the current crawl
+        """
+        seen = set()
+        pending = []
+        occurrences = {}
+        self.duplicates = 0
+        
+        for product in products:
+            identity = product_identity(product)
+            if identity in seen:
+                occurrence = occurrences[identity] = occurrences.get(identity, 0) + 1
+                identity = product_identity(product, occurrence)
+                self.duplicates += 1
+            content = product_content_hash(product)
+            seen.add(identity)
+            
+            previous = self.entries.get(identity)
+            if previous == content:
+                continue
+            
+            change = 'new' if previous is None else 'changed'
+            pending.append(CHANGE_RECORD.pack(b'U', identity, content))
+            self.entries[identity] = content
+            yield dict(product, change=change, id=f"{identity:016x}")
+        
+        for identity in [key for key in self.entries if key not in seen]:
+            pending.append(CHANGE_RECORD.pack(b'D', identity, 0))
+            del self.entries[identity]
+            yield {'change': 'removed', 'id': f"{identity:016x}"}
+        
+        self._append(pending)
+    
+    def _append(self, records):
+        """Append change records to the journal, compacting when it grows."""
+        self.journal_records += len(records)
+        
+        if self.journal_records > 2 * len(self.entries) + 1024:
+            self.compact()
+            return
+        
+        if not records:
+            return
+        
+        new_file = not os.path.exists(self.path)
+        with open(self.path, 'ab') as file:
+            if new_file:
+                file.write(CHANGE_INDEX_MAGIC)
+            file.write(b''.join(records))
+    
+    def compact(self):
+        """Rewrite the index so it contains one record per live product."""
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(CHANGE_INDEX_MAGIC)
+            file.write(b''.join(CHANGE_RECORD.pack(b'U', identity, content)
+                                for identity, content in self.entries.items()))
+        os.replace(temp_path, self.path)
+        self.journal_records = len(self.entries)
+
+
+def save_changes(products, filename='products_changes.csv',
+                 index_path='products.idx'):
+    """
+    Incremental mode: write only new, changed and removed products.
+    
+    Args:
+        products (iterable): Product dictionaries from the current crawl
+        filename (str): CSV file that receives the changes
+        index_path (str): Location of the change index
+    
+    Returns:
+        dict: Number of products per change type, plus 'duplicates' (see
+            ProductChangeIndex.diff), or None on failure
+    """
+    try:
+        index = ProductChangeIndex(index_path)
+        counts = {'new': 0, 'changed': 0, 'removed': 0}
+        
+        with StreamingCSVWriter(filename, fieldnames=CHANGE_FIELDNAMES) as writer:
+            for change in index.diff(products):
+                counts[change['change']] += 1
+                writer.write(change)
+        
+        counts['duplicates'] = index.duplicates
+        return counts
+    
+    except Exception as e:
+        print(f"Error saving changes: {e}")
+        return None
+
+
+def normalize_url(url):
+    """
+    Return the form of a URL used to recognise pages already seen.
+    
+    The scheme and host are lowercased, default ports and the fragment
+    are dropped and an empty path becomes '/'. IPv6 hosts keep their
+    brackets.
+    
+    Args:
+        url (str): Absolute URL
+    
+    Returns:
+        str: Normalized URL
+    
+    Raises:
+        ValueError: If the URL is malformed (e.g. a non-numeric port)
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if ':' in host:
+        host = f"[{host}]"
+    port = parts.port
+    if port and (scheme, port) not in (('http', 80), ('https', 443)):
+        host = f"{host}:{port}"
+    return urlunsplit((scheme, host, parts.path or '/', parts.query, ''))
+
+
+def url_host(url):
+    """Return the host (with a non-default port) that politeness applies to."""
+    return urlsplit(url).netloc
+
+
+class BloomFilter:
+    """
+    Fixed-size set of keys that may report false positives but never
+    false negatives.
+    
+    Memory is set once from the expected number of keys and the accepted
+    false positive rate (about 1.2 MB per million keys at 1%) and does not
+    grow as keys are added.
+    """
+    
+    def __init__(self, capacity, error_rate=0.01, bits=None):
+        """
+        Args:
+            capacity (int): Number of keys the filter is sized for
+            error_rate (float): False positive rate at that many keys
+            bits (bytes): Saved bit array (see to_bytes) to start from
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        if bits is not None:
+            if len(bits) != len(self.bits):
+                raise ValueError("Saved Bloom filter has a different size")
+            self.bits[:] = bits
+    
+    def _positions(self, digest):
+        # Double hashing: k positions from two 64-bit halves of the digest
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:16], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+    
+    def add(self, digest):
+        """
+        Add a key given as a 16-byte digest.
+        
+        Returns:
+            bool: True if the key was definitely not in the filter before
+        """
+        new = False
+        bits = self.bits
+        for position in self._positions(digest):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                new = True
+        return new
+    
+    def __contains__(self, digest):
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(digest))
+    
+    def to_bytes(self):
+        """Return the bit array for saving."""
+        return bytes(self.bits)
+
+
+class CrawlFrontier:
+    """
+    URLs waiting to be crawled, with seen-URL dedup, per-host politeness
+    and checkpoints, in bounded memory.
+    
+    Seen URLs are recorded in a Bloom filter and in an exact on-disk
+    store: a URL the filter has never seen is new without touching the
+    disk, and only filter hits are confirmed against the store, so false
+    positives never drop a URL. Queued URLs live on disk too, in one
+    queue per host ordered by priority (lower first). In memory there is
+    only the filter, a small write buffer and the politeness schedule:
+    a host is fetched at most once every `delay` seconds, and among the
+    hosts that are due the one with the most urgent URL goes first.
+    
+    Everything is kept in one SQLite file. checkpoint() commits it
+    together with the filter, and opening the same file resumes the crawl
+    from the last checkpoint.
+    """
+    
+    def __init__(self, path='crawl_frontier.db', capacity=10_000_000, error_rate=0.01,
+                 delay=1.0, clock=time.monotonic, cache_kb=16384):
+        """
+        Args:
+            path (str): Frontier database (created, or resumed if it exists)
+            capacity (int): Number of distinct URLs the Bloom filter is sized for
+            error_rate (float): Bloom filter false positive rate at capacity
+            delay (float): Minimum seconds between two fetches from one host
+            clock (callable): Time source (seconds), replaceable in tests
+            cache_kb (int): Page cache SQLite may use, in KiB
+        """
+        self.path = path
+        self.delay = delay
+        self.clock = clock
+        self.db = sqlite3.connect(path)
+        self.db.execute(f"PRAGMA cache_size = -{int(cache_kb)}")
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS seen (digest BLOB PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS queue (
+                id INTEGER PRIMARY KEY, host TEXT NOT NULL,
+                priority INTEGER NOT NULL, url TEXT NOT NULL);
+            CREATE INDEX IF NOT EXISTS queue_by_host ON queue (host, priority, id);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value BLOB);
+        """)
+        
+        meta = dict(self.db.execute("SELECT key, value FROM meta"))
+        if 'settings' in meta:
+            settings = json.loads(meta['settings'])
+            capacity, error_rate = settings['capacity'], settings['error_rate']
+            self.seen_count = settings['seen']
+            self.queued = settings['queued']
+        else:
+            self.seen_count = 0
+            self.queued = 0
+        self.bloom = BloomFilter(capacity, error_rate, meta.get('bloom'))
+        
+        self.bloom_hits = 0
+        self.false_positives = 0
+        self._pending_seen = set()
+        self._pending_queue = []
+        
+        # Politeness schedule: hosts waiting for their delay to pass, hosts
+        # that are due (by their best priority), and when each was last hit
+        self._waiting = []
+        self._ready = []
+        self._scheduled = set()
+        self._next_allowed = {}
+        self._sequence = 0
+        for (host,) in self.db.execute("SELECT DISTINCT host FROM queue"):
+            self._schedule(host)
+    
+    def __len__(self):
+        """Number of URLs waiting to be crawled."""
+        return self.queued
+    
+    def _schedule(self, host):
+        """Put a host with queued URLs on the politeness schedule."""
+        if host not in self._scheduled:
+            self._scheduled.add(host)
+            heapq.heappush(self._waiting, (self._next_allowed.get(host, 0.0), host))
+    
+    def _forget(self, host):
+        """Drop a host whose queue is empty and whose delay has passed."""
+        self._scheduled.discard(host)
+        self._next_allowed.pop(host, None)
+    
+    def _is_new(self, digest):
+        """Record a URL digest; return False if it was seen before."""
+        if self.bloom.add(digest):
+            self._pending_seen.add(digest)
+            return True
+        
+        # Possibly seen: confirm against the exact store
+        self.bloom_hits += 1
+        if digest in self._pending_seen or self.db.execute(
+                "SELECT 1 FROM seen WHERE digest = ?", (digest,)).fetchone():
+            return False
+        self.false_positives += 1
+        self._pending_seen.add(digest)
+        return True
+    
+    def add(self, url, priority=0):
+        """
+        Queue a URL unless it was seen before.
+        
+        Args:
+            url (str): Absolute URL
+            priority (int): Lower values are crawled first within a host
+        
+        Returns:
+            bool: True if the URL was new (False also for a malformed URL)
+        """
+        try:
+            url = normalize_url(url)
+        except ValueError:
+            return False
+        digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16).digest()
+        if not self._is_new(digest):
+            return False
+        
+        host = url_host(url)
+        self._pending_queue.append((host, priority, url))
+        self.seen_count += 1
+        self.queued += 1
+        if len(self._pending_queue) >= 10000:
+            self._flush()
+        self._schedule(host)
+        return True
+    
+    def add_many(self, urls, priority=0):
+        """Queue several URLs; return how many were new."""
+        return sum(self.add(url, priority) for url in urls)
+    
+    def _flush(self):
+        """Write buffered seen digests and queued URLs to the database."""
+        if self._pending_seen:
+            self.db.executemany("INSERT OR IGNORE INTO seen VALUES (?)",
+                                ((digest,) for digest in self._pending_seen))
+            self._pending_seen.clear()
+        if self._pending_queue:
+            self.db.executemany("INSERT INTO queue (host, priority, url) VALUES (?, ?, ?)",
+                                self._pending_queue)
+            self._pending_queue.clear()
+    
+    def pop(self):
+        """
+        Take the next URL that may be fetched now.
+        
+        Returns:
+            tuple: (url, priority), or None if the frontier is empty or
+                every host with queued URLs is still in its delay
+        """
+        self._flush()
+        now = self.clock()
+        
+        # Hosts whose delay has passed become ready, ranked by their best URL
+        while self._waiting and self._waiting[0][0] <= now:
+            _, host = heapq.heappop(self._waiting)
+            row = self.db.execute("SELECT MIN(priority) FROM queue WHERE host = ?",
+                                  (host,)).fetchone()
+            if row[0] is None:
+                self._forget(host)
+                continue
+            self._sequence += 1
+            heapq.heappush(self._ready, (row[0], self._sequence, host))
+        
+        while self._ready:
+            _, _, host = heapq.heappop(self._ready)
+            row = self.db.execute(
+                "SELECT id, priority, url FROM queue WHERE host = ? "
+                "ORDER BY priority, id LIMIT 1", (host,)).fetchone()
+            if row is None:
+                self._forget(host)
+                continue
+            
+            self.db.execute("DELETE FROM queue WHERE id = ?", (row[0],))
+            self.queued -= 1
+            self._next_allowed[host] = now + self.delay
+            heapq.heappush(self._waiting, (now + self.delay, host))
+            return row[2], row[1]
+        
+        return None
+    
+    def next_ready_in(self):
+        """
+        Seconds until pop() can return a URL (0 if it can now).
+        
+        Returns:
+            float: Time to wait, or None if nothing is queued
+        """
+        if not self.queued:
+            return None
+        if self._ready or not self._waiting:
+            return 0.0
+        return max(0.0, self._waiting[0][0] - self.clock())
+    
+    def checkpoint(self):
+        """Save the frontier so a later run can resume from this point."""
+        self._flush()
+        settings = {'capacity': self.bloom.capacity, 'error_rate': self.bloom.error_rate,
+                    'seen': self.seen_count, 'queued': self.queued}
+        self.db.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", [
+            ('settings', json.dumps(settings)),
+            ('bloom', self.bloom.to_bytes()),
+        ])
+        self.db.commit()
+    
+    def close(self):
+        """Checkpoint and close the database."""
+        self.checkpoint()
+        self.db.close()
+
+
+def extract_links(html, base_url):
+    """
+    Return the absolute http(s) URLs of all links in a page.
+    
+    Args:
+        html (str): The page
+        base_url (str): URL of the page, for resolving relative links
+    
+    Returns:
+        list: Absolute URLs in document order
+    """
+    links = []
+    for href in re.findall(r'<a\s[^>]*?href=["\']([^"\'#]+)', html, re.IGNORECASE):
+        try:
+            url = urljoin(base_url, href.strip())
+        except ValueError:
+            continue  # malformed link, e.g. an unclosed IPv6 bracket
+        if url.startswith(('http://', 'https://')):
+            links.append(url)
+    return links
+
+
+def crawl(frontier, fetch, max_pages=None, checkpoint_every=1000, on_products=None,
+          metrics=None):
+    """
+    Crawl pages from a frontier until it is empty or max_pages were fetched.
+    
+    Links found on a page are queued with the page's priority plus one,
+    so pages close to the seeds are crawled first. When every host is in
+    its politeness delay the crawl sleeps until one is due.
+    
+    Args:
+        frontier (CrawlFrontier): URLs to crawl (seed it with add())
+        fetch (callable): Returns the HTML of a URL, or None on failure
+        max_pages (int): Stop after this many fetches (None = no limit)
+        checkpoint_every (int): Pages between frontier checkpoints
+        on_products (callable): Called with (url, products) for every page
+        metrics (PipelineMetrics): Records fetch/parse/frontier stage times
+            and page counters (default: not recorded)
+    
+    Returns:
+        dict: Pages fetched, failed fetches, products found and URLs queued
+    """
+    metrics = NO_METRICS if metrics is None else metrics
+    stats = {'pages': 0, 'failed': 0, 'products': 0, 'queued': 0}
+    
+    while max_pages is None or stats['pages'] + stats['failed'] < max_pages:
+        with metrics.stage('frontier_pop'):
+            entry = frontier.pop()
+        if entry is None:
+            wait = frontier.next_ready_in()
+            if wait is None:
+                break
+            with metrics.stage('politeness_wait'):
+                time.sleep(wait)
+            continue
+        
+        url, priority = entry
+        with metrics.stage('fetch'):
+            html = fetch(url)
+        if html is None:
+            stats['failed'] += 1
+            metrics.count('pages_failed')
+            continue
+        
+        stats['pages'] += 1
+        metrics.count('pages_fetched')
+        metrics.record_page(html)
+        with metrics.stage('parse'):
+            products = parse_products(html)
+        metrics.record_products(products)
+        stats['products'] += len(products)
+        if on_products is not None:
+            on_products(url, products)
+        with metrics.stage('frontier_add'):
+            stats['queued'] += frontier.add_many(extract_links(html, url), priority + 1)
+        
+        if stats['pages'] % checkpoint_every == 0:
+            with metrics.stage('checkpoint'):
+                frontier.checkpoint()
+    
+    frontier.checkpoint()
+    return stats
+
+
 def display_products(products):
     """
     Display the extracted products in a formatted table on the console.
@@ -208,68 +1476,552 @@ def display_products(products):
     print("=" * 80 + "\n")
 
 
+class QuantileSketch:
+    """
+    Mergeable streaming quantile sketch with bounded relative error.
+    
+    Values are counted in logarithmically sized buckets (the DDSketch
+    approach), so any quantile is reported within ``relative_accuracy`` of
+    the true value while memory depends only on the spread of the values,
+    never on how many were added. At most ``max_buckets`` buckets are kept;
+    beyond that the lowest buckets are collapsed together.
+    """
+    
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.count = 0
+        self.zero_count = 0
+        self.positive = {}
+        self.negative = {}
+    
+    def _key(self, value):
+        return math.ceil(math.log(value) / self._log_gamma)
+    
+    def _value(self, key):
+        return 2 * self.gamma ** key / (self.gamma + 1)
+    
+    def _collapse(self, store, lowest_first):
+        """Fold the extra buckets at one end of a store into its neighbour."""
+        keys = sorted(store, reverse=not lowest_first)
+        extra = keys[:len(keys) - self.max_buckets + 1]
+        target = keys[len(extra)]
+        for key in extra:
+            store[target] += store.pop(key)
+    
+    def add(self, value, count=1):
+        """Add a value (with an optional multiplicity) to the sketch."""
+        self.count += count
+        if value > 0:
+            store = self.positive
+            key = self._key(value)
+        elif value < 0:
+            store = self.negative
+            key = self._key(-value)
+        else:
+            self.zero_count += count
+            return
+        
+        store[key] = store.get(key, 0) + count
+        if len(store) > self.max_buckets:
+            # Keep precision on the high end of positives (and on values
+            # closest to zero for negatives)
+            self._collapse(store, lowest_first=store is self.positive)
+    
+    def merge(self, other):
+        """Fold another sketch with the same accuracy into this one."""
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for mine, theirs in ((self.positive, other.positive),
+                             (self.negative, other.negative)):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+            if len(mine) > self.max_buckets:
+                self._collapse(mine, lowest_first=mine is self.positive)
+    
+    def quantile(self, q):
+        """
+        Estimate the q-th quantile (0 <= q <= 1).
+        
+        Returns:
+            float: The estimated value, or None if the sketch is empty
+        """
+        if self.count == 0:
+            return None
+        
+        rank = q * (self.count - 1)
+        seen = 0
+        
+        # Walk the buckets in ascending value order
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._value(key)
+        
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._value(key)
+        
+        return self._value(max(self.positive))
+
+
+class RunningStatistics:
+    """
+    Single-pass count, mean, variance, min, max and quantiles of one field.
+    
+    Mean and variance are updated with Welford's algorithm, and two
+    instances can be merged exactly (Chan et al.), so each worker shard can
+    keep its own RunningStatistics and combine them at the end.
+    """
+    
+    def __init__(self, relative_accuracy=0.01):
+        self.count = 0
+        self.null_count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+        self.sketch = QuantileSketch(relative_accuracy)
+    
+    def add(self, value):
+        """Add one value; None is counted as a missing value."""
+        if value is None:
+            self.null_count += 1
+            return
+        
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        
+        self.sketch.add(value)
+    
+    def merge(self, other):
+        """Combine the statistics of another shard into this one."""
+        self.null_count += other.null_count
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            self.min, self.max = other.min, other.max
+            self.sketch.merge(other.sketch)
+            return
+        
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+    
+    @property
+    def variance(self):
+        """Sample variance, or None with fewer than two values."""
+        if self.count < 2:
+            return None
+        return self._m2 / (self.count - 1)
+    
+    @property
+    def stddev(self):
+        """Sample standard deviation, or None with fewer than two values."""
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+    
+    def quantile(self, q):
+        """Approximate q-th quantile of the values seen so far."""
+        return self.sketch.quantile(q)
+
+
+class ProductStatistics:
+    """
+    Online aggregator that consumes products one at a time in O(1) memory.
+    
+    Tracks the number of products, how many have each field missing
+    ("N/A" or empty; for price and rating also anything that is not a
+    finite number) and RunningStatistics for the numeric price and rating
+    fields. Instances from different worker shards can be merged.
+    """
+    
+    def __init__(self, fields=('name', 'price', 'rating')):
+        self.total = 0
+        self.missing = {field: 0 for field in fields}
+        self.price = RunningStatistics()
+        self.rating = RunningStatistics()
+    
+    def add(self, product):
+        """
+        Add a single product dictionary to the statistics.
+        
+        Args:
+            product (dict): Product with 'name', 'price' and 'rating'
+        """
+        self.total += 1
+        numbers = {'price': parse_price(product.get('price')),
+                   'rating': parse_rating(product.get('rating'))}
+        for field in self.missing:
+            if field in numbers:
+                if numbers[field] is None:
+                    self.missing[field] += 1
+                continue
+            value = product.get(field)
+            if not value or value == "N/A":
+                self.missing[field] += 1
+        
+        self.price.add(numbers['price'])
+        self.rating.add(numbers['rating'])
+    
+    def add_many(self, products):
+        """Consume an iterable of products."""
+        for product in products:
+            self.add(product)
+        return self
+    
+    def merge(self, other):
+        """Combine the statistics gathered by another shard."""
+        self.total += other.total
+        for field, count in other.missing.items():
+            self.missing[field] = self.missing.get(field, 0) + count
+        self.price.merge(other.price)
+        self.rating.merge(other.rating)
+        return self
+
+
 def calculate_statistics(products):
     """
     Calculate and display basic statistics about the products.
     
+    The products are consumed in a single pass through ProductStatistics,
+    so this works on generators and never holds the dataset in memory.
+    
     Args:
-        products (list): List of product dictionaries
+        products (iterable or ProductStatistics): Product dictionaries, or
+            statistics already gathered (e.g. merged from several shards)
+    
+    Returns:
+        ProductStatistics: The aggregated statistics
     """
     print("\n" + "=" * 80)
     print("PRODUCT STATISTICS".center(80))
     print("=" * 80 + "\n")
     
-    # Count products with valid prices
-    valid_prices = []
-    for product in products:
-        if product['price'] != "N/A":
-            # Remove the dollar sign and convert to float
-            try:
-                price_value = float(product['price'].replace('$', ''))
-                valid_prices.append(price_value)
-            except ValueError:
-                pass
-    
-    # Count products with valid ratings
-    valid_ratings = []
-    for product in products:
-        if product['rating'] != "N/A":
-            try:
-                rating_value = float(product['rating'])
-                valid_ratings.append(rating_value)
-            except ValueError:
-                pass
+    if isinstance(products, ProductStatistics):
+        stats = products
+    else:
+        stats = ProductStatistics().add_many(products)
+    
+    price = stats.price
+    rating = stats.rating
     
     # Display statistics
-    print(f"Total Products: {len(products)}")
-    print(f"Products with Price: {len(valid_prices)}")
-    print(f"Products with Rating: {len(valid_ratings)}")
-    
-    if valid_prices:
-        avg_price = sum(valid_prices) / len(valid_prices)
-        max_price = max(valid_prices)
-        min_price = min(valid_prices)
+    print(f"Total Products: {stats.total}")
+    print(f"Products with Price: {price.count}")
+    print(f"Products with Rating: {rating.count}")
+    
+    if price.count:
         print(f"\nPrice Statistics:")
-        print(f"  Average Price: ${avg_price:.2f}")
-        print(f"  Highest Price: ${max_price:.2f}")
-        print(f"  Lowest Price: ${min_price:.2f}")
-    
-    if valid_ratings:
-        avg_rating = sum(valid_ratings) / len(valid_ratings)
-        max_rating = max(valid_ratings)
-        min_rating = min(valid_ratings)
+        print(f"  Average Price: ${price.mean:.2f}")
+        print(f"  Highest Price: ${price.max:.2f}")
+        print(f"  Lowest Price: ${price.min:.2f}")
+        if price.stddev is not None:
+            print(f"  Std Deviation: ${price.stddev:.2f}")
+        print(f"  Median Price (approx.): ${price.quantile(0.5):.2f}")
+        print(f"  90th Percentile (approx.): ${price.quantile(0.9):.2f}")
+    
+    if rating.count:
         print(f"\nRating Statistics:")
-        print(f"  Average Rating: {avg_rating:.2f}")
-        print(f"  Highest Rating: {max_rating:.1f}")
-        print(f"  Lowest Rating: {min_rating:.1f}")
+        print(f"  Average Rating: {rating.mean:.2f}")
+        print(f"  Highest Rating: {rating.max:.1f}")
+        print(f"  Lowest Rating: {rating.min:.1f}")
+        if rating.stddev is not None:
+            print(f"  Std Deviation: {rating.stddev:.2f}")
+        print(f"  Median Rating (approx.): {rating.quantile(0.5):.1f}")
+    
+    missing = {field: count for field, count in stats.missing.items() if count}
+    if missing:
+        print("\nMissing Fields:")
+        for field, count in missing.items():
+            print(f"  {field}: {count}")
     
     print("\n" + "=" * 80 + "\n")
+    
+    return stats
+
 
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket
+# (+Inf) catches everything slower
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                   0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
 
-def main():
+
+class LatencyHistogram:
+    """
+    Cumulative-bucket latency histogram in the Prometheus layout.
+    
+    Memory is one counter per bucket no matter how many samples are
+    observed.
+    """
+    
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+    
+    def observe(self, seconds):
+        """Record one duration in seconds."""
+        index = 0
+        for bound in self.buckets:
+            if seconds <= bound:
+                break
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+    
+    def cumulative(self):
+        """Return (upper bound, samples at or below it) pairs, ending with +Inf."""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class PipelineMetrics:
+    """
+    Opt-in instrumentation for the scraping pipeline.
+    
+    Records wall time per stage (as a latency histogram per stage name)
+    and named counters, and exports them as JSON lines or in the
+    Prometheus text exposition format. A disabled instance accepts the
+    same calls and records nothing, so the pipeline is instrumented
+    unconditionally and pays almost nothing when metrics are off.
+    """
+    
+    def __init__(self, enabled=True, prefix='scraper'):
+        """
+        Args:
+            enabled (bool): Record anything at all
+            prefix (str): Prefix of every exported metric name
+        """
+        self.enabled = enabled
+        self.prefix = prefix
+        self.counters = {}
+        self.stages = {}
+    
+    def count(self, name, amount=1):
+        """Add to a counter (e.g. 'products_parsed')."""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def observe(self, stage, seconds):
+        """Record one duration of a stage."""
+        if self.enabled:
+            histogram = self.stages.get(stage)
+            if histogram is None:
+                histogram = self.stages[stage] = LatencyHistogram()
+            histogram.observe(seconds)
+    
+    def stage(self, name):
+        """
+        Time a block of code as one run of a stage.
+        
+        Args:
+            name (str): Stage name (e.g. 'parse')
+        
+        Returns:
+            A context manager
+        """
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._timed(name)
+    
+    @contextlib.contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+    
+    def record_page(self, page):
+        """
+        Count the bytes of a fetched page without copying it.
+        
+        Args:
+            page: The page as str, bytes, bytearray, mmap or memoryview
+        """
+        if not self.enabled:
+            return
+        if isinstance(page, memoryview):
+            size = page.nbytes
+        elif isinstance(page, str) and not page.isascii():
+            # Only a non-ASCII str page has to be encoded to be measured
+            size = len(page.encode('utf-8'))
+        else:
+            size = len(page)
+        self.count('bytes_processed', size)
+    
+    def record_products(self, products):
+        """
+        Count parsed products and the fields they are missing.
+        
+        Args:
+            products (list): Product dictionaries from parse_products
+        """
+        if not self.enabled:
+            return
+        self.count('products_parsed', len(products))
+        for product in products:
+            for field, value in product.items():
+                if value == "N/A":
+                    self.count(f'fields_missing:{field}')
+    
+    def _series(self):
+        """Yield (metric name, labels, value) for every exported number."""
+        for name, value in sorted(self.counters.items()):
+            name, _, field = name.partition(':')
+            yield f"{self.prefix}_{name}_total", {'field': field} if field else {}, value
+        for stage, histogram in sorted(self.stages.items()):
+            name = f"{self.prefix}_stage_seconds"
+            for bound, count in histogram.cumulative():
+                le = '+Inf' if bound == math.inf else repr(bound)
+                yield f"{name}_bucket", {'stage': stage, 'le': le}, count
+            yield f"{name}_sum", {'stage': stage}, histogram.sum
+            yield f"{name}_count", {'stage': stage}, histogram.count
+    
+    def to_prometheus(self):
+        """
+        Return the metrics in the Prometheus text exposition format.
+        
+        Returns:
+            str: One sample per line, with TYPE comments
+        """
+        lines = []
+        typed = set()
+        for name, labels, value in self._series():
+            family, kind = name, 'counter'
+            if name.endswith('_total'):
+                family = name[:-len('_total')]
+            else:
+                family, kind = name.rsplit('_', 1)[0], 'histogram'
+            if family not in typed:
+                typed.add(family)
+                lines.append(f"# TYPE {family} {kind}")
+            label_text = ",".join(f'{key}="{value}"' for key, value in labels.items())
+            lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+        return "\n".join(lines) + "\n"
+    
+    def to_json_lines(self, timestamp=None):
+        """
+        Return the metrics as JSON lines: one line per counter and per stage.
+        
+        Args:
+            timestamp (float): Unix time stamped on every line (default: now)
+        
+        Returns:
+            str: Newline-terminated JSON objects
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            name, _, field = name.partition(':')
+            entry = {'time': timestamp, 'type': 'counter', 'name': name, 'value': value}
+            if field:
+                entry['field'] = field
+            lines.append(json.dumps(entry))
+        for stage, histogram in sorted(self.stages.items()):
+            lines.append(json.dumps({
+                'time': timestamp, 'type': 'histogram', 'name': 'stage_seconds',
+                'stage': stage, 'count': histogram.count, 'sum': histogram.sum,
+                'max': histogram.max,
+                'buckets': [['+Inf' if bound == math.inf else bound, count]
+                            for bound, count in histogram.cumulative()],
+            }))
+        return "".join(line + "\n" for line in lines)
+    
+    def export(self, filename, format=None):
+        """
+        Write the metrics to a local file.
+        
+        JSON lines are appended, so repeated runs build up a history;
+        Prometheus text replaces the file, as a node exporter textfile
+        collector expects.
+        
+        Args:
+            filename (str): Output file
+            format (str): 'jsonl' or 'prometheus' (default: 'prometheus'
+                for .prom files, otherwise 'jsonl')
+        
+        Returns:
+            bool: True if the file was written
+        """
+        if format is None:
+            format = 'prometheus' if filename.endswith('.prom') else 'jsonl'
+        if format not in ('jsonl', 'prometheus'):
+            raise ValueError(f"Unknown metrics format: {format}")
+        
+        try:
+            if format == 'jsonl':
+                with open(filename, 'a', encoding='utf-8') as file:
+                    file.write(self.to_json_lines())
+            else:
+                temp_name = filename + '.tmp'
+                with open(temp_name, 'w', encoding='utf-8') as file:
+                    file.write(self.to_prometheus())
+                os.replace(temp_name, filename)
+            return True
+        
+        except Exception as e:
+            print(f"Error writing metrics: {e}")
+            return False
+
+
+# Shared disabled instance used when no metrics are requested
+NO_METRICS = PipelineMetrics(enabled=False)
+
+
+def export_metrics(metrics, filename):
+    """Write metrics to a file and report where they went."""
+    if metrics.export(filename):
+        print(f"✓ Metrics written to: {os.path.abspath(filename)}")
+    else:
+        print("✗ Failed to write metrics.")
+
+
+def main(incremental=False, metrics_file=None):
     """
     Main function that orchestrates the web scraping simulation.
+    
+    Args:
+        incremental (bool): Only save products that changed since the
+            previous run (see save_changes)
+        metrics_file (str): Record per-stage timings and counters and
+            write them to this file (.prom for Prometheus text, anything
+            else for JSON lines); None disables instrumentation
     """
+    metrics = PipelineMetrics() if metrics_file else NO_METRICS
+    
     print("\n" + "=" * 80)
     print("WEB SCRAPING SIMULATION PROJECT".center(80))
     print("E-Commerce Product Data Extractor".center(80))
@@ -278,26 +2030,65 @@ def main():
     print("Starting HTML parsing...")
     
     # Step 1: Parse the simulated HTML and extract product data
-    products = parse_products(SAMPLE_HTML)
+    metrics.record_page(SAMPLE_HTML)
+    with metrics.stage('parse'):
+        products = parse_products(SAMPLE_HTML)
+    metrics.record_products(products)
     
     print(f"Successfully parsed {len(products)} products from HTML.\n")
     
     # Step 2: Display the extracted products on console
-    display_products(products)
+    with metrics.stage('display'):
+        display_products(products)
     
     # Step 3: Calculate and display statistics
-    calculate_statistics(products)
+    with metrics.stage('statistics'):
+        calculate_statistics(products)
     
-    # Step 4: Save the data to a CSV file
-    csv_filename = 'products.csv'
-    print(f"Saving data to '{csv_filename}'...")
-    
-    if save_to_csv(products, csv_filename):
-        # Get the absolute path of the saved file
-        abs_path = os.path.abspath(csv_filename)
-        print(f"✓ Data successfully saved to: {abs_path}")
+    if incremental:
+        # Step 4: Save only the products that changed since the last run
+        changes_filename = 'products_changes.csv'
+        print(f"Saving changes to '{changes_filename}'...")
+        
+        with metrics.stage('save_changes'):
+            counts = save_changes(products, changes_filename)
+        if counts is not None:
+            abs_path = os.path.abspath(changes_filename)
+            print(f"✓ {counts['new']} new, {counts['changed']} changed, "
+                  f"{counts['removed']} removed product(s) saved to: {abs_path}")
+            if counts['duplicates']:
+                print(f"  ({counts['duplicates']} product(s) shared a name with an "
+                      f"earlier one and were told apart by position)")
+        else:
+            print("✗ Failed to save changes.")
     else:
-        print("✗ Failed to save data to CSV file.")
+        # Step 4: Save the data to a CSV file
+        csv_filename = 'products.csv'
+        print(f"Saving data to '{csv_filename}'...")
+        
+        with metrics.stage('save_csv'):
+            saved = save_to_csv(products, csv_filename)
+        if saved:
+            # Get the absolute path of the saved file
+            abs_path = os.path.abspath(csv_filename)
+            print(f"✓ Data successfully saved to: {abs_path}")
+        else:
+            print("✗ Failed to save data to CSV file.")
+        
+        # Step 5: Save a typed, columnar copy for analytics jobs
+        columnar_filename = 'products.pcol'
+        print(f"Saving columnar data to '{columnar_filename}'...")
+        
+        with metrics.stage('save_columnar'):
+            saved = save_to_columnar(products, columnar_filename)
+        if saved:
+            abs_path = os.path.abspath(columnar_filename)
+            print(f"✓ Columnar data successfully saved to: {abs_path}")
+        else:
+            print("✗ Failed to save columnar data.")
+    
+    if metrics_file:
+        export_metrics(metrics, metrics_file)
     
     print("\n" + "=" * 80)
     print("SCRAPING COMPLETE!".center(80))
@@ -306,4 +2097,14 @@ def main():
 
 # Entry point of the program
 if __name__ == "__main__":
-    main()
+    arguments = sys.argv[1:]
+    metrics_file = None
+    if '--metrics' in arguments:
+        # The file name is optional: the next argument only counts when it
+        # is not another option
+        position = arguments.index('--metrics') + 1
+        if position < len(arguments) and not arguments[position].startswith('--'):
+            metrics_file = arguments[position]
+        else:
+            metrics_file = 'scraper_metrics.jsonl'
+    main(incremental='--incremental' in arguments, metrics_file=metrics_file)
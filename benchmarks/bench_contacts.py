@@ -0,0 +1,130 @@
+"""Benchmarks for search_contact / fuzzy search / autocomplete / snapshot load and save in 'Contact Management.py'."""
+
+import json
+import os
+import tempfile
+import tracemalloc
+
+from common import load_program, measure, quiet
+from fixtures import generate_contacts
+
+
+def run(quick=False):
+    manager = load_program('Contact Management.py')
+    results = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Keep the benchmark away from the user's real contacts.json
+        original_file = manager.CONTACTS_FILE
+        manager.CONTACTS_FILE = os.path.join(directory, 'contacts.json')
+        try:
+            for count in ([10_000] if quick else [10_000, 100_000, 1_000_000]):
+                contacts = generate_contacts(count, seed=3)
+
+                # Typo-tolerant lookups; the index is built once, untimed
+                search_index = manager.ContactSearchIndex(contacts)
+                search_index.search('warmup')
+                results.append(measure(
+                    'contacts.fuzzy_search',
+                    lambda search_index=search_index: search_index.search('Jonh Smtih'),
+                    params={'contacts': count}, operations=1,
+                ))
+
+                # Autocomplete: a short prefix shared by many contacts and a
+                # long one; the memory of the built index is recorded as well
+                search_index = manager.ContactSearchIndex(contacts)
+                tracemalloc.start()
+                search_index.complete('warmup')
+                index_bytes = tracemalloc.get_traced_memory()[0]
+                tracemalloc.stop()
+                for prefix in ['jo', contacts[str(count // 2)]['email'][:12]]:
+                    record = measure(
+                        'contacts.autocomplete',
+                        lambda prefix=prefix, search_index=search_index: search_index.complete(prefix, 10),
+                        params={'contacts': count, 'prefix': len(prefix)}, operations=1,
+                    )
+                    record['index_bytes'] = index_bytes
+                    results.append(record)
+                print(f"  {'contacts.autocomplete index size':<40} {'contacts=' + str(count):<28} "
+                      f"{index_bytes / 2**20:>10.1f} MB  {index_bytes / count:>14,.0f} B/contact")
+                del search_index
+
+                def save(contacts=contacts):
+                    with quiet():
+                        manager.save_contacts(contacts)
+                results.append(measure(
+                    'contacts.save_contacts', save,
+                    params={'contacts': count}, operations=count,
+                    repeat=1 if count >= 1_000_000 else 3,
+                ))
+
+                # save_contacts wrote a snapshot, so this is the mmap open
+                def load():
+                    with quiet():
+                        manager.load_contacts().close()
+                results.append(measure(
+                    'contacts.load_contacts', load,
+                    params={'contacts': count}, operations=1,
+                ))
+
+                # Search what load_contacts() returns once contacts were saved:
+                # the snapshot. Its first search decodes the file into a search
+                # text, so it is timed on its own; a query that matches nothing
+                # scans every contact.
+                def first_search(snapshot):
+                    with quiet(['no-such-contact']):
+                        manager.search_contact(snapshot)
+                    snapshot.close()
+                results.append(measure(
+                    'contacts.search_contact_first', first_search,
+                    params={'contacts': count}, operations=count,
+                    repeat=1, setup=manager.load_contacts,
+                ))
+
+                loaded = manager.load_contacts()
+                queries = ['no-such-contact', f"{contacts[str(count // 2)]['email'][:-12]}"]
+                for query in queries:
+                    def search(query=query, loaded=loaded):
+                        with quiet([query]):
+                            manager.search_contact(loaded)
+                    results.append(measure(
+                        'contacts.search_contact', search,
+                        params={'contacts': count, 'query': 'miss' if query == queries[0] else 'hit'},
+                        operations=count,
+                    ))
+                loaded.close()
+
+                # The JSON path the snapshot replaced, for comparison
+                json_file = os.path.join(directory, 'contacts-export.json')
+                with open(json_file, 'w') as file:
+                    json.dump(contacts, file, indent=4)
+
+                def load_json():
+                    with open(json_file) as file:
+                        json.load(file)
+                results.append(measure(
+                    'contacts.load_contacts_json', load_json,
+                    params={'contacts': count}, operations=count,
+                    repeat=1 if count >= 1_000_000 else 3,
+                ))
+
+                # Only the records that are shown or looked up are decoded
+                snapshot = manager.ContactSnapshot(manager.snapshot_path())
+
+                def first_page(snapshot=snapshot):
+                    with quiet(['q']):
+                        manager.view_all_contacts(snapshot)
+                results.append(measure(
+                    'contacts.view_first_page', first_page,
+                    params={'contacts': count}, operations=50,
+                ))
+                results.append(measure(
+                    'contacts.snapshot_lookup',
+                    lambda snapshot=snapshot: [str(index) in snapshot for index in range(1, 1001)],
+                    params={'contacts': count}, operations=1000,
+                ))
+                snapshot.close()
+        finally:
+            manager.CONTACTS_FILE = original_file
+
+    return results
@@ -0,0 +1,26 @@
+"""Benchmarks for the headless simulator in 'Gussing game.py'."""
+
+from common import load_program, measure
+
+
+def run(quick=False):
+    game = load_program('Gussing game.py')
+    results = []
+    games = 100_000 if quick else 1_000_000
+
+    for player in ('binary', 'bands'):
+        results.append(measure(
+            'game.simulate_games',
+            lambda player=player: game.simulate_games(player, games, workers=1, seed=5),
+            params={'player': player, 'games': games}, operations=games,
+        ))
+
+    # Full game loop without the per-target table (non-deterministic player)
+    random_games = games // 10
+    results.append(measure(
+        'game.simulate_games',
+        lambda: game.simulate_games('random', random_games, workers=1, seed=5),
+        params={'player': 'random', 'games': random_games}, operations=random_games,
+    ))
+
+    return results
@@ -0,0 +1,83 @@
+"""Benchmarks for parse_products (str and bytes) / extract_text_between_tags / the crawl frontier in 'Web scraping.py'."""
+
+import os
+import tempfile
+import tracemalloc
+
+from common import load_program, measure
+from fixtures import FixtureSite, generate_product_html
+
+
+def run(quick=False):
+    scraping = load_program('Web scraping.py')
+    results = []
+
+    for products in ([1_000] if quick else [1_000, 10_000, 100_000]):
+        html = generate_product_html(products, seed=2)
+        results.append(measure(
+            'scraping.parse_products', lambda html=html: scraping.parse_products(html),
+            params={'products': products, 'bytes': len(html)}, operations=products,
+        ))
+
+    # Raw UTF-8 pages: decode and parse as str, or parse the bytes in place.
+    # Peak traced memory includes the decoded copy and every slice the str
+    # path allocates; the bytes path only allocates the emitted values.
+    for products in ([1_000] if quick else [10_000, 100_000]):
+        data = generate_product_html(products, seed=2, filler_paragraphs=2).encode('utf-8')
+        for path, parse in [('str', lambda data: scraping.parse_products(data.decode('utf-8'))),
+                            ('bytes', scraping.parse_products)]:
+            record = measure(
+                'scraping.parse_raw_page', lambda data=data, parse=parse: parse(data),
+                params={'products': products, 'bytes': len(data), 'path': path},
+                operations=products,
+            )
+            tracemalloc.start()
+            parse(data)
+            record['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results.append(record)
+
+    # One field lookup in a large page (the worst case: the tag is near the end)
+    html = generate_product_html(1_000 if quick else 100_000, seed=2)
+    results.append(measure(
+        'scraping.extract_text_between_tags',
+        lambda: scraping.extract_text_between_tags(html, '</div>\n    </div>', '</body>'),
+        params={'bytes': len(html)}, operations=1,
+    ))
+    data = html.encode('utf-8')
+    results.append(measure(
+        'scraping.extract_bytes_between_tags',
+        lambda: scraping.extract_bytes_between_tags(data, '</div>\n    </div>', '</body>'),
+        params={'bytes': len(data)}, operations=1,
+    ))
+
+    # Crawl a fixture site with no politeness delay. Peak traced memory
+    # should stay flat as the site grows: seen URLs and the queues are on disk.
+    with tempfile.TemporaryDirectory() as directory:
+        for pages in ([2_000] if quick else [2_000, 20_000, 100_000]):
+            site = FixtureSite(pages, hosts=50)
+
+            def setup(pages=pages):
+                path = os.path.join(directory, f'frontier-{pages}.db')
+                if os.path.exists(path):
+                    os.remove(path)
+                frontier = scraping.CrawlFrontier(path, capacity=1_000_000, delay=0.0)
+                frontier.add(site.url(0))
+                return frontier
+
+            def crawl(frontier):
+                stats = scraping.crawl(frontier, site.fetch)
+                frontier.close()
+                return stats
+
+            record = measure('scraping.crawl', crawl, params={'pages': pages},
+                             operations=pages, repeat=1, setup=setup)
+
+            frontier = setup()
+            tracemalloc.start()
+            crawl(frontier)
+            record['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results.append(record)
+
+    return results
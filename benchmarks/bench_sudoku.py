@@ -0,0 +1,77 @@
+"""Benchmarks for solve_sudoku, the batch solver and the solution cache in 'Sudoku solver.py'."""
+
+import copy
+
+from common import load_program, measure
+from fixtures import HARD_PUZZLES, generate_equivalent_puzzles, generate_puzzles, parse_puzzle
+
+
+def run(quick=False):
+    sudoku = load_program('Sudoku solver.py')
+    results = []
+
+    def solve_all(puzzles):
+        for grid in puzzles:
+            sudoku.solve_sudoku(grid)
+
+    corpora = {
+        'generated-30-clues': generate_puzzles(10 if quick else 50, clues=30, seed=1),
+        'hard': [parse_puzzle(text) for text in (HARD_PUZZLES[:1] if quick else HARD_PUZZLES)],
+    }
+    for corpus, puzzles in corpora.items():
+        results.append(measure(
+            'sudoku.solve_sudoku', solve_all,
+            params={'corpus': corpus, 'puzzles': len(puzzles)},
+            operations=len(puzzles), repeat=1 if corpus == 'hard' else 3,
+            # The solver works in place, so every run gets fresh copies
+            setup=lambda puzzles=puzzles: copy.deepcopy(puzzles),
+        ))
+        results.append(measure(
+            'sudoku.solve_sudoku_batch', sudoku.solve_sudoku_batch,
+            params={'corpus': corpus, 'puzzles': len(puzzles), 'numpy': sudoku.np is not None},
+            operations=len(puzzles),
+            setup=lambda puzzles=puzzles: copy.deepcopy(puzzles),
+        ))
+
+    # The batch solver on a corpus too large for the plain solver
+    batch_corpus = generate_puzzles(1000 if quick else 10000, clues=30, seed=2)
+    results.append(measure(
+        'sudoku.solve_sudoku_batch', sudoku.solve_sudoku_batch,
+        params={'corpus': 'generated-30-clues', 'puzzles': len(batch_corpus),
+                'numpy': sudoku.np is not None},
+        operations=len(batch_corpus),
+        setup=lambda: copy.deepcopy(batch_corpus),
+    ))
+
+    # Equivalent puzzles (relabeled, permuted, transposed): the canonical-form
+    # cache solves each base puzzle once and maps the rest back
+    bases = generate_puzzles(4 if quick else 10, clues=26, seed=7)
+    corpus = generate_equivalent_puzzles(bases, 5 if quick else 10, seed=8)
+    params = {'corpus': 'equivalent-26-clues', 'puzzles': len(corpus), 'bases': len(bases)}
+    uncached = measure(
+        'sudoku.solve_sudoku', solve_all, params=params,
+        operations=len(corpus), repeat=1,
+        setup=lambda: copy.deepcopy(corpus),
+    )
+    results.append(uncached)
+
+    caches = []
+
+    def solve_all_cached(puzzles):
+        cache = sudoku.SolutionCache(capacity=len(bases))
+        caches.append(cache)
+        for grid in puzzles:
+            sudoku.solve_sudoku_cached(grid, cache)
+
+    cached = measure(
+        'sudoku.solve_sudoku_cached', solve_all_cached, params=params,
+        operations=len(corpus), repeat=1,
+        setup=lambda: copy.deepcopy(corpus),
+    )
+    cached['hit_rate'] = caches[-1].hit_rate()
+    cached['speedup'] = uncached['seconds'] / cached['seconds']
+    results.append(cached)
+    print(f"  {'sudoku.solution_cache':<40} {'hit_rate=' + format(cached['hit_rate'], '.0%'):<28} "
+          f"{cached['speedup']:>10.1f} x faster than solve_sudoku")
+
+    return results
@@ -0,0 +1,37 @@
+"""Benchmarks for bulk conversion in 'temperature conversion.py'."""
+
+from array import array
+
+from common import load_program, measure
+from fixtures import generate_readings
+
+
+def run(quick=False):
+    temperature = load_program('temperature conversion.py')
+    results = []
+    count = 100_000 if quick else 1_000_000
+    readings = array('d', generate_readings(count, seed=4))
+    out = array('d', bytes(8 * count))
+
+    results.append(measure(
+        'temperature.scalar_loop',
+        lambda: [temperature.celsius_to_fahrenheit(value) for value in readings],
+        params={'readings': count}, operations=count,
+    ))
+    results.append(measure(
+        'temperature.convert',
+        lambda: temperature.convert(readings, 'C', 'F'),
+        params={'readings': count, 'numpy': temperature.np is not None}, operations=count,
+    ))
+    results.append(measure(
+        'temperature.convert_out',
+        lambda: temperature.convert(readings, 'C', 'F', out=out),
+        params={'readings': count, 'numpy': temperature.np is not None}, operations=count,
+    ))
+    results.append(measure(
+        'temperature.compute_conversions',
+        lambda: [temperature.compute_conversions(value, 'C') for value in readings[:100_000]],
+        params={'calls': min(count, 100_000)}, operations=min(count, 100_000),
+    ))
+
+    return results
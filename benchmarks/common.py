@@ -0,0 +1,109 @@
+"""
+Shared helpers for the benchmark suite.
+
+The programs live in files with spaces in their names ("Sudoku solver.py",
+...), so they are loaded by path instead of imported.
+"""
+
+import builtins
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+import time
+
+
+# Root of the repository (the directory that holds the five programs)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_loaded_programs = {}
+
+
+def load_program(filename):
+    """
+    Load one of the repository's programs as a module.
+
+    Args:
+        filename (str): File name of the program, e.g. 'Sudoku solver.py'
+
+    Returns:
+        module: The loaded program (cached after the first call)
+    """
+    if filename not in _loaded_programs:
+        module_name = "bench_" + os.path.splitext(filename)[0].lower().replace(" ", "_")
+        spec = importlib.util.spec_from_file_location(module_name, os.path.join(REPO_ROOT, filename))
+        module = importlib.util.module_from_spec(spec)
+        # Register before executing so process pools can pickle its functions
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        _loaded_programs[filename] = module
+    return _loaded_programs[filename]
+
+
+@contextlib.contextmanager
+def quiet(inputs=()):
+    """
+    Silence console output and feed canned answers to input().
+
+    Args:
+        inputs (iterable): Answers returned by successive input() calls
+    """
+    answers = iter(inputs)
+    original_input = builtins.input
+    builtins.input = lambda prompt="": next(answers)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        builtins.input = original_input
+
+
+def measure(name, function, params=None, operations=1, repeat=3, setup=None):
+    """
+    Time a function and return a result record for the JSON report.
+
+    Args:
+        name (str): Benchmark name, e.g. 'sudoku.solve_sudoku'
+        function (callable): Code to time (called with setup's return value
+            when setup is given, otherwise with no arguments)
+        params (dict): Parameters that identify this run (sizes, corpus, ...)
+        operations (int): Work items per call, used for operations/second
+        repeat (int): Number of timed runs; the fastest one is reported
+        setup (callable): Untimed preparation run before every timed call
+
+    Returns:
+        dict: Result record
+    """
+    timings = []
+    for _ in range(repeat):
+        argument = setup() if setup is not None else None
+        start = time.perf_counter()
+        if setup is not None:
+            function(argument)
+        else:
+            function()
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    record = {
+        'benchmark': name,
+        'params': params or {},
+        'seconds': best,
+        'mean_seconds': sum(timings) / len(timings),
+        'repeat': repeat,
+        'operations': operations,
+        'operations_per_second': operations / best if best else None,
+    }
+    print(f"  {name:<40} {format_params(record['params']):<28} "
+          f"{best * 1000:>10.2f} ms  {record['operations_per_second'] or 0:>14,.0f} ops/s")
+    return record
+
+
+def format_params(params):
+    return " ".join(f"{key}={value}" for key, value in sorted(params.items()))
+
+
+def result_key(record):
+    """Identify a result across runs by its name and parameters."""
+    return record['benchmark'] + " " + format_params(record['params'])
@@ -0,0 +1,233 @@
+"""
+Deterministic fixture generators for the benchmark suite.
+
+Every generator takes a size and a seed so that two runs on different
+machines (or before and after a change) work on exactly the same data.
+"""
+
+import random
+
+
+# Published hard puzzles ('.' or '0' = empty). The plain backtracking solver
+# needs between a fraction of a second and a few seconds for each of them.
+HARD_PUZZLES = [
+    # Arto Inkala's "world's hardest sudoku"
+    "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..",
+    "6.....8.3.4.7.................5.4.7.3..2.....1.6.......2.....5.....8.6......1....",
+    "48.3............71.2.......7.5....6....2..8.............1.76...3.....4......5....",
+]
+
+# A solved grid used to derive generated puzzles by relabeling and removal
+SOLVED_GRID = (
+    "534678912"
+    "672195348"
+    "198342567"
+    "859761423"
+    "426853791"
+    "713924856"
+    "961537284"
+    "287419635"
+    "345286179"
+)
+
+
+def parse_puzzle(text):
+    """Turn an 81-character puzzle string into a 9x9 list of ints."""
+    digits = [0 if char in '.0' else int(char) for char in text if char in '.0123456789']
+    return [digits[row * 9:row * 9 + 9] for row in range(9)]
+
+
+def generate_puzzles(count, clues=30, seed=0):
+    """
+    Generate puzzles from SOLVED_GRID by shuffling digits, rows within
+    bands and columns within stacks, then blanking cells down to `clues`.
+
+    Args:
+        count (int): Number of puzzles
+        clues (int): Number of givens left in each puzzle
+        seed (int): Random seed
+
+    Returns:
+        list: 9x9 grids (lists of lists of int)
+    """
+    rng = random.Random(seed)
+    base = parse_puzzle(SOLVED_GRID)
+    puzzles = []
+
+    for _ in range(count):
+        digits = list(range(1, 10))
+        rng.shuffle(digits)
+        relabel = {old: new for old, new in zip(range(1, 10), digits)}
+
+        rows = [band * 3 + row for band in rng.sample(range(3), 3)
+                for row in rng.sample(range(3), 3)]
+        cols = [stack * 3 + col for stack in rng.sample(range(3), 3)
+                for col in rng.sample(range(3), 3)]
+        grid = [[relabel[base[row][col]] for col in cols] for row in rows]
+
+        for cell in rng.sample(range(81), 81 - clues):
+            grid[cell // 9][cell % 9] = 0
+        puzzles.append(grid)
+
+    return puzzles
+
+
+def transform_puzzle(grid, rng):
+    """
+    Return an equivalent puzzle: digits relabeled, rows shuffled within
+    bands, bands shuffled, the same for columns and stacks, and the grid
+    transposed half of the time.
+    """
+    digits = list(range(1, 10))
+    rng.shuffle(digits)
+    relabel = {0: 0, **{old: new for old, new in zip(range(1, 10), digits)}}
+
+    rows = [band * 3 + row for band in rng.sample(range(3), 3)
+            for row in rng.sample(range(3), 3)]
+    cols = [stack * 3 + col for stack in rng.sample(range(3), 3)
+            for col in rng.sample(range(3), 3)]
+    result = [[relabel[grid[row][col]] for col in cols] for row in rows]
+    if rng.random() < 0.5:
+        result = [list(column) for column in zip(*result)]
+    return result
+
+
+def generate_equivalent_puzzles(puzzles, variants, seed=0):
+    """
+    Build a corpus of `variants` random equivalent copies of each puzzle,
+    in shuffled order.
+
+    Args:
+        puzzles (list): Base 9x9 grids
+        variants (int): Copies per base puzzle
+        seed (int): Random seed
+
+    Returns:
+        list: 9x9 grids
+    """
+    rng = random.Random(seed)
+    corpus = [transform_puzzle(grid, rng) for grid in puzzles for _ in range(variants)]
+    rng.shuffle(corpus)
+    return corpus
+
+
+PRODUCT_NAMES = ["Wireless Headphones", "Smart Watch", "Power Bank", "USB-C Hub",
+                 "Gaming Keyboard", "4K Webcam", "Bluetooth Speaker", "Laptop Stand"]
+
+
+def generate_product_html(products, seed=0, missing_rate=0.05, filler_paragraphs=0):
+    """
+    Build a product listing page in the same markup as SAMPLE_HTML.
+
+    Args:
+        products (int): Number of product blocks
+        seed (int): Random seed
+        missing_rate (float): Share of products with an empty price
+        filler_paragraphs (int): Extra markup paragraphs inside each block
+
+    Returns:
+        str: The HTML document
+    """
+    rng = random.Random(seed)
+    filler = "<p>" + "Lorem ipsum dolor sit amet. " * 4 + "</p>\n" if filler_paragraphs else ""
+    parts = ['<!DOCTYPE html>\n<html>\n<body>\n    <div class="product-list">\n']
+
+    for index in range(products):
+        name = f"{rng.choice(PRODUCT_NAMES)} {index}"
+        price = "" if rng.random() < missing_rate else f"${rng.uniform(5, 500):.2f}"
+        rating = f"{rng.uniform(1, 5):.1f}"
+        parts.append(
+            '        <div class="product">\n'
+            f'            <h2 class="product-name">{name}</h2>\n'
+            + filler * filler_paragraphs +
+            f'            <span class="price">{price}</span>\n'
+            f'            <span class="rating">{rating}</span>\n'
+            '        </div>\n'
+        )
+
+    parts.append('    </div>\n</body>\n</html>\n')
+    return "".join(parts)
+
+
+class FixtureSite:
+    """
+    A deterministic web site spread over many hosts, served from memory.
+
+    Page `n` lives on host `shop{n % hosts}.test` and contains a few
+    products plus links to other pages, so a crawl from page 0 reaches
+    every page and keeps finding links it has already seen.
+    """
+
+    def __init__(self, pages, hosts=50, links_per_page=8, products_per_page=3, seed=0):
+        """
+        Args:
+            pages (int): Number of pages on the site
+            hosts (int): Number of hosts the pages are spread over
+            links_per_page (int): Links on each page besides the next page
+            products_per_page (int): Product blocks on each page
+            seed (int): Random seed
+        """
+        self.pages = pages
+        self.hosts = hosts
+        self.links_per_page = links_per_page
+        self.products_per_page = products_per_page
+        self.seed = seed
+        self.fetches = 0
+
+    def url(self, page):
+        """Return the URL of a page."""
+        return f"http://shop{page % self.hosts}.test/page/{page}"
+
+    def fetch(self, url):
+        """Return the HTML of a URL on the site, or None if there is no such page."""
+        self.fetches += 1
+        try:
+            page = int(url.rsplit('/', 1)[1])
+        except ValueError:
+            return None
+        if not 0 <= page < self.pages or url != self.url(page):
+            return None
+
+        rng = random.Random(self.seed * 1_000_003 + page)
+        html = generate_product_html(self.products_per_page, seed=page)
+        targets = [(page + 1) % self.pages]
+        targets += [rng.randrange(self.pages) for _ in range(self.links_per_page)]
+        links = "".join(f'    <a href="{self.url(target)}#top">Page {target}</a>\n'
+                        for target in targets)
+        return html.replace('</body>', links + '</body>')
+
+
+FIRST_NAMES = ["John", "Mary", "Ahmed", "Priya", "Chen", "Sofia", "Liam", "Aisha",
+               "Carlos", "Yuki", "Olga", "Kwame", "Noah", "Emma", "Ravi", "Fatima"]
+LAST_NAMES = ["Smith", "Garcia", "Khan", "Patel", "Wang", "Rossi", "Murphy", "Okafor",
+              "Silva", "Tanaka", "Ivanova", "Mensah", "Brown", "Muller", "Iyer", "Haddad"]
+
+
+def generate_contacts(count, seed=0):
+    """
+    Build a contacts dictionary in the format used by contacts.json.
+
+    Args:
+        count (int): Number of contacts
+        seed (int): Random seed
+
+    Returns:
+        dict: Contact ID (str) to contact dictionary
+    """
+    rng = random.Random(seed)
+    contacts = {}
+    for index in range(1, count + 1):
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        contacts[str(index)] = {
+            "name": f"{first} {last}",
+            "phone": f"{rng.randrange(200, 999)}-{rng.randrange(200, 999)}-{rng.randrange(10000):04d}",
+            "email": f"{first.lower()}.{last.lower()}{index}@example.com",
+        }
+    return contacts
+
+
+def generate_readings(count, seed=0):
+    """Return `count` temperature readings in Celsius as a list of floats."""
+    rng = random.Random(seed)
+    return [rng.uniform(-50.0, 50.0) for _ in range(count)]
@@ -0,0 +1,139 @@
+"""
+Run the benchmark suite and write or compare JSON results.
+
+Usage:
+    python benchmarks/run_benchmarks.py                     # everything
+    python benchmarks/run_benchmarks.py --quick sudoku game  # a subset, small sizes
+    python benchmarks/run_benchmarks.py --output before.json
+    python benchmarks/run_benchmarks.py --compare before.json --threshold 0.10
+
+With --compare, every benchmark that got slower than the baseline by more
+than the threshold is reported and the exit status is 1.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+
+# Allow running as a script from any directory
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bench_contacts
+import bench_game
+import bench_scraping
+import bench_sudoku
+import bench_temperature
+from common import REPO_ROOT, result_key
+
+
+SUITES = {
+    'sudoku': bench_sudoku,
+    'scraping': bench_scraping,
+    'contacts': bench_contacts,
+    'temperature': bench_temperature,
+    'game': bench_game,
+}
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suites(names, quick=False):
+    """
+    Run the selected suites.
+
+    Args:
+        names (list): Keys of SUITES to run
+        quick (bool): Use small fixture sizes
+
+    Returns:
+        dict: Report with 'meta' and 'results'
+    """
+    results = []
+    for name in names:
+        print(f"\n[{name}]")
+        results.extend(SUITES[name].run(quick=quick))
+
+    return {
+        'meta': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quick': quick,
+        },
+        'results': results,
+    }
+
+
+def compare(report, baseline, threshold):
+    """
+    Print the change of every benchmark against a baseline report.
+
+    Returns:
+        list: Keys of the benchmarks that regressed beyond the threshold
+    """
+    previous = {result_key(record): record for record in baseline['results']}
+    regressions = []
+
+    print("\n" + "=" * 80)
+    print("COMPARISON WITH BASELINE".center(80))
+    print("=" * 80)
+    for record in report['results']:
+        key = result_key(record)
+        if key not in previous:
+            print(f"  {key:<60} (new)")
+            continue
+        ratio = record['seconds'] / previous[key]['seconds']
+        marker = ""
+        if ratio > 1 + threshold:
+            marker = "  <-- REGRESSION"
+            regressions.append(key)
+        print(f"  {key:<60} {ratio:>6.2f}x time{marker}")
+    print("=" * 80)
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the programs' hot paths.")
+    parser.add_argument('suites', nargs='*', metavar='SUITE',
+                        help=f"suites to run: {', '.join(SUITES)} (default: all)")
+    parser.add_argument('--quick', action='store_true', help="use small fixtures")
+    parser.add_argument('--output', metavar='FILE', help="write the JSON report to FILE")
+    parser.add_argument('--compare', metavar='FILE', help="compare against a JSON report")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="allowed slowdown before a regression is reported (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.suites if name not in SUITES]
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(unknown)}")
+
+    report = run_suites(args.suites or list(SUITES), quick=args.quick)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)
+        if compare(report, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,38 +1,652 @@
 """
 Temperature Conversion Program
 A beginner-friendly console application that converts temperatures between
-Celsius, Fahrenheit, and Kelvin units.
+Celsius, Fahrenheit, Kelvin, Rankine, Réaumur and Delisle units.
 
 Author: Professional Software Developer
 Date: January 30, 2026
 """
 
-def celsius_to_fahrenheit(celsius):
+import argparse
+import math
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from array import array
+from collections import namedtuple
+from fractions import Fraction
+from functools import lru_cache
+
+# NumPy is optional; without it bulk conversion falls back to array.array
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Every unit is an affine map to Kelvin: kelvin = value * scale + offset.
+# scale and offset are kept as exact fractions so that composing two units
+# into one conversion plan introduces no intermediate rounding.
+TemperatureUnit = namedtuple('TemperatureUnit', ['symbol', 'name', 'scale', 'offset', 'suffix'])
+
+UNITS = {}
+
+
+def register_unit(symbol, name, scale, offset, suffix=None):
+    # Adding a unit only touches the registry; plans are compiled on demand
+    unit = TemperatureUnit(symbol, name, Fraction(scale), Fraction(offset),
+                           suffix if suffix is not None else f"°{symbol}")
+    UNITS[symbol.upper()] = unit
+    _compile_plan.cache_clear()
+    _compile_targets.cache_clear()
+    return unit
+
+
+def get_unit(symbol):
+    try:
+        return UNITS[symbol.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown temperature unit: {symbol}") from None
+
+
+@lru_cache(maxsize=None)
+def _compile_plan(from_symbol, to_symbol):
+    source = get_unit(from_symbol)
+    target = get_unit(to_symbol)
+    # value -> kelvin -> target, composed exactly and rounded to float once
+    scale = source.scale / target.scale
+    offset = (source.offset - target.offset) / target.scale
+    return float(scale), float(offset)
+
+
+def get_conversion_plan(from_unit, to_unit):
+    # Cached (scale, offset) so that to = from * scale + offset
+    return _compile_plan(from_unit.upper(), to_unit.upper())
+
+
+
+def absolute_zero(unit):
+    unit = get_unit(unit)
+    return float(-unit.offset / unit.scale)
+
+
+# Readings within this fraction of absolute zero count as absolute zero
+# itself, so e.g. -459.67°F is not rejected over float rounding
+ABSOLUTE_ZERO_TOLERANCE = 1e-12
 
-    return (celsius * 9/5) + 32
+
+def _absolute_zero_limit(unit):
+    # (limit, backwards): readings past limit are below absolute zero. For
+    # scales that run backwards (Delisle) the limit is an upper bound.
+    limit = absolute_zero(unit)
+    slack = abs(limit) * ABSOLUTE_ZERO_TOLERANCE
+    if get_unit(unit).scale < 0:
+        return limit + slack, True
+    return limit - slack, False
+
+
+def convert_value(temperature, from_unit, to_unit):
+    scale, offset = get_conversion_plan(from_unit, to_unit)
+    return temperature * scale + offset
+
+
+# Result of compute_conversions(): the converted values keyed by unit symbol,
+# or below_absolute_zero/error set (and no conversions) when the input is bad
+ConversionResult = namedtuple('ConversionResult', ['temperature', 'unit', 'conversions',
+                                                   'below_absolute_zero', 'error'])
+
+
+@lru_cache(maxsize=None)
+def _compile_targets(symbol):
+    # The absolute-zero limit and float plans for every other unit, so a
+    # single conversion does no registry lookups or Fraction math
+    source = get_unit(symbol)
+    targets = tuple((target.symbol,) + _compile_plan(source.symbol.upper(), key)
+                    for key, target in UNITS.items() if target is not source)
+    return _absolute_zero_limit(symbol) + (targets,)
+
+
+def compute_conversions(temperature, unit):
+    """
+    Convert a temperature to every other registered unit without printing.
+    
+    Returns a ConversionResult; when the unit is unknown or the temperature
+    is below absolute zero, conversions is empty and error explains why.
+    """
+    try:
+        limit, backwards, targets = _compile_targets(unit.upper())
+    except ValueError as e:
+        return ConversionResult(temperature, unit, {}, False, str(e))
+    
+    source = UNITS[unit.upper()]
+    if temperature > limit if backwards else temperature < limit:
+        error = (f"{temperature}{source.suffix} is below absolute zero "
+                 f"({absolute_zero(unit):g}{source.suffix})")
+        return ConversionResult(temperature, source.symbol, {}, True, error)
+    
+    conversions = {symbol: temperature * scale + offset for symbol, scale, offset in targets}
+    return ConversionResult(temperature, source.symbol, conversions, False, None)
+
+
+register_unit('C', 'Celsius', 1, Fraction('273.15'), '°C')
+register_unit('F', 'Fahrenheit', Fraction(5, 9), Fraction('459.67') * Fraction(5, 9), '°F')
+register_unit('K', 'Kelvin', 1, 0, 'K')
+register_unit('R', 'Rankine', Fraction(5, 9), 0, '°R')
+register_unit('Re', 'Réaumur', Fraction(5, 4), Fraction('273.15'), '°Ré')
+register_unit('De', 'Delisle', Fraction(-2, 3), Fraction('373.15'), '°De')
+
+
+def celsius_to_fahrenheit(celsius):
+    return convert_value(celsius, 'C', 'F')
 
 
 def celsius_to_kelvin(celsius):
-   
-    return celsius + 273.15
+    return convert_value(celsius, 'C', 'K')
 
 
 def fahrenheit_to_celsius(fahrenheit):
-   
-    return (fahrenheit - 32) * 5/9
+    return convert_value(fahrenheit, 'F', 'C')
 
 
 def fahrenheit_to_kelvin(fahrenheit):
-   
-    return (fahrenheit - 32) * 5/9 + 273.15
+    return convert_value(fahrenheit, 'F', 'K')
 
 
 def kelvin_to_celsius(kelvin):
-    return kelvin - 273.15
+    return convert_value(kelvin, 'K', 'C')
 
 
 def kelvin_to_fahrenheit(kelvin):
-    return (kelvin - 273.15) * 9/5 + 32
+    return convert_value(kelvin, 'K', 'F')
+
+
+def _as_double_view(buffer):
+    # Zero-copy 1-D view of a float64 buffer, or None if it holds something
+    # else. Only untyped byte containers (bytes, bytearray, mmap) are read
+    # as raw float64 data, and one whose length is not a whole number of
+    # doubles raises ValueError; typed integer arrays convert element-wise,
+    # and strided views are left to the caller to copy.
+    try:
+        view = memoryview(buffer)
+    except TypeError:
+        return None
+    if not view.c_contiguous:
+        return None
+    if view.format == 'd':
+        return view.cast('B').cast('d') if view.ndim != 1 else view
+    if isinstance(buffer, (bytes, bytearray, mmap.mmap)):
+        if view.nbytes % 8:
+            raise ValueError(f"raw float64 data must be a multiple of 8 bytes long, not {view.nbytes}")
+        return view.cast('B').cast('d')
+    return None
+
+
+def convert(values, from_unit, to_unit, out=None):
+    """
+    Convert many temperatures at once without a Python call per reading.
+    
+    values may be a NumPy array, an array.array, any buffer-protocol object
+    (float64 data, or bytes/bytearray/mmap holding raw float64 data) or a
+    plain sequence; other typed arrays are converted element by element.
+    If out is given (an array or writable buffer of the same length), the
+    results are written into it instead of allocating a new array.
+    
+    Returns the output array: a NumPy float64 array when NumPy is installed,
+    otherwise an array.array('d'), or out itself when it was supplied.
+    Raises ValueError for raw byte data that is not a whole number of
+    float64 values, with or without NumPy.
+    """
+    scale, offset = get_conversion_plan(from_unit, to_unit)
+    
+    if np is not None:
+        # np.asarray / np.frombuffer share memory with the caller's buffers
+        view = None if isinstance(values, np.ndarray) else _as_double_view(values)
+        if view is not None:
+            source = np.frombuffer(view, dtype=np.float64)
+        else:
+            source = np.asarray(values, dtype=np.float64)
+        
+        if out is None:
+            target = np.empty(source.shape, dtype=np.float64)
+        elif isinstance(out, np.ndarray):
+            target = out
+        else:
+            out_view = _as_double_view(out)
+            if out_view is None or len(out_view) != source.size:
+                raise ValueError("out must be a writable float64 buffer of the same length")
+            target = np.frombuffer(out_view, dtype=np.float64)
+        
+        # Fused into two vectorized passes over the data
+        np.multiply(source, scale, out=target)
+        np.add(target, offset, out=target)
+        return out if out is not None else target
+    
+    # Pure-Python fallback: one comprehension over a zero-copy view
+    source = _as_double_view(values)
+    if source is None:
+        source = values
+    result = array('d', [value * scale + offset for value in source])
+    
+    if out is None:
+        return result
+    
+    target = _as_double_view(out)
+    if target is None or len(target) != len(result):
+        raise ValueError("out must be a writable float64 buffer of the same length")
+    target[:] = memoryview(result)
+    return out
+
+
+def _field(line, column, delimiter):
+    # The column of one delimited line, or b'' when the line is too short
+    fields = line.split(delimiter)
+    return fields[column] if -len(fields) <= column < len(fields) else b''
+
+
+def _parse_readings(lines, column, delimiter):
+    # Returns (values, indices of malformed readings). float() is applied
+    # through map(), so no Python bytecode runs per value; only a chunk
+    # holding a malformed field is reparsed one field at a time, with nan
+    # in place of each field that is not a number.
+    if column is None:
+        fields = lines.split()
+    else:
+        rows = [line for line in lines.splitlines() if line.strip()]
+        try:
+            fields = [line.split(delimiter)[column] for line in rows]
+        except IndexError:
+            fields = [_field(line, column, delimiter) for line in rows]
+    
+    try:
+        if np is not None:
+            return np.fromiter(map(float, fields), dtype=np.float64, count=len(fields)), []
+        return array('d', map(float, fields)), []
+    except ValueError:
+        pass
+    
+    parsed = array('d')
+    malformed = []
+    for index, field in enumerate(fields):
+        try:
+            parsed.append(float(field))
+        except ValueError:
+            parsed.append(math.nan)
+            malformed.append(index)
+    if np is not None:
+        parsed = np.frombuffer(parsed, dtype=np.float64).copy()
+    return parsed, malformed
+
+
+def _below_absolute_zero_mask(values, unit):
+    # Vectorized form of compute_conversions' absolute-zero check
+    limit, backwards = _absolute_zero_limit(unit)
+    if np is not None:
+        return values > limit if backwards else values < limit
+    if backwards:
+        return [value > limit for value in values]
+    return [value < limit for value in values]
+
+
+def iter_file_chunks(path, chunk_size=1 << 20, start=0, stop=None):
+    # Yield newline-aligned chunks of a file (or of the byte range
+    # start..stop, which must itself be line-aligned) through mmap
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            size = len(mapped) if stop is None else min(stop, len(mapped))
+            while start < size:
+                end = min(start + chunk_size, size)
+                if end < size:
+                    # Extend the chunk to the end of its last complete line
+                    newline = mapped.find(b'\n', end)
+                    end = size if newline == -1 else newline + 1
+                yield mapped[start:end]
+                start = end
+
+
+def _convert_chunks(chunks, output, from_unit, to_unit, column, delimiter,
+                    invalid, precision):
+    # Parse, validate, convert and write each chunk; returns the counts
+    number_format = f"{{:.{precision}f}}".format
+    converted = 0
+    rejected = 0
+    
+    for chunk in chunks:
+        values, malformed = _parse_readings(chunk, column, delimiter)
+        if malformed and invalid == 'error':
+            raise ValueError(f"{len(malformed)} malformed reading(s)")
+        mask = _below_absolute_zero_mask(values, from_unit)
+        for index in malformed:
+            mask[index] = True
+        
+        bad = int(mask.sum()) if np is not None else sum(mask)
+        if bad:
+            if invalid == 'error':
+                raise ValueError(f"{bad} reading(s) below absolute zero")
+            if invalid == 'skip':
+                if np is not None:
+                    values = values[~mask]
+                else:
+                    values = array('d', [v for v, below in zip(values, mask) if not below])
+        
+        results = convert(values, from_unit, to_unit)
+        text = list(map(number_format, results))
+        if bad and invalid == 'nan':
+            for index, below in enumerate(mask):
+                if below:
+                    text[index] = 'nan'
+        
+        if text:
+            output.write(('\n'.join(text) + '\n').encode())
+        converted += len(text) - (bad if invalid == 'nan' else 0)
+        rejected += bad
+    
+    return converted, rejected
+
+
+def _data_start(path, header):
+    # Offset of the first reading: past the first line when it is a header
+    if not header:
+        return 0
+    with open(path, 'rb') as file:
+        file.readline()
+        return file.tell()
+
+
+def convert_file(input_path, output_path, from_unit, to_unit, column=None,
+                 delimiter=b',', invalid='skip', precision=2,
+                 chunk_size=1 << 20, workers=1, header=False):
+    """
+    Convert a large file of readings in bounded memory.
+    
+    The input is read through mmap in newline-aligned chunks. Each chunk is
+    parsed in one batch, checked against absolute zero with a vectorized
+    mask, converted with convert() and written out before the next chunk is
+    read. Readings are either one number per line/whitespace-separated
+    (column=None) or the given 0-based column of delimited lines. With
+    header=True the first line of the file is skipped.
+    
+    invalid controls readings that are below absolute zero or are not
+    numbers (including rows too short to have the column): 'skip' drops
+    them, 'nan' writes nan in their place and 'error' raises ValueError.
+    output_path may be '-' to stream to standard output.
+    With workers > 1 the file is converted by convert_file_parallel().
+    
+    Returns a dict with the number of readings converted and invalid.
+    """
+    if invalid not in ('skip', 'nan', 'error'):
+        raise ValueError("invalid must be 'skip', 'nan' or 'error'")
+    if isinstance(delimiter, str):
+        delimiter = delimiter.encode()
+    
+    if workers > 1:
+        return convert_file_parallel(input_path, output_path, from_unit, to_unit,
+                                     workers=workers, column=column,
+                                     delimiter=delimiter, invalid=invalid,
+                                     precision=precision, chunk_size=chunk_size,
+                                     header=header)
+    
+    start = _data_start(input_path, header)
+    output = sys.stdout.buffer if output_path == '-' else open(output_path, 'wb')
+    try:
+        converted, rejected = _convert_chunks(
+            iter_file_chunks(input_path, chunk_size, start), output, from_unit, to_unit,
+            column, delimiter, invalid, precision)
+    finally:
+        if output_path == '-':
+            output.flush()
+        else:
+            output.close()
+    
+    return {'converted': converted, 'invalid': rejected}
+
+
+def split_file_into_shards(path, shards, start=0):
+    # Byte ranges of roughly equal size, each ending on a line boundary,
+    # covering the file from the line-aligned offset start
+    size = os.path.getsize(path)
+    if size <= start:
+        return []
+    
+    boundaries = [start]
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for shard in range(1, shards):
+                offset = start + (size - start) * shard // shards
+                newline = mapped.find(b'\n', max(boundaries[-1], offset))
+                if newline == -1:
+                    break
+                boundaries.append(newline + 1)
+    boundaries.append(size)
+    
+    return [(start, stop) for start, stop in zip(boundaries, boundaries[1:]) if start < stop]
+
+
+def _convert_file_shard(input_path, part_path, start, stop, from_unit, to_unit,
+                        column, delimiter, invalid, precision, chunk_size):
+    # Worker: mmap the shard's byte range and write its own part file
+    with open(part_path, 'wb') as output:
+        return _convert_chunks(
+            iter_file_chunks(input_path, chunk_size, start, stop), output,
+            from_unit, to_unit, column, delimiter, invalid, precision)
+
+
+def convert_file_parallel(input_path, output_path, from_unit, to_unit, workers=None,
+                          column=None, delimiter=b',', invalid='skip', precision=2,
+                          chunk_size=1 << 20, header=False):
+    """
+    Convert a file of readings on several cores.
+    
+    The input is split into line-aligned byte ranges. Each worker process
+    maps the same file with mmap (nothing is pickled except the range) and
+    writes its results to a part file, and the parts are concatenated in
+    order into output_path. Takes the same options as convert_file().
+    """
+    if isinstance(delimiter, str):
+        delimiter = delimiter.encode()
+    workers = workers or os.cpu_count() or 1
+    shards = split_file_into_shards(input_path, workers, _data_start(input_path, header))
+    
+    # Parts go to a private directory next to the output, so concurrent
+    # runs on the same input never share part files
+    part_dir = tempfile.mkdtemp(
+        prefix=f".{os.path.basename(input_path)}.parts-",
+        dir=os.path.dirname(os.path.abspath(output_path if output_path != '-' else input_path)))
+    part_paths = [os.path.join(part_dir, f"part{index}") for index in range(len(shards))]
+    
+    converted = 0
+    rejected = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_convert_file_shard, input_path, part_path, start, stop,
+                                   from_unit, to_unit, column, delimiter, invalid,
+                                   precision, chunk_size)
+                       for part_path, (start, stop) in zip(part_paths, shards)]
+            for future in futures:
+                shard_converted, shard_rejected = future.result()
+                converted += shard_converted
+                rejected += shard_rejected
+        
+        # Reassemble the shards in their original order
+        output = sys.stdout.buffer if output_path == '-' else open(output_path, 'wb')
+        try:
+            for part_path in part_paths:
+                with open(part_path, 'rb') as part:
+                    shutil.copyfileobj(part, output, 1 << 20)
+        finally:
+            if output_path == '-':
+                output.flush()
+            else:
+                output.close()
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
+    
+    return {'converted': converted, 'invalid': rejected}
+
+
+def _convert_array_shard(input_name, output_name, length, start, stop, from_unit, to_unit):
+    # Worker: attach to the shared blocks and convert one slice in place
+    source_block = shared_memory.SharedMemory(name=input_name)
+    target_block = shared_memory.SharedMemory(name=output_name)
+    # Views must be released before the blocks can be closed, even when
+    # convert() fails, or close() raises BufferError over the real error
+    error = None
+    try:
+        # A block can be larger than requested (rounded up to whole pages);
+        # only its first `length` doubles hold readings
+        size = 8 * length
+        with source_block.buf[:size] as source_bytes, target_block.buf[:size] as target_bytes:
+            with source_bytes.cast('d') as source, target_bytes.cast('d') as target:
+                with source[start:stop] as source_slice, target[start:stop] as target_slice:
+                    try:
+                        convert(source_slice, from_unit, to_unit, out=target_slice)
+                    except Exception as e:
+                        # The traceback keeps convert()'s arrays over the
+                        # views alive; drop it so they can be released
+                        error = e.with_traceback(None)
+    finally:
+        source_block.close()
+        target_block.close()
+    if error is not None:
+        raise error
+
+
+def convert_parallel(values, from_unit, to_unit, workers=None, out=None):
+    """
+    Convert a large array on several cores through shared memory.
+    
+    The readings are copied once into a shared-memory block; each worker
+    process converts its own slice straight into a second shared block, so
+    no readings are pickled between processes. The result is returned as
+    an array.array('d') (or a NumPy array when NumPy is installed), or
+    copied into out when it is given.
+    """
+    workers = workers or os.cpu_count() or 1
+    source = _as_double_view(values)
+    if source is None:
+        source = memoryview(array('d', values))
+    length = len(source)
+    if length == 0 or workers == 1:
+        return convert(source, from_unit, to_unit, out=out)
+    
+    size = length * 8
+    input_block = shared_memory.SharedMemory(create=True, size=size)
+    output_block = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        input_block.buf[:size] = source.cast('B')
+        
+        bounds = [length * shard // workers for shard in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_convert_array_shard, input_block.name, output_block.name,
+                                   length, start, stop, from_unit, to_unit)
+                       for start, stop in zip(bounds, bounds[1:]) if start < stop]
+            for future in futures:
+                future.result()
+        
+        if out is not None:
+            memoryview(out).cast('B')[:size] = output_block.buf[:size]
+            return out
+        result = array('d')
+        result.frombytes(output_block.buf[:size])
+        if np is not None:
+            return np.frombuffer(result, dtype=np.float64)
+        return result
+    finally:
+        input_block.close()
+        input_block.unlink()
+        output_block.close()
+        output_block.unlink()
+
+
+def benchmark_single_conversion(count=200_000):
+    # Per-call cost of the pure library path versus the printing presenter
+    temperatures = [float(i % 200 - 50) for i in range(count)]
+    
+    start = time.perf_counter()
+    for temperature in temperatures:
+        compute_conversions(temperature, 'C')
+    pure_time = time.perf_counter() - start
+    
+    devnull = open(os.devnull, 'w')
+    stdout = sys.stdout
+    sys.stdout = devnull
+    try:
+        start = time.perf_counter()
+        for temperature in temperatures[:count // 10]:
+            convert_temperature(temperature, 'C')
+        print_time = (time.perf_counter() - start) * 10
+    finally:
+        sys.stdout = stdout
+        devnull.close()
+    
+    print("\n" + "="*50)
+    print("      SINGLE CONVERSION BENCHMARK")
+    print("="*50)
+    print(f"compute_conversions():  {pure_time / count * 1e6:.2f} µs per call")
+    print(f"convert_temperature():  {print_time / count * 1e6:.2f} µs per call (printing)")
+    print("="*50 + "\n")
+    
+    return {'pure': pure_time / count, 'print': print_time / count}
+
+
+def benchmark_parallel(count=4_000_000, max_workers=None):
+    # Scaling of convert_parallel from 1 to max_workers processes
+    max_workers = max_workers or os.cpu_count() or 1
+    readings = array('d', (float(i % 200 - 50) for i in range(count)))
+    
+    print("\n" + "="*50)
+    print("      PARALLEL CONVERSION BENCHMARK")
+    print("="*50)
+    print(f"Readings:            {count:,}")
+    
+    results = {}
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        convert_parallel(readings, 'C', 'F', workers=workers)
+        results[workers] = time.perf_counter() - start
+        speedup = results[1] / results[workers]
+        print(f"{workers:>2} worker(s):        {results[workers] * 1000:.1f} ms  ({speedup:.1f}x)")
+    
+    print("="*50 + "\n")
+    return results
+
+
+def benchmark_convert(count=1_000_000, repeat=3):
+    # Compare the bulk path against a loop over the scalar functions
+    readings = array('d', (float(i % 200 - 50) for i in range(count)))
+    out = array('d', bytes(8 * count))
+    
+    def best_time(function):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+    
+    scalar_time = best_time(lambda: [celsius_to_fahrenheit(t) for t in readings])
+    bulk_time = best_time(lambda: convert(readings, 'C', 'F'))
+    bulk_out_time = best_time(lambda: convert(readings, 'C', 'F', out=out))
+    
+    backend = "NumPy" if np is not None else "array.array (NumPy not installed)"
+    print("\n" + "="*50)
+    print("      BULK CONVERSION BENCHMARK")
+    print("="*50)
+    print(f"Readings:            {count:,}")
+    print(f"Backend:             {backend}")
+    print(f"Scalar loop:         {scalar_time * 1000:.1f} ms")
+    print(f"Bulk convert():      {bulk_time * 1000:.1f} ms  ({scalar_time / bulk_time:.1f}x)")
+    print(f"Bulk with out=:      {bulk_out_time * 1000:.1f} ms  ({scalar_time / bulk_out_time:.1f}x)")
+    print("="*50 + "\n")
+    
+    return {'scalar': scalar_time, 'bulk': bulk_time, 'bulk_out': bulk_out_time}
 
 
 def get_temperature_input():
@@ -47,79 +661,65 @@ def get_temperature_input():
 
 
 def get_unit_input():
+    units = list(UNITS.values())
+    
     while True:
         # Display unit selection menu
         print("\nSelect the temperature unit:")
-        print("1. Celsius (C)")
-        print("2. Fahrenheit (F)")
-        print("3. Kelvin (K)")
+        for number, unit in enumerate(units, 1):
+            print(f"{number}. {unit.name} ({unit.symbol})")
         
         # Get user choice
-        choice = input("Enter your choice (1/2/3 or C/F/K): ").strip().upper()
+        symbols = "/".join(unit.symbol for unit in units)
+        choice = input(f"Enter your choice (1-{len(units)} or {symbols}): ").strip().upper()
         
-        # Map numeric choices to unit letters
-        unit_map = {'1': 'C', '2': 'F', '3': 'K'}
+        # Map numeric choices to unit symbols
+        unit_map = {str(number): unit.symbol for number, unit in enumerate(units, 1)}
         
         # Validate and return the unit
         if choice in unit_map:
             return unit_map[choice]
-        elif choice in ['C', 'F', 'K']:
-            return choice
+        elif choice in UNITS:
+            return UNITS[choice].symbol
         else:
-            print("❌ Invalid choice! Please select 1, 2, 3, or C, F, K.\n")
+            print(f"❌ Invalid choice! Please select 1-{len(units)} or {symbols}.\n")
 
 
 def validate_temperature(temperature, unit):
-    if unit == 'C' and temperature < -273.15:
-        print(f"⚠️  Warning: {temperature}°C is below absolute zero (-273.15°C)!")
-        return False
-    elif unit == 'F' and temperature < -459.67:
-        print(f"⚠️  Warning: {temperature}°F is below absolute zero (-459.67°F)!")
-        return False
-    elif unit == 'K' and temperature < 0:
-        print(f"⚠️  Warning: {temperature}K is below absolute zero (0K)!")
+    result = compute_conversions(temperature, unit)
+    if result.error:
+        print(f"⚠️  Warning: {result.error}!")
         return False
     
     return True
 
 
 def convert_temperature(temperature, unit):
-    if not validate_temperature(temperature, unit):
-        print("Please enter a valid temperature above absolute zero.\n")
-        return
+    # Thin presenter: all of the work happens in compute_conversions()
+    result = compute_conversions(temperature, unit)
+    
+    if result.error:
+        print(f"⚠️  Warning: {result.error}!")
+        if result.below_absolute_zero:
+            print("Please enter a valid temperature above absolute zero.\n")
+        return result
+    
+    source = get_unit(unit)
     
     print("\n" + "="*50)
     print("           CONVERSION RESULTS")
     print("="*50)
     
-    if unit == 'C':
-        # Convert from Celsius to Fahrenheit and Kelvin
-        fahrenheit = celsius_to_fahrenheit(temperature)
-        kelvin = celsius_to_kelvin(temperature)
-        
-        print(f"Original Temperature:  {temperature:.2f}°C")
-        print(f"Converted to Fahrenheit: {fahrenheit:.2f}°F")
-        print(f"Converted to Kelvin:     {kelvin:.2f}K")
-    
-    elif unit == 'F':
-        # Convert from Fahrenheit to Celsius and Kelvin
-        celsius = fahrenheit_to_celsius(temperature)
-        kelvin = fahrenheit_to_kelvin(temperature)
-        
-        print(f"Original Temperature:  {temperature:.2f}°F")
-        print(f"Converted to Celsius:    {celsius:.2f}°C")
-        print(f"Converted to Kelvin:     {kelvin:.2f}K")
-    
-    elif unit == 'K':
-        # Convert from Kelvin to Celsius and Fahrenheit
-        celsius = kelvin_to_celsius(temperature)
-        fahrenheit = kelvin_to_fahrenheit(temperature)
-        
-        print(f"Original Temperature:  {temperature:.2f}K")
-        print(f"Converted to Celsius:    {celsius:.2f}°C")
-        print(f"Converted to Fahrenheit: {fahrenheit:.2f}°F")
+    print(f"Original Temperature:  {temperature:.2f}{source.suffix}")
+    
+    for symbol, converted in result.conversions.items():
+        target = UNITS[symbol.upper()]
+        label = f"Converted to {target.name}:"
+        print(f"{label:<25}{converted:.2f}{target.suffix}")
     
     print("="*50 + "\n")
+    
+    return result
 
 
 def main():
@@ -127,7 +727,7 @@ def main():
     print("\n" + "="*50)
     print("   TEMPERATURE CONVERSION PROGRAM")
     print("="*50)
-    print("Convert between Celsius, Fahrenheit, and Kelvin\n")
+    print("Convert between Celsius, Fahrenheit, Kelvin, Rankine, Réaumur and Delisle\n")
     
     # Main program loop
     while True:
@@ -153,6 +753,55 @@ def main():
             print("\n")  # Add spacing for next conversion
 
 
+def parse_command_line(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Convert temperatures interactively or in bulk.")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="benchmark bulk conversion against the scalar functions")
+    parser.add_argument('--convert-file', nargs=2, metavar=('INPUT', 'OUTPUT'),
+                        help="convert a file of readings (OUTPUT may be '-')")
+    parser.add_argument('--from', dest='from_unit', default='C', type=str.upper,
+                        choices=sorted(UNITS),
+                        help="unit of the input readings (default: C)")
+    parser.add_argument('--to', dest='to_unit', default='F', type=str.upper,
+                        choices=sorted(UNITS),
+                        help="unit to convert to (default: F)")
+    parser.add_argument('--column', type=int, default=None,
+                        help="0-based column to read from delimited input")
+    parser.add_argument('--delimiter', default=',',
+                        help="column delimiter for --column (default: ',')")
+    parser.add_argument('--skip-header', action='store_true',
+                        help="ignore the first line of the input (a CSV header)")
+    parser.add_argument('--invalid', choices=['skip', 'nan', 'error'], default='skip',
+                        help="what to do with readings that are below absolute zero "
+                             "or not numbers")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="number of processes for --convert-file")
+    parser.add_argument('--benchmark-parallel', action='store_true',
+                        help="benchmark sharded conversion from 1 to N cores")
+    return parser.parse_args(argv)
+
+
 # Entry point of the program
 if __name__ == "__main__":
-    main()
+    args = parse_command_line()
+    
+    if args.benchmark:
+        benchmark_convert()
+        benchmark_single_conversion()
+    elif args.benchmark_parallel:
+        benchmark_parallel()
+    elif args.convert_file:
+        input_path, output_path = args.convert_file
+        try:
+            summary = convert_file(input_path, output_path, args.from_unit, args.to_unit,
+                                   column=args.column, delimiter=args.delimiter,
+                                   invalid=args.invalid, workers=args.workers,
+                                   header=args.skip_header)
+        except ValueError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"✅ Converted {summary['converted']:,} reading(s), "
+              f"{summary['invalid']:,} invalid.", file=sys.stderr)
+    else:
+        main()